@@ -0,0 +1,63 @@
+"""Mesure du débit de l'évaluation du gain d'information au fil de parties simulées.
+
+Usage : python -m benchmarks.information_gain [--games 3] [--samples 500 2000] [--no-touch] [--seed 0]
+"""
+
+import argparse
+import random
+import time
+
+from src.ai.information import enumerate_layouts, expected_information_gain
+from src.controllers.game_controller import GameController
+from src.utils.config import GAME_CONFIG
+
+
+def play(samples: int, games: int, no_touch: bool, seed: int):
+    """Évalue toutes les cases inconnues à chaque tour de l'ordinateur.
+
+    Returns:
+        tuple: (durées par tour en secondes, dispositions traitées, cases évaluées,
+        tours résolus par énumération exacte).
+    """
+    durations = []
+    layouts = cells = exact = 0
+    for game_index in range(games):
+        random.seed(seed + game_index)
+        game = GameController("normal", no_touch=no_touch)
+        game.place_player_ships_randomly()
+        rng = random.Random(seed + game_index)
+        while not game.player.has_lost():
+            knowledge = game.knowledge
+            start = time.perf_counter()
+            enumerated = enumerate_layouts(knowledge, 5000)
+            gains = expected_information_gain(knowledge, samples=samples, rng=rng, layouts=enumerated)
+            durations.append(time.perf_counter() - start)
+            layouts += samples if enumerated is None else len(enumerated)
+            cells += len(gains)
+            exact += enumerated is not None
+            game.handle_computer_shot()
+    return durations, layouts, cells, exact
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=3)
+    parser.add_argument('--samples', type=int, nargs='+', default=[500, 2000])
+    parser.add_argument('--no-touch', action='store_true')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    budget = GAME_CONFIG["DELAYS"]["computer_turn"]
+    print(f"Délai du tour de l'ordinateur : {budget} ms")
+    print(f"{'Tirages':<9}{'tours':>7}{'exacts':>8}{'disp./s':>10}{'cases/s':>10}"
+          f"{'moyen ms':>10}{'max ms':>9}{'> délai':>9}")
+    for samples in args.samples:
+        durations, layouts, cells, exact = play(samples, args.games, args.no_touch, args.seed)
+        elapsed = sum(durations)
+        late = sum(1 for duration in durations if duration * 1000 > budget)
+        print(f"{samples:<9}{len(durations):>7}{exact:>8}{layouts / elapsed:>10.0f}{cells / elapsed:>10.0f}"
+              f"{1000 * elapsed / len(durations):>10.1f}{1000 * max(durations):>9.1f}{late:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Mesure de l'empreinte mémoire d'une partie en cours.
+
+Usage : python -m benchmarks.memory_per_game [--games N] [--difficulty hard]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+
+from src.controllers.game_controller import GameController
+from src.models import Board, Player, Ship
+
+
+def new_game(difficulty: str) -> GameController:
+    """Crée une partie prête à jouer, avec quelques tirs déjà échangés."""
+    game = GameController(difficulty=difficulty)
+    game.initialize_game()
+    game.place_player_ships_randomly()
+    for _ in range(20):
+        game.handle_computer_shot()
+        x = random.randrange(game.computer.board.size)
+        y = random.randrange(game.computer.board.size)
+        game.handle_player_shot(x, y)
+    return game
+
+
+def measure(factory, count: int) -> float:
+    """Retourne le nombre moyen d'octets alloués par objet créé par `factory`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=2000)
+    parser.add_argument('--difficulty', default='normal')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    new_game(args.difficulty)  # Tables partagées (Zobrist) créées hors mesure
+
+    rows = [
+        ("Ship", lambda: Ship("Croiseur", 4), args.games * 10),
+        ("Board (vide)", Board, args.games),
+        ("Player (vide)", lambda: Player("Joueur"), args.games),
+        ("Partie en cours", lambda: new_game(args.difficulty), args.games),
+    ]
+    print(f"{'Objet':<20}{'octets/objet':>14}")
+    for label, factory, count in rows:
+        print(f"{label:<20}{measure(factory, count):>14.0f}")
+
+    per_game = measure(lambda: new_game(args.difficulty), args.games)
+    print(f"\n{100_000:,} parties résidentes ≈ {per_game * 100_000 / 2 ** 20:,.0f} Mio")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Mesure du temps de choix d'une case non visée, du premier au dernier tir.
+
+Usage : python -m benchmarks.shot_sampling [--sizes 10 30 100] [--seed 0]
+"""
+
+import argparse
+import random
+import time
+
+from src.models import ShotLedger
+
+
+def rejection_pick(ledger: ShotLedger, rng: random.Random) -> int:
+    """Ancien tirage : coordonnées au hasard jusqu'à tomber sur une case libre."""
+    size = ledger.size
+    while True:
+        x = rng.randint(0, size - 1)
+        y = rng.randint(0, size - 1)
+        if (x, y) not in ledger:
+            return y * size + x
+
+
+def index_pick(ledger: ShotLedger, rng: random.Random) -> int:
+    """Tirage dans l'ensemble des cases non visées du registre."""
+    return ledger.unshot.sample(rng)
+
+
+def play(size: int, pick, seed: int):
+    """Vise toutes les cases d'un plateau et retourne la durée de chaque choix (ns)."""
+    rng = random.Random(seed)
+    ledger = ShotLedger(size)
+    ledger.unshot  # Index construit une fois, hors mesure
+    durations = []
+    for _ in range(size * size):
+        start = time.perf_counter_ns()
+        cell = pick(ledger, rng)
+        durations.append(time.perf_counter_ns() - start)
+        ledger.add_index(cell)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 30, 100])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Taille':<8}{'Tirage':<10}{'début µs':>10}{'milieu µs':>11}{'fin µs':>10}{'dernier µs':>12}")
+    for size in args.sizes:
+        for label, pick in (("rejet", rejection_pick), ("index", index_pick)):
+            durations = play(size, pick, args.seed)
+            tenth = max(1, len(durations) // 10)
+            middle = len(durations) // 2
+
+            def mean_us(part):
+                return sum(part) / len(part) / 1000
+
+            print(f"{size:<8}{label:<10}"
+                  f"{mean_us(durations[:tenth]):>10.2f}"
+                  f"{mean_us(durations[middle - tenth // 2:middle + tenth // 2 + 1]):>11.2f}"
+                  f"{mean_us(durations[-tenth:]):>10.2f}"
+                  f"{durations[-1] / 1000:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
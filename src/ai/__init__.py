@@ -0,0 +1,15 @@
+from .zobrist import ZobristTable, DecisionCache, SHARED_DECISION_CACHE
+from .knowledge import OpponentKnowledge
+from .heatmap import compute_heat_map, choose_best_cell, choose_best_cells
+from .layouts import LayoutCount, count_layouts
+from .information import enumerate_layouts, expected_information_gain, sample_layouts
+from .strategy import (BUILTIN_DIFFICULTIES, TargetingParams, load_difficulties,
+                       save_difficulty)
+
+__all__ = [
+    'ZobristTable', 'DecisionCache', 'SHARED_DECISION_CACHE',
+    'OpponentKnowledge', 'compute_heat_map', 'choose_best_cell', 'choose_best_cells',
+    'LayoutCount', 'count_layouts',
+    'enumerate_layouts', 'expected_information_gain', 'sample_layouts',
+    'BUILTIN_DIFFICULTIES', 'TargetingParams', 'load_difficulties', 'save_difficulty'
+]
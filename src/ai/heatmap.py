@@ -0,0 +1,104 @@
+"""Carte de chaleur des positions probables des navires adverses."""
+
+from typing import List, Optional, Sequence, Tuple
+import random
+
+from ..utils.constants import CELL_STATES
+
+# Poids d'un placement par case touchée non coulée qu'il recouvre
+TARGET_WEIGHT = 20
+
+
+def compute_heat_map(cells: Sequence[int], size: int, remaining: Sequence[int]) -> Tuple[int, ...]:
+    """Compte les placements possibles des navires restants sur chaque case.
+
+    Un placement est exclu s'il recouvre un tir manqué ou un navire coulé. Les
+    placements qui recouvrent des touches non résolues sont fortement pondérés,
+    ce qui concentre les tirs autour d'un navire déjà touché.
+
+    Args:
+        cells (Sequence[int]): États connus des cases (codes CELL_STATES, à plat).
+        size (int): Taille du plateau.
+        remaining (Sequence[int]): Tailles des navires encore à flot.
+
+    Returns:
+        Tuple[int, ...]: Score de chaque case, indexé par y * size + x.
+    """
+    heat = [0] * (size * size)
+    hit = CELL_STATES['HIT']
+    blocked = (CELL_STATES['MISS'], CELL_STATES['SUNK'])
+
+    for length in set(remaining):
+        multiplicity = remaining.count(length)
+        for step, span in ((1, size - length + 1), (size, size)):
+            rows = size if step == 1 else size - length + 1
+            for y in range(rows):
+                for x in range(span):
+                    start = y * size + x
+                    placement = range(start, start + length * step, step)
+                    hits = 0
+                    for index in placement:
+                        state = cells[index]
+                        if state in blocked:
+                            break
+                        if state == hit:
+                            hits += 1
+                    else:
+                        weight = multiplicity * (TARGET_WEIGHT ** hits)
+                        for index in placement:
+                            heat[index] += weight
+    return tuple(heat)
+
+
+def choose_best_cell(heat: Sequence[int], cells: Sequence[int], size: int,
+                     rng: Optional[random.Random] = None) -> Tuple[int, int]:
+    """Choisit une case inconnue de score maximal (au hasard parmi les ex aequo).
+
+    Args:
+        heat (Sequence[int]): Carte de chaleur.
+        cells (Sequence[int]): États connus des cases.
+        size (int): Taille du plateau.
+        rng (Optional[random.Random]): Générateur pour les ex aequo (par défaut
+            celui du module `random`).
+
+    Returns:
+        Tuple[int, int]: Coordonnées (x, y) du tir.
+    """
+    empty = CELL_STATES['EMPTY']
+    best_score = -1
+    best: List[int] = []
+    for index, state in enumerate(cells):
+        if state != empty:
+            continue
+        score = heat[index]
+        if score > best_score:
+            best_score = score
+            best = [index]
+        elif score == best_score:
+            best.append(index)
+    index = (rng or random).choice(best)
+    return index % size, index // size
+
+
+def choose_best_cells(heat: Sequence[int], cells: Sequence[int], size: int, count: int,
+                      rng: Optional[random.Random] = None) -> List[Tuple[int, int]]:
+    """Choisit les cases inconnues de meilleur score pour une salve.
+
+    Les ex aequo sont départagés au hasard.
+
+    Args:
+        heat (Sequence[int]): Carte de chaleur.
+        cells (Sequence[int]): États connus des cases.
+        size (int): Taille du plateau.
+        count (int): Nombre de cases à choisir.
+        rng (Optional[random.Random]): Générateur pour les ex aequo (par défaut
+            celui du module `random`).
+
+    Returns:
+        List[Tuple[int, int]]: Coordonnées (x, y) des tirs, par score décroissant.
+    """
+    empty = CELL_STATES['EMPTY']
+    candidates = [index for index, state in enumerate(cells) if state == empty]
+    (rng or random).shuffle(candidates)
+    candidates.sort(key=heat.__getitem__, reverse=True)
+    return [(index % size, index // size) for index in candidates[:count]]
@@ -0,0 +1,317 @@
+"""Gain d'information attendu des tirs, estimé sur des dispositions de la flotte adverse."""
+
+from functools import lru_cache
+from math import log2
+from typing import Iterable, List, Optional, Sequence, Tuple
+import random
+
+from ..utils.constants import CELL_STATES
+from .knowledge import OpponentKnowledge
+
+# Une disposition : (cases occupées, cases dont le tir coulerait un navire), en masques de bits
+Layout = Tuple[int, int]
+
+
+@lru_cache(maxsize=None)
+def _placements(size: int, length: int,
+                no_touch: bool) -> Tuple[Tuple[Tuple[int, int], ...], Tuple[Tuple[int, ...], ...]]:
+    """Précalcule les placements d'un navire sous forme de masques de bits.
+
+    Args:
+        size (int): Taille du plateau.
+        length (int): Taille du navire.
+        no_touch (bool): True si les navires ne peuvent pas se toucher.
+
+    Returns:
+        tuple: (placements (emprise, halo), rangs des placements couvrant chaque
+        case). Le halo est l'emprise plus, sans contact autorisé, les cases voisines.
+    """
+    placements = []
+    orientations = ((1, 0),) if length == 1 else ((1, 0), (0, 1))
+    for dx, dy in orientations:
+        for y in range(size - dy * (length - 1)):
+            for x in range(size - dx * (length - 1)):
+                cells = [(x + dx * i, y + dy * i) for i in range(length)]
+                footprint = 0
+                halo = 0
+                for cx, cy in cells:
+                    footprint |= 1 << (cy * size + cx)
+                    if no_touch:
+                        for ny in range(max(cy - 1, 0), min(cy + 2, size)):
+                            for nx in range(max(cx - 1, 0), min(cx + 2, size)):
+                                halo |= 1 << (ny * size + nx)
+                placements.append((footprint, halo or footprint))
+
+    covering = [[] for _ in range(size * size)]
+    for index, (footprint, _) in enumerate(placements):
+        cell = 0
+        while footprint:
+            if footprint & 1:
+                covering[cell].append(index)
+            footprint >>= 1
+            cell += 1
+    return tuple(placements), tuple(tuple(indices) for indices in covering)
+
+
+def _masks(knowledge: OpponentKnowledge) -> Tuple[int, int]:
+    """Retourne (cases interdites, touches à expliquer) de la connaissance."""
+    blocked = 0
+    hits = 0
+    hit = CELL_STATES['HIT']
+    for index, state in enumerate(knowledge.cells):
+        if state == hit:
+            hits |= 1 << index
+        elif state != CELL_STATES['EMPTY']:
+            blocked |= 1 << index
+    return blocked, hits
+
+
+def _sinking(footprints: Iterable[int], hits: int) -> int:
+    """Cases qui couleraient un navire : la seule case non touchée de son emprise."""
+    sinking = 0
+    for footprint in footprints:
+        rest = footprint & ~hits
+        if rest and not rest & (rest - 1):
+            sinking |= rest
+    return sinking
+
+
+def _propose(fleet, hits: int, rng) -> Tuple[int, int, int]:
+    """Construit une disposition candidate et l'inverse de sa probabilité de tirage.
+
+    Tant qu'une touche reste inexpliquée, un couple (navire non posé, placement
+    couvrant la plus petite de ces touches) est tiré uniformément ; les navires
+    restants sont ensuite posés dans l'ordre, chacun uniformément parmi ses
+    placements valides. Une disposition compatible n'est produite que d'une
+    seule façon, d'où une probabilité égale au produit des 1 / (choix possibles).
+
+    Args:
+        fleet (list): Placements (emprise, halo) de chaque navire, déjà privés de
+            ceux qui touchent une case interdite.
+        hits (int): Touches à expliquer.
+        rng: Générateur.
+
+    Returns:
+        tuple: (cases occupées, cases qui couleraient un navire, poids) ; le poids
+        est nul si la construction a échoué.
+    """
+    placed: List[Optional[int]] = [None] * len(fleet)
+    occupied = reserved = 0
+    weight = 1
+    uncovered = hits
+    while uncovered:
+        bit = uncovered & -uncovered
+        choices = [(rank, footprint, halo)
+                   for rank, placements in enumerate(fleet) if placed[rank] is None
+                   for footprint, halo in placements
+                   if footprint & bit and not footprint & reserved and not halo & occupied]
+        if not choices:
+            return 0, 0, 0
+        weight *= len(choices)
+        rank, footprint, halo = choices[rng.randrange(len(choices))]
+        placed[rank] = footprint
+        occupied |= footprint
+        reserved |= halo
+        uncovered &= ~footprint
+
+    for rank, placements in enumerate(fleet):
+        if placed[rank] is not None:
+            continue
+        choices = [(footprint, halo) for footprint, halo in placements
+                   if not footprint & (reserved | hits) and not halo & occupied]
+        if not choices:
+            return 0, 0, 0
+        weight *= len(choices)
+        footprint, halo = choices[rng.randrange(len(choices))]
+        placed[rank] = footprint
+        occupied |= footprint
+        reserved |= halo
+    return occupied, _sinking(placed, hits), weight
+
+
+def sample_layouts(knowledge: OpponentKnowledge, count: int,
+                   rng: Optional[random.Random] = None) -> List[Layout]:
+    """Tire des dispositions des navires restants compatibles avec la connaissance.
+
+    Échantillonnage d'importance : `count` dispositions candidates sont
+    construites en forçant les navires sur les touches (voir `_propose`), puis
+    `count` dispositions sont retirées parmi elles en proportion de l'inverse de
+    leur probabilité de construction. Le résultat suit, à mesure que `count`
+    grandit, la loi uniforme sur les dispositions compatibles, sans le biais
+    d'un simple placement séquentiel.
+
+    Args:
+        knowledge (OpponentKnowledge): Connaissance du plateau adverse.
+        count (int): Nombre de dispositions voulues.
+        rng (Optional[random.Random]): Générateur (par défaut celui du module `random`).
+
+    Returns:
+        List[Layout]: Dispositions tirées (aucune si aucune disposition compatible
+        n'a été trouvée).
+    """
+    rng = rng or random
+    if not knowledge.remaining or count <= 0:
+        return []
+    size, no_touch = knowledge.size, knowledge.no_touch
+    blocked, hits = _masks(knowledge)
+    fleet = [[placement for placement in _placements(size, length, no_touch)[0] if not placement[0] & blocked]
+             for length in knowledge.remaining]
+
+    candidates: List[Layout] = []
+    weights: List[int] = []
+    for _ in range(count):
+        occupied, sinking, weight = _propose(fleet, hits, rng)
+        if weight:
+            candidates.append((occupied, sinking))
+            weights.append(weight)
+    if not candidates:
+        return []
+    return rng.choices(candidates, weights=weights, k=count)
+
+
+def enumerate_layouts(knowledge: OpponentKnowledge, limit: int) -> Optional[List[Layout]]:
+    """Énumère toutes les dispositions compatibles, s'il y en a au plus `limit`.
+
+    Les navires de même taille sont interchangeables : chaque disposition
+    n'apparaît qu'une fois. La recherche est abandonnée au-delà de `limit`
+    dispositions, ou de 50 * `limit` placements essayés, pour que son coût reste
+    borné quand le tirage au hasard est préférable.
+
+    Args:
+        knowledge (OpponentKnowledge): Connaissance du plateau adverse.
+        limit (int): Nombre maximal de dispositions.
+
+    Returns:
+        Optional[List[Layout]]: Les dispositions, ou None si la recherche a été abandonnée.
+    """
+    size, no_touch = knowledge.size, knowledge.no_touch
+    blocked, hits = _masks(knowledge)
+    lengths = sorted(knowledge.remaining, reverse=True)
+    if not lengths:
+        return []
+    # Cases que peuvent encore couvrir les navires à partir de chaque rang
+    capacity = [sum(lengths[rank:]) for rank in range(len(lengths) + 1)]
+    layouts: List[Layout] = []
+    budget = [50 * limit]
+
+    def place(rank: int, first: int, occupied: int, reserved: int, footprints: List[int]) -> bool:
+        uncovered = bin(hits & ~occupied).count('1')
+        if uncovered > capacity[rank]:
+            return True  # Touches impossibles à toutes expliquer : branche sans issue
+        if rank == len(lengths):
+            layouts.append((occupied, _sinking(footprints, hits)))
+            return len(layouts) <= limit
+
+        placements = _placements(size, lengths[rank], no_touch)[0]
+        for index in range(first, len(placements)):
+            budget[0] -= 1
+            if budget[0] < 0:
+                return False
+            footprint, halo = placements[index]
+            if footprint & (blocked | reserved) or halo & occupied:
+                continue
+            footprints.append(footprint)
+            same = rank + 1 < len(lengths) and lengths[rank + 1] == lengths[rank]
+            keep_going = place(rank + 1, index + 1 if same else 0,
+                               occupied | footprint, reserved | halo, footprints)
+            footprints.pop()
+            if not keep_going:
+                return False
+        return True
+
+    return layouts if place(0, 0, 0, 0, []) else None
+
+
+def _accumulate(planes: List[int], mask: int):
+    """Ajoute 1 au compteur de chaque case du masque (compteurs découpés en bits).
+
+    `planes[k]` contient le bit k du compteur de toutes les cases : une addition
+    met à jour toutes les cases à la fois, en propageant la retenue plan par plan.
+    """
+    carry = mask
+    for rank, plane in enumerate(planes):
+        if not carry:
+            return
+        planes[rank] = plane ^ carry
+        carry &= plane
+    if carry:
+        planes.append(carry)
+
+
+def _read_counts(planes: Sequence[int], cells: Sequence[int], length: int) -> List[int]:
+    """Lit la valeur des compteurs des cases demandées."""
+    counts = [0] * len(cells)
+    for rank, plane in enumerate(planes):
+        bits = format(plane, f'0{length}b')[::-1]
+        weight = 1 << rank
+        for position, cell in enumerate(cells):
+            if bits[cell] == '1':
+                counts[position] += weight
+    return counts
+
+
+def _entropy(*probabilities: float) -> float:
+    return -sum(p * log2(p) for p in probabilities if p > 0)
+
+
+def expected_information_gain(knowledge: OpponentKnowledge,
+                              candidates: Optional[Sequence[Tuple[int, int]]] = None,
+                              samples: int = 2000, enumerate_limit: int = 5000,
+                              rng: Optional[random.Random] = None,
+                              layouts: Optional[Sequence[Layout]] = None) -> List[float]:
+    """Estime, pour chaque case candidate, l'information qu'apporterait un tir.
+
+    Le résultat d'un tir (manqué, touché, coulé) est entièrement déterminé par la
+    disposition adverse : la baisse attendue de l'entropie sur les dispositions
+    est donc l'entropie de ce résultat. Ses probabilités sont comptées en une
+    seule passe sur les dispositions, pour toutes les cases à la fois, par des
+    compteurs découpés en plans de bits.
+
+    Les dispositions sont énumérées exactement lorsqu'il en reste au plus
+    `enumerate_limit`, et tirées au hasard sinon.
+
+    Args:
+        knowledge (OpponentKnowledge): Connaissance du plateau adverse.
+        candidates (Optional[Sequence[Tuple[int, int]]]): Cases (x, y) à évaluer
+            (par défaut toutes les cases inconnues).
+        samples (int): Nombre de dispositions tirées.
+        enumerate_limit (int): Nombre maximal de dispositions à énumérer (0 pour
+            toujours tirer au hasard).
+        rng (Optional[random.Random]): Générateur des tirages.
+        layouts (Optional[Sequence[Layout]]): Dispositions déjà calculées, à
+            utiliser telles quelles.
+
+    Returns:
+        List[float]: Gain attendu, en bits, de chaque candidate (dans l'ordre).
+    """
+    size = knowledge.size
+    if candidates is None:
+        empty = CELL_STATES['EMPTY']
+        cells = [index for index, state in enumerate(knowledge.cells) if state == empty]
+    else:
+        cells = [y * size + x for x, y in candidates]
+
+    if layouts is None:
+        layouts = enumerate_layouts(knowledge, enumerate_limit) if enumerate_limit else None
+        if layouts is None:
+            layouts = sample_layouts(knowledge, samples, rng)
+    if not layouts:
+        return [0.0] * len(cells)
+
+    occupied_planes: List[int] = []
+    sinking_planes: List[int] = []
+    for occupied, sinking in layouts:
+        _accumulate(occupied_planes, occupied)
+        if sinking:
+            _accumulate(sinking_planes, sinking)
+
+    total = len(layouts)
+    length = size * size
+    occupied_counts = _read_counts(occupied_planes, cells, length)
+    sinking_counts = _read_counts(sinking_planes, cells, length)
+    gains = []
+    for occupied, sinking in zip(occupied_counts, sinking_counts):
+        hit = (occupied - sinking) / total
+        sunk = sinking / total
+        gains.append(_entropy(1 - hit - sunk, hit, sunk))
+    return gains
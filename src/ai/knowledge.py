@@ -0,0 +1,139 @@
+"""Vue qu'a l'IA du plateau adverse."""
+
+from typing import Iterable, List, Optional, Tuple
+
+from ..models.cell_sampler import CellSampler
+from ..utils.constants import CELL_STATES
+from .zobrist import ZobristTable
+
+
+class OpponentKnowledge:
+    """Connaissance accumulée sur le plateau adverse (tirs et résultats).
+
+    Les cases sont stockées à plat (indice y * size + x) avec les codes de
+    CELL_STATES : 'EMPTY' pour une case inconnue, puis 'HIT', 'MISS' ou 'SUNK'.
+    Le hash Zobrist de cette vue est maintenu de manière incrémentale.
+
+    Avec la règle « navires non contigus », les cases voisines d'un navire coulé
+    sont marquées 'MISS' sans avoir été visées : elles ne peuvent plus rien cacher.
+
+    L'ensemble des cases inconnues (`unknown`), pour les tirs au hasard, n'est
+    construit qu'à la première demande puis tenu à jour à chaque case révélée.
+    """
+
+    __slots__ = ('size', 'no_touch', 'cells', 'remaining', 'table', 'hash', '_unknown')
+
+    def __init__(self, size: int, fleet_sizes: Iterable[int], no_touch: bool = False):
+        """Initialise une vue vierge.
+
+        Args:
+            size (int): Taille du plateau adverse.
+            fleet_sizes (Iterable[int]): Tailles des navires de la flotte adverse.
+            no_touch (bool): True si les navires adverses ne peuvent pas se toucher.
+        """
+        self.size = size
+        self.no_touch = no_touch
+        self.cells = bytearray(size * size)
+        self.remaining: List[int] = sorted(fleet_sizes, reverse=True)
+        self.table = ZobristTable.for_board(size)
+        self.hash = self.table.fleet_hash(self.remaining)
+        self._unknown: Optional[CellSampler] = None
+
+    @classmethod
+    def from_state(cls, size: int, cells: Iterable[int], remaining: Iterable[int],
+                   no_touch: bool = False) -> 'OpponentKnowledge':
+        """Reconstruit une vue à partir de ses cases et de la flotte restante.
+
+        Args:
+            size (int): Taille du plateau adverse.
+            cells (Iterable[int]): États connus des cases (codes CELL_STATES, à plat).
+            remaining (Iterable[int]): Tailles des navires encore à flot.
+            no_touch (bool): True si les navires adverses ne peuvent pas se toucher.
+
+        Returns:
+            OpponentKnowledge: La vue, avec son hash.
+        """
+        knowledge = cls(size, remaining, no_touch)
+        for index, state in enumerate(cells):
+            if state != CELL_STATES['EMPTY']:
+                knowledge._set_cell(index, state)
+        return knowledge
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        """Clé de cache de l'état courant (taille du plateau, hash)."""
+        return self.size, self.hash
+
+    def _set_cell(self, index: int, state: int):
+        """Change l'état connu d'une case en mettant à jour le hash."""
+        previous = self.cells[index]
+        if previous != CELL_STATES['EMPTY']:
+            self.hash ^= self.table.cell_key(index, previous)
+        self.cells[index] = state
+        if state != CELL_STATES['EMPTY']:
+            self.hash ^= self.table.cell_key(index, state)
+        if self._unknown is not None:
+            if state == CELL_STATES['EMPTY']:
+                self._unknown.add(index)
+            else:
+                self._unknown.discard(index)
+
+    @property
+    def unknown(self) -> CellSampler:
+        """Cases inconnues, avec tirage uniforme en O(1)."""
+        if self._unknown is None:
+            empty = CELL_STATES['EMPTY']
+            self._unknown = CellSampler(self.size, (
+                index for index, state in enumerate(self.cells) if state == empty
+            ))
+        return self._unknown
+
+    def record_shot(self, x: int, y: int, hit: bool,
+                    sunk_positions: Optional[Iterable[Tuple[int, int]]] = None):
+        """Enregistre le résultat d'un tir.
+
+        Args:
+            x (int): Coordonnée x du tir.
+            y (int): Coordonnée y du tir.
+            hit (bool): True si le tir a touché.
+            sunk_positions: Positions du navire si ce tir l'a coulé.
+        """
+        self._set_cell(y * self.size + x, CELL_STATES['HIT'] if hit else CELL_STATES['MISS'])
+        if sunk_positions is None:
+            return
+
+        positions = list(sunk_positions)
+        for px, py in positions:
+            self._set_cell(py * self.size + px, CELL_STATES['SUNK'])
+
+        if self.no_touch:
+            for px, py in positions:
+                for ny in range(max(py - 1, 0), min(py + 2, self.size)):
+                    for nx in range(max(px - 1, 0), min(px + 2, self.size)):
+                        if self.cells[ny * self.size + nx] == CELL_STATES['EMPTY']:
+                            self._set_cell(ny * self.size + nx, CELL_STATES['MISS'])
+
+        ship_size = len(positions)
+        if ship_size in self.remaining:
+            # La dernière occurrence de cette taille disparaît du hash de flotte
+            occurrence = self.remaining.count(ship_size) - 1
+            self.hash ^= self.table.fleet_key(ship_size, occurrence)
+            self.remaining.remove(ship_size)
+
+    def is_unknown(self, x: int, y: int) -> bool:
+        """Vérifie si une case n'a pas encore été visée.
+
+        Args:
+            x (int): Coordonnée x.
+            y (int): Coordonnée y.
+
+        Returns:
+            bool: True si la case est inconnue.
+        """
+        return self.cells[y * self.size + x] == CELL_STATES['EMPTY']
+
+    def unknown_count(self) -> int:
+        """Retourne le nombre de cases qui peuvent encore cacher un navire."""
+        if self._unknown is not None:
+            return len(self._unknown)
+        return self.cells.count(CELL_STATES['EMPTY'])
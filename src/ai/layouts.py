@@ -0,0 +1,419 @@
+"""Dénombrement exact des dispositions d'une flotte par programmation dynamique à profil.
+
+Le calcul est lent sur le plateau par défaut : sur un cœur, la flotte de
+GAME_CONFIG["SHIPS"] en 10x10 demande environ 2 min 30 à 3 min (1 min 45 sans
+contact). Il est destiné à la ligne de commande et au cache disque ; ne pas
+l'appeler depuis l'interface ni pendant le réglage de l'IA.
+"""
+
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from math import factorial
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import argparse
+import json
+import logging
+import os
+import time
+
+from ..utils.config import GAME_CONFIG
+
+
+class _Spec:
+    """Problème de pavage parcouru case par case, ligne par ligne.
+
+    Un état est un entier qui regroupe :
+    - le profil : pour chaque colonne, le nombre de cases restant à couvrir sous
+      la ligne courante par un navire déjà commencé (à gauche de la case
+      courante, il décrit la ligne courante, à droite la précédente) ;
+    - le saut : les cases restantes du navire posé à gauche sur la ligne, avec
+      la valeur de profil à leur donner ;
+    - le nombre de navires restant à poser pour chaque taille.
+
+    Un navire est posé depuis son coin supérieur gauche ; le reste de sa forme
+    est imposé par le profil et le saut. Sans contact autorisé, chaque case
+    (x, y) est remplacée par le bloc 2x2 dont elle est le coin supérieur gauche :
+    deux cases sont voisines, diagonales comprises, si et seulement si leurs
+    blocs se chevauchent. Un navire de longueur L devient alors un rectangle
+    (L + 1) x 2 sur une grille de côté size + 1 et la règle se ramène à
+    l'absence de chevauchement.
+    """
+
+    CHUNK = 4  # Colonnes par entrée des tables de profil
+
+    def __init__(self, size: int, fleet: Sequence[int], no_touch: bool):
+        self.size = size
+        grown = 1 if no_touch else 0
+        self.width = self.height = width = size + grown
+
+        tally = Counter(fleet)
+        self.lengths = tuple(sorted(tally, reverse=True))
+        self.counts = tuple(tally[length] for length in self.lengths)
+        # Formes de chaque taille : (largeur, hauteur, cases du navire relatives au coin)
+        self.shapes = []
+        for length in self.lengths:
+            horizontal = (length + grown, 1 + grown, tuple((dx, 0) for dx in range(length)))
+            vertical = (1 + grown, length + grown, tuple((0, dy) for dy in range(length)))
+            self.shapes.append((horizontal,) if length == 1 else (horizontal, vertical))
+        self.areas = tuple(shapes[0][0] * shapes[0][1] for shapes in self.shapes)
+
+        max_digit = max(height - 1 for shapes in self.shapes for _, height, _ in shapes)
+        max_skip = max(shape_width - 1 for shapes in self.shapes for shape_width, _, _ in shapes)
+        self.bits = max(1, max_digit.bit_length())
+        self.digit_mask = (1 << self.bits) - 1
+        self.skip_shift = self.bits * width
+        self.skip_bits = max(1, max_skip.bit_length())
+        self.skip_mask = (1 << self.skip_bits) - 1
+        self.skip_digit_shift = self.skip_shift + self.skip_bits
+        self.count_shift = self.skip_digit_shift + self.bits
+
+        self.count_offsets = []
+        offset = self.count_shift
+        for count in self.counts:
+            self.count_offsets.append(offset)
+            offset += max(1, count.bit_length())
+        self.count_masks = tuple((1 << max(1, count.bit_length())) - 1 for count in self.counts)
+
+        # Tables par tranches de CHUNK colonnes : cases restant dues par le profil
+        # et profil retourné (symétrie gauche-droite)
+        chunk_bits = self.bits * self.CHUNK
+        self.chunks = -(-width // self.CHUNK)
+        self.chunk_mask = (1 << chunk_bits) - 1
+        self.chunk_needed = []
+        self.chunk_mirror = []
+        for value in range(1 << chunk_bits):
+            digits = [(value >> (self.bits * index)) & self.digit_mask for index in range(self.CHUNK)]
+            self.chunk_needed.append(sum(digits))
+            self.chunk_mirror.append(sum(digit << (self.bits * index) for index, digit in enumerate(reversed(digits))))
+        self.mirror_padding = self.bits * (self.chunks * self.CHUNK - width)
+        self.profile_mask = (1 << self.skip_shift) - 1
+
+        # Poses possibles depuis chaque case : (décalage du compteur, masque du
+        # compteur, colonnes devant être libres, ajout à l'état, cases couvertes)
+        self.moves = []
+        for pos in range(width * self.height):
+            row, column = divmod(pos, width)
+            shift = self.bits * column
+            moves = []
+            for kind, shapes in enumerate(self.shapes):
+                offset = self.count_offsets[kind]
+                for shape_width, shape_height, cells in shapes:
+                    if column + shape_width > width or row + shape_height > self.height:
+                        continue
+                    span = ((1 << (self.bits * (shape_width - 1))) - 1) << (shift + self.bits)
+                    delta = ((shape_height - 1) << shift) - (1 << offset)
+                    if shape_width > 1:
+                        delta += ((shape_width - 1) << self.skip_shift) + \
+                                 ((shape_height - 1) << self.skip_digit_shift)
+                    covered = tuple((row + dy) * size + column + dx for dx, dy in cells)
+                    moves.append((offset, self.count_masks[kind], span, delta, covered))
+            self.moves.append(moves)
+
+    def initial_state(self) -> int:
+        return sum(count << offset for count, offset in zip(self.counts, self.count_offsets))
+
+    def needed(self, state: int) -> int:
+        """Cases qu'il reste à couvrir : profil en cours et navires à poser."""
+        total = 0
+        chunk_bits = self.bits * self.CHUNK
+        profile = state & self.profile_mask
+        for index in range(self.chunks):
+            total += self.chunk_needed[(profile >> (chunk_bits * index)) & self.chunk_mask]
+        for offset, mask, area in zip(self.count_offsets, self.count_masks, self.areas):
+            total += ((state >> offset) & mask) * area
+        return total
+
+    def canonical(self, state: int) -> int:
+        """Représentant commun d'un état de début de ligne et de son symétrique gauche-droite."""
+        chunk_bits = self.bits * self.CHUNK
+        profile = state & self.profile_mask
+        mirrored = 0
+        last = self.chunks - 1
+        for index in range(self.chunks):
+            chunk = (profile >> (chunk_bits * index)) & self.chunk_mask
+            mirrored |= self.chunk_mirror[chunk] << (chunk_bits * (last - index))
+        mirrored = (mirrored >> self.mirror_padding) | (state & ~self.profile_mask)
+        return min(state, mirrored)
+
+    def transitions(self, pos: int, state: int) -> List[Tuple[int, Tuple[int, ...]]]:
+        """Énumère les états atteints depuis une case, avec les cases du navire posé."""
+        shift = self.bits * (pos % self.width)
+        skip = (state >> self.skip_shift) & self.skip_mask
+        if skip:
+            # Case couverte par le navire posé à gauche sur cette ligne
+            digit = (state >> self.skip_digit_shift) & self.digit_mask
+            next_state = state - (1 << self.skip_shift) + (digit << shift)
+            if skip == 1:
+                next_state &= ~(self.digit_mask << self.skip_digit_shift)
+            return [(next_state, ())]
+
+        if (state >> shift) & self.digit_mask:
+            # Case couverte par un navire commencé plus haut
+            return [(state - (1 << shift), ())]
+
+        results = []
+        if self.needed(state) < self.width * self.height - pos:
+            results.append((state, ()))  # Case laissée libre
+        for offset, mask, span, delta, covered in self.moves[pos]:
+            if (state >> offset) & mask and not state & span:
+                results.append((state + delta, covered))
+        return results
+
+
+def _pack(values: Iterable[int]):
+    """Stocke une suite d'entiers de manière compacte quand ils tiennent sur 64 bits."""
+    values = list(values)
+    try:
+        return array('Q', values)
+    except OverflowError:
+        return values
+
+
+def _step(spec: _Spec, pos: int, layer: Dict[int, int]) -> Dict[int, int]:
+    """Propage d'une case le nombre de façons d'atteindre chaque état."""
+    boundary = (pos + 1) % spec.width == 0
+    reached: Dict[int, int] = {}
+    for state, ways in layer.items():
+        for next_state, _ in spec.transitions(pos, state):
+            if boundary:
+                next_state = spec.canonical(next_state)
+            reached[next_state] = reached.get(next_state, 0) + ways
+    return reached
+
+
+def _sweep(spec: _Spec, start_row: int, end_row: int, initial: Dict[int, int],
+           final: Dict[int, int]) -> Tuple[Dict[int, int], List[int]]:
+    """Passe avant puis arrière entre deux débuts de ligne.
+
+    La passe avant ne garde que les états des débuts de ligne ; la passe arrière
+    recalcule chaque ligne à partir de là, ce qui borne la mémoire à quelques
+    lignes d'états. Une transition qui pose un navire ajoute, à chacune de ses
+    cases, (façons d'atteindre l'état de départ) x (complétions de l'état d'arrivée).
+
+    Args:
+        spec (_Spec): Problème à résoudre.
+        start_row (int): Ligne de départ.
+        end_row (int): Ligne d'arrivée (exclue).
+        initial (dict): Poids des états au début de start_row.
+        final (dict): Complétions des états au début de end_row.
+
+    Returns:
+        tuple: (complétions des états au début de start_row, occupation de chaque case).
+    """
+    width = spec.width
+    checkpoints = {start_row: (_pack(initial), _pack(initial.values()))}
+    layer = initial
+    for row in range(start_row, end_row - 1):
+        for column in range(width):
+            layer = _step(spec, row * width + column, layer)
+        checkpoints[row + 1] = (_pack(layer), _pack(layer.values()))
+    del layer
+
+    marginals = [0] * (spec.size * spec.size)
+    completions = final
+    for row in range(end_row - 1, start_row - 1, -1):
+        states, weights = checkpoints.pop(row)
+        current = dict(zip(states, weights))
+        row_layers = [(states, weights)]
+        for column in range(width - 1):
+            current = _step(spec, row * width + column, current)
+            row_layers.append((_pack(current), _pack(current.values())))
+        del current
+
+        for column in range(width - 1, -1, -1):
+            pos = row * width + column
+            boundary = column == width - 1
+            states, weights = row_layers.pop()
+            before: Dict[int, int] = {}
+            for state, ways in zip(states, weights):
+                total = 0
+                for next_state, covered in spec.transitions(pos, state):
+                    after = completions.get(spec.canonical(next_state) if boundary else next_state, 0)
+                    if not after:
+                        continue
+                    total += after
+                    if covered:
+                        weight = ways * after
+                        for cell in covered:
+                            marginals[cell] += weight
+                if total:
+                    before[state] = total
+            completions = before
+    return completions, marginals
+
+
+def _sweep_task(args) -> Tuple[Dict[int, int], List[int]]:
+    """Travail d'un processus : fin du plateau à partir d'une part des états du milieu."""
+    size, fleet, no_touch, start_row, initial = args
+    spec = _Spec(size, fleet, no_touch)
+    return _sweep(spec, start_row, spec.height, initial, {0: 1})
+
+
+class LayoutCount:
+    """Nombre exact de dispositions d'une flotte et occupation de chaque case.
+
+    Les navires de même taille sont indiscernables dans `layouts` ;
+    `labelled_layouts` compte les dispositions où ils sont distingués (par
+    exemple « Destroyer 1 » et « Destroyer 2 »). `marginals[y * size + x]` est le
+    nombre de dispositions où la case (x, y) est occupée.
+    """
+
+    __slots__ = ('size', 'fleet', 'no_touch', 'layouts', 'marginals')
+
+    def __init__(self, size: int, fleet: Sequence[int], no_touch: bool, layouts: int, marginals: Sequence[int]):
+        self.size = size
+        self.fleet = tuple(sorted(fleet, reverse=True))
+        self.no_touch = no_touch
+        self.layouts = layouts
+        self.marginals = tuple(marginals)
+
+    @property
+    def labelled_layouts(self) -> int:
+        """Nombre de dispositions en distinguant les navires de même taille."""
+        multiplicity = 1
+        for count in Counter(self.fleet).values():
+            multiplicity *= factorial(count)
+        return self.layouts * multiplicity
+
+    def probabilities(self) -> List[List[float]]:
+        """Probabilité d'occupation de chaque case pour une disposition tirée uniformément.
+
+        Returns:
+            List[List[float]]: Probabilités indexées par [y][x].
+        """
+        size = self.size
+        total = self.layouts or 1
+        return [[self.marginals[y * size + x] / total for x in range(size)] for y in range(size)]
+
+    def to_dict(self) -> Dict:
+        """Forme sérialisable en JSON (les grands entiers restent exacts)."""
+        return {
+            'size': self.size,
+            'fleet': list(self.fleet),
+            'no_touch': self.no_touch,
+            'layouts': self.layouts,
+            'marginals': list(self.marginals)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LayoutCount':
+        """Reconstruit un dénombrement depuis `to_dict`."""
+        return cls(data['size'], data['fleet'], data['no_touch'], data['layouts'], data['marginals'])
+
+
+def fleet_from_config() -> List[int]:
+    """Retourne les tailles des navires de GAME_CONFIG["SHIPS"]."""
+    return [ship["size"] for ship in GAME_CONFIG["SHIPS"] for _ in range(ship["quantity"])]
+
+
+def cache_path(cache_dir: str, size: int, fleet: Iterable[int], no_touch: bool) -> str:
+    """Chemin du fichier de cache d'un dénombrement.
+
+    Args:
+        cache_dir (str): Dossier du cache.
+        size (int): Taille du plateau.
+        fleet (Iterable[int]): Tailles des navires.
+        no_touch (bool): Règle des navires non contigus.
+
+    Returns:
+        str: Chemin du fichier JSON.
+    """
+    rule = "no-touch" if no_touch else "classic"
+    fleet_key = "-".join(str(length) for length in sorted(fleet, reverse=True))
+    return os.path.join(os.path.expanduser(cache_dir), f"layouts_{size}_{rule}_{fleet_key}.json")
+
+
+def count_layouts(size: int, fleet: Optional[Sequence[int]] = None, no_touch: bool = False,
+                  workers: int = 1, cache_dir: Optional[str] = None) -> LayoutCount:
+    """Dénombre exactement les dispositions légales d'une flotte.
+
+    Les états identiques sont fusionnés à chaque case, ainsi que deux états de
+    début de ligne symétriques l'un de l'autre : le coût dépend du nombre d'états
+    et non du nombre de dispositions (des dizaines de milliards sur 10x10). Une
+    passe arrière donne l'occupation exacte de chaque case.
+
+    Avec `workers > 1`, les états atteints au milieu du plateau sont répartis
+    entre plusieurs processus qui terminent chacun le calcul pour leur part.
+
+    Args:
+        size (int): Taille du plateau.
+        fleet (Optional[Sequence[int]]): Tailles des navires (par défaut la flotte
+            de GAME_CONFIG["SHIPS"]).
+        no_touch (bool): True si les navires ne peuvent pas se toucher.
+        workers (int): Nombre de processus.
+        cache_dir (Optional[str]): Dossier du cache disque (par défaut
+            GAME_CONFIG["AI"]["layout_cache_dir"] ; "" pour ne pas l'utiliser).
+
+    Returns:
+        LayoutCount: Nombre de dispositions et occupation des cases.
+    """
+    fleet = tuple(sorted(fleet if fleet is not None else fleet_from_config(), reverse=True))
+    if cache_dir is None:
+        cache_dir = GAME_CONFIG["AI"]["layout_cache_dir"]
+    path = cache_path(cache_dir, size, fleet, no_touch) if cache_dir else None
+    if path and os.path.exists(path):
+        with open(path, encoding='utf-8') as stream:
+            return LayoutCount.from_dict(json.load(stream))
+
+    spec = _Spec(size, fleet, no_touch)
+    initial = {spec.initial_state(): 1}
+
+    if workers <= 1 or spec.height < 2:
+        completions, marginals = _sweep(spec, 0, spec.height, initial, {0: 1})
+    else:
+        middle = spec.height // 2
+        frontier = initial
+        for pos in range(middle * spec.width):
+            frontier = _step(spec, pos, frontier)
+        items = list(frontier.items())
+        tasks = [(size, fleet, no_touch, middle, dict(items[index::workers]))
+                 for index in range(workers) if items[index::workers]]
+
+        middle_completions: Dict[int, int] = {}
+        marginals = [0] * (size * size)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part_completions, part_marginals in pool.map(_sweep_task, tasks):
+                middle_completions.update(part_completions)
+                for cell, value in enumerate(part_marginals):
+                    marginals[cell] += value
+
+        completions, top_marginals = _sweep(spec, 0, middle, initial, middle_completions)
+        for cell, value in enumerate(top_marginals):
+            marginals[cell] += value
+
+    # Les états symétriques ont été fusionnés : chaque case reçoit la moyenne
+    # exacte de son occupation et de celle de sa symétrique sur la même ligne.
+    symmetric = [
+        (marginals[y * size + x] + marginals[y * size + size - 1 - x]) // 2
+        for y in range(size) for x in range(size)
+    ]
+    result = LayoutCount(size, fleet, no_touch, completions.get(spec.initial_state(), 0), symmetric)
+    if path:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as stream:
+            json.dump(result.to_dict(), stream)
+    return result
+
+
+def main(argv: Optional[List[str]] = None):
+    """Point d'entrée en ligne de commande : python -m src.ai.layouts."""
+    parser = argparse.ArgumentParser(description="Dénombrement exact des dispositions d'une flotte.")
+    parser.add_argument('--size', type=int, default=GAME_CONFIG["BOARD_SIZE"])
+    parser.add_argument('--fleet', type=int, nargs='+', default=None)
+    parser.add_argument('--no-touch', action='store_true')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    start = time.perf_counter()
+    result = count_layouts(args.size, args.fleet, args.no_touch, args.workers, "" if args.no_cache else None)
+    logging.info(f"{result.layouts} dispositions ({result.labelled_layouts} en distinguant les navires) "
+                 f"en {time.perf_counter() - start:.1f} s")
+    for row in result.probabilities():
+        print(' '.join(f"{value:.3f}" for value in row))
+
+
+if __name__ == '__main__':
+    main()
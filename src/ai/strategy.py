@@ -0,0 +1,101 @@
+"""Paramètres de la stratégie de ciblage de l'IA et difficultés réglées."""
+
+from typing import Any, Dict, Optional
+import json
+import os
+
+from ..utils.config import GAME_CONFIG
+
+# Difficultés fournies par le jeu ; les autres sont lues dans le fichier des difficultés réglées
+BUILTIN_DIFFICULTIES = ("easy", "normal", "hard")
+
+
+class TargetingParams:
+    """Réglages de l'IA « chasse puis ciblage » du mode normal.
+
+    Les valeurs par défaut reproduisent les règles du mode normal d'origine,
+    pas sa suite de tirages : la chasse tire désormais dans l'index des cases
+    non visées (CellSampler). Le test tests/test_strategy.py fige une partie
+    jouée avec ces valeurs.
+
+    Attributes:
+        parity (bool): En chasse, ne tirer que sur une couleur du damier
+            ((x + y) % 2 == 0) tant qu'il en reste : tout navire de taille 2 ou
+            plus y a au moins une case.
+        heat_hunt (float): Probabilité, en chasse, de tirer sur la meilleure case
+            de la carte de chaleur plutôt qu'au hasard.
+        follow_line (bool): Après deux touches alignées, ne poursuivre que dans
+            cet axe.
+        clear_on_sink (bool): Abandonner les cibles en attente quand un navire
+            coule (sinon, seules ses cases sont retirées des touches suivies).
+    """
+
+    __slots__ = ('parity', 'heat_hunt', 'follow_line', 'clear_on_sink')
+
+    def __init__(self, parity: bool = False, heat_hunt: float = 0.0, follow_line: bool = True,
+                 clear_on_sink: bool = True):
+        self.parity = parity
+        self.heat_hunt = heat_hunt
+        self.follow_line = follow_line
+        self.clear_on_sink = clear_on_sink
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Forme sérialisable en JSON."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TargetingParams':
+        """Reconstruit des réglages (les clés absentes prennent leur valeur par défaut)."""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, TargetingParams) and self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.to_dict().values()))
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"TargetingParams({values})"
+
+
+def difficulties_path(path: Optional[str] = None) -> str:
+    """Chemin du fichier des difficultés réglées (GAME_CONFIG["AI"]["difficulties_file"])."""
+    return os.path.expanduser(path or GAME_CONFIG["AI"]["difficulties_file"])
+
+
+def load_difficulties(path: Optional[str] = None) -> Dict[str, TargetingParams]:
+    """Lit les difficultés réglées.
+
+    Args:
+        path (Optional[str]): Fichier JSON (par défaut celui de la configuration).
+
+    Returns:
+        Dict[str, TargetingParams]: Réglages par nom de difficulté (vide si le
+        fichier n'existe pas).
+    """
+    path = difficulties_path(path)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as stream:
+        return {name: TargetingParams.from_dict(data) for name, data in json.load(stream).items()}
+
+
+def save_difficulty(name: str, params: TargetingParams, path: Optional[str] = None):
+    """Ajoute ou remplace une difficulté réglée.
+
+    Args:
+        name (str): Nom de la difficulté (différent des difficultés fournies).
+        params (TargetingParams): Réglages à associer.
+        path (Optional[str]): Fichier JSON (par défaut celui de la configuration).
+    """
+    if name in BUILTIN_DIFFICULTIES:
+        raise ValueError(f"La difficulté '{name}' est réservée")
+    path = difficulties_path(path)
+    difficulties = {key: value.to_dict() for key, value in load_difficulties(path).items()}
+    difficulties[name] = params.to_dict()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as stream:
+        json.dump(difficulties, stream, indent=2)
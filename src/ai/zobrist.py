@@ -0,0 +1,194 @@
+"""Hachage Zobrist de la vue de l'IA et cache de décisions partagé."""
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Optional
+import random
+import threading
+
+from ..utils.config import GAME_CONFIG
+from ..utils.constants import CELL_STATES
+
+_MASK64 = (1 << 64) - 1
+
+
+class ZobristTable:
+    """Clés aléatoires 64 bits pour hacher un état de connaissance d'un plateau.
+
+    Les clés sont dérivées d'une graine fixe par taille de plateau : deux parties
+    du même processus (ou de processus différents) produisent donc le même hash
+    pour la même connaissance, ce qui permet de partager le cache de décisions.
+    Les clés des cases sont calculées à la demande (mélange SplitMix64 de la
+    graine et de l'indice) : la table ne coûte rien, même sur un très grand plateau.
+    """
+
+    KNOWN_STATES = (CELL_STATES['HIT'], CELL_STATES['MISS'], CELL_STATES['SUNK'])
+
+    def __init__(self, size: int):
+        """Initialise la table pour un plateau donné.
+
+        Args:
+            size (int): Taille du plateau.
+        """
+        self.size = size
+        self.seed = random.Random(f"zobrist:{size}").getrandbits(64)
+        self._fleet_keys: Dict[tuple, int] = {}
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def for_board(size: int) -> 'ZobristTable':
+        """Retourne la table partagée pour une taille de plateau.
+
+        Args:
+            size (int): Taille du plateau.
+
+        Returns:
+            ZobristTable: Table unique pour cette taille dans le processus.
+        """
+        return ZobristTable(size)
+
+    def cell_key(self, index: int, state: int) -> int:
+        """Retourne la clé d'une case dans un état connu.
+
+        Args:
+            index (int): Indice de la case (y * size + x).
+            state (int): Code CELL_STATES ('HIT', 'MISS' ou 'SUNK').
+
+        Returns:
+            int: Clé 64 bits.
+        """
+        z = (self.seed + (index * 8 + state + 1) * 0x9E3779B97F4A7C15) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+    def fleet_key(self, ship_size: int, occurrence: int) -> int:
+        """Retourne la clé de la n-ième occurrence d'un navire encore à flot.
+
+        Args:
+            ship_size (int): Taille du navire.
+            occurrence (int): Rang de l'occurrence parmi les navires de cette taille.
+
+        Returns:
+            int: Clé 64 bits.
+        """
+        key = (ship_size, occurrence)
+        if key not in self._fleet_keys:
+            rng = random.Random(f"zobrist:{self.size}:fleet:{ship_size}:{occurrence}")
+            self._fleet_keys[key] = rng.getrandbits(64)
+        return self._fleet_keys[key]
+
+    def fleet_hash(self, ship_sizes) -> int:
+        """Calcule le hash d'une flotte complète encore à flot.
+
+        Args:
+            ship_sizes: Tailles des navires de la flotte.
+
+        Returns:
+            int: Hash de la flotte.
+        """
+        value = 0
+        counts: Dict[int, int] = {}
+        for ship_size in ship_sizes:
+            occurrence = counts.get(ship_size, 0)
+            value ^= self.fleet_key(ship_size, occurrence)
+            counts[ship_size] = occurrence + 1
+        return value
+
+
+class DecisionCache:
+    """Cache LRU borné associant un état de connaissance à une décision de l'IA.
+
+    Le cache est protégé par un verrou afin d'être partagé entre plusieurs
+    parties du même processus, y compris depuis des threads différents.
+    """
+
+    def __init__(self, max_entries: int = 50_000):
+        """Initialise le cache.
+
+        Args:
+            max_entries (int): Nombre maximal d'entrées conservées.
+        """
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retourne la décision associée à une clé, ou None.
+
+        Args:
+            key (Hashable): Clé de l'état (taille du plateau, hash Zobrist).
+
+        Returns:
+            Optional[Any]: La décision mise en cache.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Enregistre une décision, en évinçant la plus ancienne si nécessaire.
+
+        Args:
+            key (Hashable): Clé de l'état.
+            value (Any): Décision (tir choisi ou carte de chaleur).
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Retourne la décision en cache ou la calcule puis la mémorise.
+
+        Args:
+            key (Hashable): Clé de l'état.
+            compute (Callable): Fonction de calcul appelée en cas d'absence.
+
+        Returns:
+            Any: La décision.
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def stats(self) -> Dict[str, float]:
+        """Retourne les statistiques d'utilisation du cache.
+
+        Returns:
+            dict: Entrées, succès, échecs, évictions et taux de succès.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def clear(self):
+        """Vide le cache et remet les statistiques à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Cache partagé par toutes les parties du processus
+SHARED_DECISION_CACHE = DecisionCache(GAME_CONFIG["AI"]["decision_cache_size"])
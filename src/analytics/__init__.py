@@ -0,0 +1,8 @@
+from .aggregates import StreamingAggregates
+from .columnar import ColumnarWriter, read_chunks, read_schema
+from .pipeline import run_pipeline, aggregate_recorded, write_aggregates
+
+__all__ = [
+    'StreamingAggregates', 'ColumnarWriter', 'read_chunks', 'read_schema',
+    'run_pipeline', 'aggregate_recorded', 'write_aggregates'
+]
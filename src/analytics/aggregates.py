@@ -0,0 +1,126 @@
+"""Agrégats incrémentaux sur un flux de parties."""
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, List
+
+from src.utils.constants import SHOT_RESULTS
+
+
+class StreamingAggregates:
+    """Statistiques cumulées, en mémoire constante quel que soit le nombre de parties.
+
+    - fréquence des touches par case ;
+    - tirs nécessaires pour couler un navire, par type (taille) de navire, comptés
+      de la première touche sur le navire au tir qui le coule ;
+    - distribution de la durée des parties en tours.
+    """
+
+    def __init__(self, board_size: int):
+        """Initialise des agrégats vides.
+
+        Args:
+            board_size (int): Taille des plateaux analysés.
+        """
+        self.board_size = board_size
+        self.games = 0
+        self.shots = 0
+        self.cell_shots = array('Q', bytes(8 * board_size * board_size))
+        self.cell_hits = array('Q', bytes(8 * board_size * board_size))
+        self.sink_shots: Dict[int, Counter] = {}
+        self.game_turns: Counter = Counter()
+
+    def add_shots(self, x, y, result, ship_size, sink_shots):
+        """Ajoute des tirs fournis colonne par colonne.
+
+        Args:
+            x, y: Coordonnées des tirs.
+            result: Codes SHOT_RESULTS.
+            ship_size: Taille du navire touché (0 si manqué).
+            sink_shots: Tirs depuis la première touche, pour les tirs qui coulent.
+        """
+        size = self.board_size
+        cell_shots = self.cell_shots
+        cell_hits = self.cell_hits
+        hit, sunk = SHOT_RESULTS['HIT'], SHOT_RESULTS['SUNK']
+
+        for shot_x, shot_y, code, length, to_sink in zip(x, y, result, ship_size, sink_shots):
+            cell = shot_y * size + shot_x
+            cell_shots[cell] += 1
+            if code == hit:
+                cell_hits[cell] += 1
+            elif code == sunk:
+                cell_hits[cell] += 1
+                self.sink_shots.setdefault(length, Counter())[to_sink] += 1
+        self.shots += len(result)
+
+    def add_game(self, turns: int):
+        """Ajoute une partie terminée.
+
+        Args:
+            turns (int): Nombre de tours de la partie.
+        """
+        self.games += 1
+        self.game_turns[turns] += 1
+
+    def add_record(self, record):
+        """Ajoute une partie simulée complète.
+
+        Args:
+            record (GameRecord): Déroulé de la partie.
+        """
+        self.add_shots(record.x, record.y, record.result, record.ship_size, record.sink_shots)
+        self.add_game(record.turns)
+
+    def merge(self, other: 'StreamingAggregates'):
+        """Fusionne les agrégats d'un autre flux (par exemple d'un autre processus).
+
+        Args:
+            other (StreamingAggregates): Agrégats à ajouter.
+        """
+        if other.board_size != self.board_size:
+            raise ValueError("Impossible de fusionner des agrégats de tailles de plateau différentes")
+        self.games += other.games
+        self.shots += other.shots
+        for cell in range(len(self.cell_hits)):
+            self.cell_shots[cell] += other.cell_shots[cell]
+            self.cell_hits[cell] += other.cell_hits[cell]
+        for length, counts in other.sink_shots.items():
+            self.sink_shots.setdefault(length, Counter()).update(counts)
+        self.game_turns.update(other.game_turns)
+
+    def hit_frequency(self) -> List[List[float]]:
+        """Retourne la carte de chaleur des touches.
+
+        Returns:
+            List[List[float]]: Proportion des parties où chaque case a été touchée,
+            indexée par [y][x].
+        """
+        size = self.board_size
+        games = self.games or 1
+        return [[self.cell_hits[y * size + x] / games for x in range(size)] for y in range(size)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Résume les agrégats sous une forme sérialisable en JSON.
+
+        Returns:
+            dict: Totaux, carte de chaleur et distributions.
+        """
+        def summarize(counts: Counter) -> Dict[str, Any]:
+            total = sum(counts.values())
+            return {
+                'count': total,
+                'mean': sum(value * n for value, n in counts.items()) / total if total else 0.0,
+                'min': min(counts) if counts else 0,
+                'max': max(counts) if counts else 0,
+                'histogram': {str(value): counts[value] for value in sorted(counts)}
+            }
+
+        return {
+            'board_size': self.board_size,
+            'games': self.games,
+            'shots': self.shots,
+            'hit_frequency': self.hit_frequency(),
+            'shots_to_sink': {str(length): summarize(counts) for length, counts in sorted(self.sink_shots.items())},
+            'game_turns': summarize(self.game_turns)
+        }
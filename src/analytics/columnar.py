@@ -0,0 +1,161 @@
+"""Format de fichier colonnaire compact, écrit et relu par blocs."""
+
+from array import array
+from typing import BinaryIO, Dict, Iterator, List, Sequence, Tuple
+import json
+import struct
+import zlib
+
+MAGIC = b"BNCOL1\n"
+CHUNK_TAG = b"CHNK"
+
+# En-tête d'un bloc : marqueur, nombre de lignes
+_CHUNK_HEADER = struct.Struct("<4sI")
+# En-tête d'une colonne dans un bloc : taille des données compressées
+_COLUMN_HEADER = struct.Struct("<I")
+
+
+class ColumnarWriter:
+    """Écrit des lignes dans un fichier colonnaire par blocs de taille fixe.
+
+    Le fichier commence par un schéma JSON (noms et codes de type `array` des
+    colonnes), suivi de blocs indépendants : pour chaque colonne, les valeurs du
+    bloc sont stockées à la suite puis compressées avec zlib. Seul le bloc en
+    cours est gardé en mémoire.
+    """
+
+    def __init__(self, path: str, schema: Sequence[Tuple[str, str]], chunk_size: int = 65536):
+        """Ouvre le fichier et écrit le schéma.
+
+        Args:
+            path (str): Chemin du fichier à créer.
+            schema (Sequence[Tuple[str, str]]): Colonnes (nom, code de type `array`).
+            chunk_size (int): Nombre de lignes par bloc.
+        """
+        self.path = path
+        self.schema = list(schema)
+        self.chunk_size = chunk_size
+        self.rows_written = 0
+        self.chunks_written = 0
+        self._columns: Dict[str, array] = {name: array(typecode) for name, typecode in self.schema}
+        self._file: BinaryIO = open(path, 'wb')
+
+        header = json.dumps({'columns': self.schema}).encode('utf-8')
+        self._file.write(MAGIC)
+        self._file.write(_COLUMN_HEADER.pack(len(header)))
+        self._file.write(header)
+
+    def __enter__(self) -> 'ColumnarWriter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def pending_rows(self) -> int:
+        """Nombre de lignes du bloc en cours."""
+        return len(self._columns[self.schema[0][0]])
+
+    def append(self, **row):
+        """Ajoute une ligne.
+
+        Args:
+            **row: Une valeur par colonne du schéma.
+        """
+        for name, _ in self.schema:
+            self._columns[name].append(row[name])
+        if self.pending_rows >= self.chunk_size:
+            self.flush()
+
+    def extend(self, columns: Dict[str, Sequence]):
+        """Ajoute plusieurs lignes fournies colonne par colonne.
+
+        Args:
+            columns (dict): Une séquence de même longueur par colonne du schéma.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Les colonnes n'ont pas toutes la même longueur")
+
+        total = lengths.pop() if lengths else 0
+        start = 0
+        while start < total:
+            room = self.chunk_size - self.pending_rows
+            end = min(start + room, total)
+            for name, _ in self.schema:
+                self._columns[name].extend(columns[name][start:end])
+            start = end
+            if self.pending_rows >= self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        """Écrit le bloc en cours sur le disque."""
+        rows = self.pending_rows
+        if not rows:
+            return
+        self._file.write(_CHUNK_HEADER.pack(CHUNK_TAG, rows))
+        for name, typecode in self.schema:
+            data = zlib.compress(self._columns[name].tobytes(), 6)
+            self._file.write(_COLUMN_HEADER.pack(len(data)))
+            self._file.write(data)
+            self._columns[name] = array(typecode)
+        self.rows_written += rows
+        self.chunks_written += 1
+
+    def close(self):
+        """Écrit le dernier bloc et ferme le fichier."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def read_schema(path: str) -> List[Tuple[str, str]]:
+    """Retourne le schéma d'un fichier colonnaire.
+
+    Args:
+        path (str): Chemin du fichier.
+
+    Returns:
+        List[Tuple[str, str]]: Colonnes (nom, code de type `array`).
+    """
+    with open(path, 'rb') as stream:
+        return _read_header(stream)
+
+
+def read_chunks(path: str) -> Iterator[Dict[str, array]]:
+    """Relit un fichier colonnaire bloc par bloc.
+
+    Args:
+        path (str): Chemin du fichier.
+
+    Yields:
+        dict: Valeurs du bloc, une `array` par colonne.
+    """
+    with open(path, 'rb') as stream:
+        schema = _read_header(stream)
+        while True:
+            header = stream.read(_CHUNK_HEADER.size)
+            if not header:
+                return
+            tag, rows = _CHUNK_HEADER.unpack(header)
+            if tag != CHUNK_TAG:
+                raise ValueError(f"Bloc corrompu dans {path}")
+
+            chunk = {}
+            for name, typecode in schema:
+                (length,) = _COLUMN_HEADER.unpack(stream.read(_COLUMN_HEADER.size))
+                values = array(typecode)
+                values.frombytes(zlib.decompress(stream.read(length)))
+                if len(values) != rows:
+                    raise ValueError(f"Colonne {name} incomplète dans {path}")
+                chunk[name] = values
+            yield chunk
+
+
+def _read_header(stream: BinaryIO) -> List[Tuple[str, str]]:
+    """Lit et valide l'en-tête d'un fichier colonnaire."""
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Ce fichier n'est pas au format colonnaire de la bataille navale")
+    (length,) = _COLUMN_HEADER.unpack(stream.read(_COLUMN_HEADER.size))
+    header = json.loads(stream.read(length).decode('utf-8'))
+    return [tuple(column) for column in header['columns']]
@@ -0,0 +1,136 @@
+"""Chaîne d'analyse en flux : parties simulées vers fichiers colonnaires et agrégats."""
+
+from typing import Iterable, Iterator, Optional
+import argparse
+import json
+import logging
+import os
+import time
+
+from src.controllers.simulation import GameRecord, simulate_games
+from .aggregates import StreamingAggregates
+from .columnar import ColumnarWriter, read_chunks
+
+GAMES_FILE = "games.bncol"
+SHOTS_FILE = "shots.bncol"
+AGGREGATES_FILE = "aggregates.json"
+HEATMAP_FILE = "heatmap.csv"
+
+GAMES_SCHEMA = [
+    ('game_id', 'Q'), ('seed', 'q'), ('board_size', 'H'), ('turns', 'I'), ('shots', 'I')
+]
+SHOTS_SCHEMA = [
+    ('game_id', 'Q'), ('turn', 'I'), ('x', 'H'), ('y', 'H'),
+    ('result', 'B'), ('ship_size', 'B'), ('sink_shots', 'I')
+]
+
+
+def run_pipeline(games: Iterable[GameRecord], output_dir: str, board_size: int,
+                 chunk_size: int = 65536, log_every: int = 100_000) -> StreamingAggregates:
+    """Consomme un flux de parties, les écrit par blocs et met à jour les agrégats.
+
+    Une partie n'est plus référencée une fois traitée : la mémoire utilisée reste
+    constante quel que soit le nombre de parties.
+
+    Args:
+        games (Iterable[GameRecord]): Flux de parties (générateur de préférence).
+        output_dir (str): Dossier de sortie.
+        board_size (int): Taille des plateaux.
+        chunk_size (int): Nombre de lignes par bloc des fichiers colonnaires.
+        log_every (int): Fréquence des messages de progression, en parties.
+
+    Returns:
+        StreamingAggregates: Agrégats finaux (aussi écrits dans le dossier de sortie).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    aggregates = StreamingAggregates(board_size)
+    start = time.perf_counter()
+
+    with ColumnarWriter(os.path.join(output_dir, GAMES_FILE), GAMES_SCHEMA, chunk_size) as games_out, \
+            ColumnarWriter(os.path.join(output_dir, SHOTS_FILE), SHOTS_SCHEMA, chunk_size) as shots_out:
+        for record in games:
+            games_out.append(
+                game_id=record.game_id, seed=record.seed, board_size=record.board_size,
+                turns=record.turns, shots=record.shots
+            )
+            shots_out.extend({
+                'game_id': [record.game_id] * record.shots,
+                'turn': record.turn,
+                'x': record.x,
+                'y': record.y,
+                'result': record.result,
+                'ship_size': record.ship_size,
+                'sink_shots': record.sink_shots
+            })
+            aggregates.add_record(record)
+
+            if log_every and aggregates.games % log_every == 0:
+                rate = aggregates.games / (time.perf_counter() - start)
+                logging.info(f"{aggregates.games} parties analysées ({rate:.0f} parties/s)")
+
+    write_aggregates(aggregates, output_dir)
+    return aggregates
+
+
+def aggregate_recorded(output_dir: str, board_size: int) -> StreamingAggregates:
+    """Recalcule les agrégats à partir des tirs déjà enregistrés, bloc par bloc.
+
+    Args:
+        output_dir (str): Dossier contenant les fichiers colonnaires.
+        board_size (int): Taille des plateaux.
+
+    Returns:
+        StreamingAggregates: Les agrégats.
+    """
+    aggregates = StreamingAggregates(board_size)
+    for chunk in read_chunks(os.path.join(output_dir, SHOTS_FILE)):
+        aggregates.add_shots(chunk['x'], chunk['y'], chunk['result'], chunk['ship_size'], chunk['sink_shots'])
+    for chunk in read_chunks(os.path.join(output_dir, GAMES_FILE)):
+        for turns in chunk['turns']:
+            aggregates.add_game(turns)
+    return aggregates
+
+
+def write_aggregates(aggregates: StreamingAggregates, output_dir: str):
+    """Écrit le résumé JSON des agrégats et la carte de chaleur en CSV.
+
+    Args:
+        aggregates (StreamingAggregates): Agrégats à écrire.
+        output_dir (str): Dossier de sortie.
+    """
+    with open(os.path.join(output_dir, AGGREGATES_FILE), 'w', encoding='utf-8') as stream:
+        json.dump(aggregates.to_dict(), stream, indent=2)
+    with open(os.path.join(output_dir, HEATMAP_FILE), 'w', encoding='utf-8') as stream:
+        for row in aggregates.hit_frequency():
+            stream.write(','.join(f"{value:.6f}" for value in row) + '\n')
+
+
+def main(argv: Optional[Iterator[str]] = None):
+    """Point d'entrée en ligne de commande : python -m src.analytics."""
+    parser = argparse.ArgumentParser(description="Analyse en flux de parties simulées.")
+    parser.add_argument('--games', type=int, default=10_000)
+    parser.add_argument('--difficulty', default='normal', choices=['easy', 'normal', 'hard'])
+    parser.add_argument('--mode', default='classic', choices=['classic', 'salvo'])
+    parser.add_argument('--no-touch', action='store_true', default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-size', type=int, default=65536)
+    parser.add_argument('--output', default='analytics_output')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    games = simulate_games(args.games, args.difficulty, args.mode, args.no_touch, args.seed)
+    first = next(games, None)
+    if first is None:
+        return
+    board_size = first.board_size
+
+    def stream() -> Iterator[GameRecord]:
+        yield first
+        yield from games
+
+    aggregates = run_pipeline(stream(), args.output, board_size, args.chunk_size)
+    summary = aggregates.to_dict()
+    logging.info(
+        f"{summary['games']} parties, {summary['shots']} tirs, "
+        f"{summary['game_turns']['mean']:.1f} tours en moyenne -> {os.path.abspath(args.output)}"
+    )
@@ -1,3 +1,5 @@
 from .game_controller import GameController
+from .simulation import GameRecord, simulate_games, play_computer_game
+from .tuning import Candidate, Tuner
 
-__all__ = ['GameController']
\ No newline at end of file
+__all__ = ['GameController', 'GameRecord', 'simulate_games', 'play_computer_game', 'Candidate', 'Tuner']
\ No newline at end of file
@@ -1,31 +1,165 @@
-from typing import List, Tuple, Optional, Set
+from typing import Any, Callable, Dict, List, Tuple, Optional, Set
 from src.models.player import Player
 from src.models.ship import Ship
 from src.models.board import Board
+from src.models.board_state import BoardState, ShipPlacement
+from src.models.shot_ledger import ShotLedger
+from src.ai import (BUILTIN_DIFFICULTIES, DecisionCache, OpponentKnowledge, SHARED_DECISION_CACHE,
+                    TargetingParams, compute_heat_map, choose_best_cell, choose_best_cells,
+                    load_difficulties)
+from src.utils.config import GAME_CONFIG
+from src.utils.constants import CELL_DIGITS, SHOT_RESULTS
+from array import array
 from collections import deque
 import random
 import logging
 
+# Tirages aléatoires tentés avant d'énumérer les placements valides
+RANDOM_PLACEMENT_ATTEMPTS = 100
+
 class GameController:
     """Contrôleur principal de la logique de jeu de bataille navale."""
 
-    def __init__(self, difficulty: str = "normal"):
+    def __init__(self, difficulty: str = "normal", decision_cache: Optional[DecisionCache] = None,
+                 mode: str = "classic", no_touch: Optional[bool] = None,
+                 board_size: Optional[int] = None, decision_service: Optional[Any] = None,
+                 targeting: Optional[TargetingParams] = None):
         """Initialise le contrôleur de jeu.
 
         Args:
-            difficulty (str): Niveau de difficulté ("easy" ou "normal").
+            difficulty (str): Niveau de difficulté ("easy", "normal", "hard" ou le nom
+                d'une difficulté réglée, voir src.controllers.tuning).
+            decision_cache (Optional[DecisionCache]): Cache de décisions de l'IA
+                (par défaut le cache partagé du processus).
+            mode (str): Mode de jeu ("classic" : un tir par tour, "salvo" : un tir
+                par navire encore à flot).
+            no_touch (Optional[bool]): True si les navires ne peuvent pas se toucher
+                (par défaut GAME_CONFIG["RULES"]["no_touch"]).
+            board_size (Optional[int]): Taille des plateaux (par défaut GAME_CONFIG["BOARD_SIZE"]).
+            decision_service (Optional[Any]): Service de décision partagé (DecisionService
+                ou DecisionClient) qui choisit les tirs en mode difficile à la place
+                du calcul local.
+            targeting (Optional[TargetingParams]): Réglages de l'IA du mode normal
+                (par défaut ceux de la difficulté réglée, ou ceux d'origine).
+
+        Raises:
+            ValueError: Si la difficulté n'existe pas.
         """
+        if no_touch is None:
+            no_touch = GAME_CONFIG["RULES"]["no_touch"]
+        if board_size is None:
+            board_size = GAME_CONFIG["BOARD_SIZE"]
+        if difficulty not in BUILTIN_DIFFICULTIES:
+            # Difficulté réglée : IA du mode normal avec ses propres réglages
+            tuned = load_difficulties()
+            if difficulty not in tuned:
+                raise ValueError(f"Difficulté inconnue : {difficulty}")
+            targeting = targeting or tuned[difficulty]
+            difficulty = "normal"
         self.difficulty = difficulty
-        self.player = Player("Joueur")
-        self.computer = Player("Ordinateur", is_computer=True)
+        self.targeting = targeting or TargetingParams()
+        self.mode = mode
+        self.no_touch = no_touch
+        self.player = Player("Joueur", no_touch=no_touch, board_size=board_size)
+        self.computer = Player("Ordinateur", is_computer=True, no_touch=no_touch, board_size=board_size)
         self.current_turn = self.player
         
+        # Un seul registre de tirs par plateau, partagé avec le joueur qui tire dessus
+        self.player.shots = self.computer.board.shots
+        self.computer.shots = self.player.board.shots
+
         # Attributs pour la logique de tir de l'ordinateur
-        self.computer_shots: Set[Tuple[int, int]] = set()
         self.last_hit: Optional[Tuple[int, int]] = None
         self.target_queue: deque[Tuple[int, int]] = deque()
         self.successful_hits: List[Tuple[int, int]] = []
 
+        # Connaissance du plateau adverse, hachée pour réutiliser les décisions
+        self.knowledge = OpponentKnowledge(
+            self.player.board.size,
+            [ship.size for ship in self.player.initialize_ships()],
+            no_touch=no_touch
+        )
+        self.decision_cache = decision_cache if decision_cache is not None else SHARED_DECISION_CACHE
+        self.decision_service = decision_service
+
+        # Versions successives du plateau du joueur pendant le placement (annuler / rétablir)
+        self.placement_history: List[BoardState] = [BoardState.empty(board_size, no_touch)]
+        self.placement_index = 0
+
+        # Abonnés aux événements de la partie (spectateurs, enregistrement...)
+        self.listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self.winner: Optional[Player] = None
+
+    @property
+    def computer_shots(self) -> ShotLedger:
+        """Registre des tirs de l'ordinateur (celui du plateau du joueur)."""
+        return self.player.board.shots
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        """Abonne une fonction aux événements de la partie.
+
+        Les événements sont des dictionnaires avec une clé 'type' : 'ship_placed',
+        'ship_removed' (placement annulé), 'shot', 'sunk' ou 'game_over'. L'abonné
+        est appelé de manière synchrone et doit donc rendre la main immédiatement.
+
+        Args:
+            listener (Callable): Fonction appelée pour chaque événement.
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        """Désabonne une fonction des événements de la partie.
+
+        Args:
+            listener (Callable): Fonction précédemment abonnée.
+        """
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def _emit(self, event: Dict[str, Any]):
+        """Diffuse un événement à tous les abonnés."""
+        for listener in self.listeners:
+            listener(event)
+
+    def _board_name(self, board: Board) -> str:
+        """Retourne le nom du propriétaire d'un plateau dans les événements."""
+        return "player" if board is self.player.board else "computer"
+
+    def _publish_placement(self, board: Board, ship: Ship):
+        """Publie le placement d'un navire."""
+        if self.listeners:
+            self._emit({
+                'type': 'ship_placed',
+                'board': self._board_name(board),
+                'ship': ship.name,
+                'positions': ship.positions
+            })
+
+    def _publish_shot(self, board: Board, x: int, y: int, hit: bool, ship: Optional[Ship]):
+        """Publie un tir (et le naufrage éventuel qu'il provoque)."""
+        if not self.listeners:
+            return
+        name = self._board_name(board)
+        self._emit({'type': 'shot', 'board': name, 'x': x, 'y': y, 'hit': hit})
+        if ship is not None:
+            self._emit({'type': 'sunk', 'board': name, 'ship': ship.name, 'positions': ship.positions})
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Retourne l'état complet et sérialisable de la partie.
+
+        Returns:
+            dict: Taille, états des cases de chaque plateau (codes CELL_STATES
+            concaténés) et gagnant éventuel.
+        """
+        def encode(board: Board) -> str:
+            return board.cell_buffer.tobytes().translate(CELL_DIGITS).decode('ascii')
+
+        return {
+            'size': self.player.board.size,
+            'boards': {'player': encode(self.player.board), 'computer': encode(self.computer.board)},
+            'winner': self.winner.name if self.winner else None
+        }
+
     def initialize_game(self):
         """Initialise le jeu avec les navires placés sur les plateaux."""
         logging.info("Initialisation des navires...")
@@ -36,6 +170,7 @@ class GameController:
         # Placement aléatoire des navires de l'ordinateur
         for ship in self.computer.initialize_ships():
             self.place_computer_ship_randomly(ship)
+            self._publish_placement(self.computer.board, ship)
 
     def place_computer_ship_randomly(self, ship: Ship):
         """Place un navire de l'ordinateur de manière aléatoire.
@@ -43,12 +178,34 @@ class GameController:
         Args:
             ship (Ship): Le navire à placer.
         """
-        placed = False
-        while not placed:
-            x = random.randint(0, self.computer.board.size - 1)
-            y = random.randint(0, self.computer.board.size - 1)
+        self.place_ship_randomly(self.computer.board, ship)
+
+    def place_player_ships_randomly(self):
+        """Place automatiquement toute la flotte du joueur."""
+        for ship in self.player.initialize_ships():
+            self.place_ship_randomly(self.player.board, ship)
+            self._publish_placement(self.player.board, ship)
+
+    @staticmethod
+    def place_ship_randomly(board: Board, ship: Ship):
+        """Place un navire de manière aléatoire sur un plateau.
+
+        Args:
+            board (Board): Le plateau.
+            ship (Ship): Le navire à placer.
+        """
+        for _ in range(RANDOM_PLACEMENT_ATTEMPTS):
+            x = random.randint(0, board.size - 1)
+            y = random.randint(0, board.size - 1)
             horizontal = random.choice([True, False])
-            placed = self.computer.board.place_ship(ship, x, y, horizontal)
+            if board.place_ship(ship, x, y, horizontal):
+                return
+
+        # Plateau encombré : tirage parmi les placements encore valides
+        placements = board.valid_placements(ship)
+        if not placements:
+            raise ValueError(f"Impossible de placer le {ship.name} sur ce plateau")
+        board.place_ship(ship, *random.choice(placements))
 
     def can_place_ship(self, ship: Ship, x: int, y: int, horizontal: bool) -> bool:
         """Vérifie si un navire peut être placé à une position donnée.
@@ -76,7 +233,63 @@ class GameController:
         Returns:
             bool: True si le placement a réussi.
         """
-        return self.player.board.place_ship(ship, x, y, horizontal)
+        placed = self.player.board.place_ship(ship, x, y, horizontal)
+        if placed:
+            state = self.placement_state.place_ship(ship.name, ship.size, x, y, horizontal)
+            del self.placement_history[self.placement_index + 1:]
+            self.placement_history.append(state)
+            self.placement_index += 1
+            self._publish_placement(self.player.board, ship)
+        return placed
+
+    @property
+    def placement_state(self) -> BoardState:
+        """Version courante du plateau du joueur pendant le placement."""
+        return self.placement_history[self.placement_index]
+
+    def can_undo_placement(self) -> bool:
+        """Vérifie s'il reste un placement à annuler."""
+        return self.placement_index > 0
+
+    def can_redo_placement(self) -> bool:
+        """Vérifie s'il reste un placement annulé à rétablir."""
+        return self.placement_index < len(self.placement_history) - 1
+
+    def undo_placement(self) -> Optional[ShipPlacement]:
+        """Annule le dernier placement de navire du joueur.
+
+        Returns:
+            Optional[ShipPlacement]: Le placement annulé, ou None s'il n'y en a pas.
+        """
+        if not self.can_undo_placement():
+            return None
+        placement = self.placement_state.ships[-1]
+        self.placement_index -= 1
+        self.player.board.restore(self.placement_state)
+        if self.listeners:
+            self._emit({
+                'type': 'ship_removed',
+                'board': 'player',
+                'ship': placement.name,
+                'positions': [(cell % self.player.board.size, cell // self.player.board.size)
+                              for cell in placement.cells]
+            })
+        return placement
+
+    def redo_placement(self) -> Optional[ShipPlacement]:
+        """Rétablit le dernier placement annulé.
+
+        Returns:
+            Optional[ShipPlacement]: Le placement rétabli, ou None s'il n'y en a pas.
+        """
+        if not self.can_redo_placement():
+            return None
+        self.placement_index += 1
+        board = self.player.board
+        board.restore(self.placement_state)
+        placement = self.placement_state.ships[-1]
+        self._publish_placement(board, board.ships[-1])
+        return placement
 
     def handle_player_shot(self, x: int, y: int) -> Tuple[bool, bool, Optional[Ship]]:
         """Gère un tir du joueur sur le plateau de l'ordinateur.
@@ -88,7 +301,76 @@ class GameController:
         Returns:
             tuple: (déjà tiré, touché, navire coulé).
         """
-        return self.computer.board.receive_shot(x, y)
+        already_shot, hit, ship = self.computer.board.receive_shot(x, y)
+        if not already_shot:
+            self._publish_shot(self.computer.board, x, y, hit, ship)
+        return already_shot, hit, ship
+
+    def shots_per_turn(self, shooter: Player) -> int:
+        """Retourne le nombre de tirs auxquels un joueur a droit ce tour-ci.
+
+        Args:
+            shooter (Player): Le joueur qui tire.
+
+        Returns:
+            int: 1 en mode classique, le nombre de navires à flot en mode salve.
+        """
+        if self.mode == "salvo":
+            return max(1, len(shooter.get_remaining_ships()))
+        return 1
+
+    def handle_player_salvo(self, coordinates: List[Tuple[int, int]]) -> Tuple[array, List[Ship]]:
+        """Gère une salve du joueur sur le plateau de l'ordinateur.
+
+        Args:
+            coordinates (List[Tuple[int, int]]): Coordonnées des tirs.
+
+        Returns:
+            tuple: (codes SHOT_RESULTS par tir, navires coulés par la salve).
+        """
+        results = self.computer.board.receive_shots(coordinates)
+        if self.listeners:
+            self._publish_salvo(self.computer.board, coordinates, results)
+        return results, self._sunk_by_salvo(self.computer.board, coordinates, results)
+
+    def handle_computer_salvo(self) -> Tuple[List[Tuple[int, int]], array, List[Ship]]:
+        """Gère une salve de l'ordinateur sur le plateau du joueur.
+
+        Returns:
+            tuple: (coordonnées des tirs, codes SHOT_RESULTS, navires coulés).
+        """
+        coordinates = self.get_computer_salvo_coordinates(self.shots_per_turn(self.computer))
+        results = self.player.board.receive_shots(coordinates)
+        sunk_ships = self._sunk_by_salvo(self.player.board, coordinates, results)
+        if self.listeners:
+            self._publish_salvo(self.player.board, coordinates, results)
+
+        for (x, y), result in zip(coordinates, results):
+            ship = self.player.board.get_ship_at(x, y) if result == SHOT_RESULTS['SUNK'] else None
+            self._update_targeting(
+                x, y,
+                result == SHOT_RESULTS['ALREADY_SHOT'],
+                result in (SHOT_RESULTS['HIT'], SHOT_RESULTS['SUNK']),
+                ship
+            )
+
+        return coordinates, results, sunk_ships
+
+    def _publish_salvo(self, board: Board, coordinates: List[Tuple[int, int]], results: array):
+        """Publie chaque tir effectif d'une salve."""
+        for (x, y), result in zip(coordinates, results):
+            if result != SHOT_RESULTS['ALREADY_SHOT']:
+                ship = board.get_ship_at(x, y) if result == SHOT_RESULTS['SUNK'] else None
+                self._publish_shot(board, x, y, result != SHOT_RESULTS['MISS'], ship)
+
+    @staticmethod
+    def _sunk_by_salvo(board: Board, coordinates: List[Tuple[int, int]], results: array) -> List[Ship]:
+        """Retourne les navires coulés par une salve, dans l'ordre des tirs."""
+        return [
+            board.get_ship_at(x, y)
+            for (x, y), result in zip(coordinates, results)
+            if result == SHOT_RESULTS['SUNK']
+        ]
 
     def handle_computer_shot(self) -> Tuple[int, int, bool, bool, Optional[Ship]]:
         """Gère un tir de l'ordinateur sur le plateau du joueur.
@@ -98,22 +380,32 @@ class GameController:
         """
         x, y = self.get_computer_shot_coordinates()
         already_shot, hit, ship = self.player.board.receive_shot(x, y)
-        
-        # Met à jour la logique de tir de l'ordinateur
-        self.computer_shots.add((x, y))
+        self._update_targeting(x, y, already_shot, hit, ship)
+        if not already_shot:
+            self._publish_shot(self.player.board, x, y, hit, ship)
+        return x, y, already_shot, hit, ship
+
+    def _update_targeting(self, x: int, y: int, already_shot: bool, hit: bool, ship: Optional[Ship]):
+        """Met à jour la logique de tir de l'ordinateur après un tir."""
+        if not already_shot:
+            self.knowledge.record_shot(x, y, hit, ship.positions if ship else None)
         if hit and not already_shot:
             if ship and ship.is_sunk():
-                # Réinitialise la stratégie si le navire est coulé
-                self.target_queue.clear()
-                self.successful_hits.clear()
-                self.last_hit = None
+                if self.targeting.clear_on_sink:
+                    # Réinitialise la stratégie si le navire est coulé
+                    self.target_queue.clear()
+                    self.successful_hits.clear()
+                    self.last_hit = None
+                else:
+                    # Seules les touches du navire coulé cessent d'être suivies
+                    sunk = set(ship.positions)
+                    self.successful_hits[:] = [hit for hit in self.successful_hits if hit not in sunk]
+                    self.last_hit = self.successful_hits[-1] if self.successful_hits else None
             else:
                 # Continue le ciblage
                 self.successful_hits.append((x, y))
                 self.last_hit = (x, y)
                 self._add_adjacent_targets(x, y)
-        
-        return x, y, already_shot, hit, ship
 
     def get_computer_shot_coordinates(self) -> Tuple[int, int]:
         """Détermine les coordonnées du prochain tir de l'ordinateur en fonction de la difficulté.
@@ -121,25 +413,78 @@ class GameController:
         Returns:
             tuple: Coordonnées (x, y).
         """
+        size = self.player.board.size
         if self.difficulty == "easy":
-            # Mode facile : tirs aléatoires
-            while True:
-                x = random.randint(0, self.player.board.size - 1)
-                y = random.randint(0, self.player.board.size - 1)
-                if (x, y) not in self.computer_shots:
-                    return x, y
+            # Mode facile : tir au hasard parmi les cases pas encore visées
+            cell = self.computer_shots.unshot.sample(random)
+            return cell % size, cell // size
 
         elif self.difficulty == "normal":
             # Mode normal : tirs intelligents avec ciblage
-            if self.target_queue:
-                return self.target_queue.popleft()
+            while self.target_queue:
+                target = self.target_queue.popleft()
+                if self._is_valid_target(*target):
+                    return target
+
+            # Si pas de cible, chasse : carte de chaleur ou tir au hasard parmi les cases encore possibles
+            targeting = self.targeting
+            if targeting.heat_hunt and random.random() < targeting.heat_hunt:
+                return choose_best_cell(self._heat_map(), self.knowledge.cells, size)
+            unknown = self.knowledge.unknown
+            parity = 0 if targeting.parity and unknown.count(0) else None
+            cell = unknown.sample(random, parity)
+            return cell % size, cell // size
+
+        elif self.difficulty == "hard":
+            # Mode difficile : carte de chaleur, réutilisée pour les positions déjà vues
+            if self.decision_service is not None:
+                return self.decision_service.decide(self.knowledge)[0]
+            return choose_best_cell(self._heat_map(), self.knowledge.cells, self.knowledge.size)
+
+    def get_computer_salvo_coordinates(self, count: int) -> List[Tuple[int, int]]:
+        """Choisit en une fois les cibles distinctes d'une salve de l'ordinateur.
 
-            # Si pas de cible, tir aléatoire
-            while True:
-                x = random.randint(0, self.player.board.size - 1)
-                y = random.randint(0, self.player.board.size - 1)
-                if (x, y) not in self.computer_shots:
-                    return x, y
+        Args:
+            count (int): Nombre de tirs de la salve.
+
+        Returns:
+            List[Tuple[int, int]]: Coordonnées des tirs.
+        """
+        size = self.player.board.size
+        if self.difficulty == "easy":
+            count = min(count, size * size - len(self.computer_shots))
+        else:
+            count = min(count, self.knowledge.unknown_count())
+
+        if self.difficulty == "hard":
+            # Une seule carte de chaleur pour toute la salve
+            if self.decision_service is not None:
+                return self.decision_service.decide(self.knowledge, count)
+            return choose_best_cells(self._heat_map(), self.knowledge.cells, size, count)
+
+        chosen: List[Tuple[int, int]] = []
+        selected: Set[Tuple[int, int]] = set()
+        if self.difficulty == "normal":
+            while self.target_queue and len(chosen) < count:
+                target = self.target_queue.popleft()
+                if target not in selected and self._is_valid_target(*target):
+                    chosen.append(target)
+                    selected.add(target)
+
+        # Complète au hasard parmi les cases encore possibles, sans doublon
+        candidates = self.computer_shots.unshot if self.difficulty == "easy" else self.knowledge.unknown
+        cells = candidates.sample_distinct(count - len(chosen), random,
+                                           exclude=(y * size + x for x, y in selected))
+        chosen.extend((cell % size, cell // size) for cell in cells)
+        return chosen
+
+    def _heat_map(self) -> Tuple[int, ...]:
+        """Retourne la carte de chaleur de la connaissance courante, via le cache."""
+        knowledge = self.knowledge
+        return self.decision_cache.get_or_compute(
+            knowledge.key,
+            lambda: compute_heat_map(knowledge.cells, knowledge.size, knowledge.remaining)
+        )
 
     def _add_adjacent_targets(self, x: int, y: int):
         """Ajoute les cases adjacentes à cibler."""
@@ -147,7 +492,7 @@ class GameController:
         directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
         
         # Si on a plusieurs hits successifs, on privilégie la direction établie
-        if len(self.successful_hits) >= 2:
+        if self.targeting.follow_line and len(self.successful_hits) >= 2:
             last_hits = self.successful_hits[-2:]
             dx = last_hits[1][0] - last_hits[0][0]
             dy = last_hits[1][1] - last_hits[0][1]
@@ -165,7 +510,7 @@ class GameController:
         """Vérifie si une cible est valide."""
         return (0 <= x < self.player.board.size and 
                 0 <= y < self.player.board.size and 
-                (x, y) not in self.computer_shots)
+                self.knowledge.is_unknown(x, y))
 
     def check_game_over(self) -> Optional[Player]:
         """Vérifie si la partie est terminée.
@@ -173,8 +518,13 @@ class GameController:
         Returns:
             Optional[Player]: Le gagnant si la partie est terminée, None sinon.
         """
+        winner = None
         if self.player.has_lost():
-            return self.computer
-        if self.computer.has_lost():
-            return self.player
-        return None
\ No newline at end of file
+            winner = self.computer
+        elif self.computer.has_lost():
+            winner = self.player
+
+        if winner is not None and self.winner is None:
+            self.winner = winner
+            self._emit({'type': 'game_over', 'winner': winner.name})
+        return winner
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""Parties simulées de l'ordinateur, pour les analyses et le réglage de l'IA."""
+
+from array import array
+from typing import Dict, Iterator, Optional
+import random
+
+from src.ai import DecisionCache, TargetingParams
+from src.models.ship import Ship
+from src.utils.constants import SHOT_RESULTS
+from .game_controller import GameController
+
+# Plus grande taille de plateau que peuvent enregistrer les colonnes de coordonnées ('H')
+MAX_BOARD_SIZE = 0xFFFF
+
+
+class GameRecord:
+    """Déroulé compact d'une partie simulée.
+
+    Chaque tir occupe une ligne dans des tableaux parallèles : tour, coordonnées,
+    code SHOT_RESULTS, taille du navire touché (0 si manqué) et, pour un tir qui
+    coule, le nombre de tirs écoulés depuis la première touche sur ce navire.
+    Les coordonnées tiennent sur 16 bits (voir MAX_BOARD_SIZE) ; le nombre de
+    tirs avant de couler, qui peut dépasser 65535 sur un grand plateau, sur 32.
+    """
+
+    __slots__ = ('game_id', 'seed', 'difficulty', 'mode', 'board_size',
+                 'turn', 'x', 'y', 'result', 'ship_size', 'sink_shots')
+
+    def __init__(self, game_id: int, seed: int, difficulty: str, mode: str, board_size: int):
+        self.game_id = game_id
+        self.seed = seed
+        self.difficulty = difficulty
+        self.mode = mode
+        self.board_size = board_size
+        self.turn = array('I')
+        self.x = array('H')
+        self.y = array('H')
+        self.result = array('B')
+        self.ship_size = array('B')
+        self.sink_shots = array('I')
+
+    @property
+    def turns(self) -> int:
+        """Nombre de tours joués."""
+        return self.turn[-1] + 1 if self.turn else 0
+
+    @property
+    def shots(self) -> int:
+        """Nombre de tirs effectués."""
+        return len(self.result)
+
+
+def play_computer_game(game: GameController, record: GameRecord) -> GameRecord:
+    """Fait tirer l'ordinateur sur la flotte du joueur jusqu'à la couler entièrement.
+
+    Args:
+        game (GameController): Partie initialisée, flottes placées.
+        record (GameRecord): Enregistrement à compléter.
+
+    Returns:
+        GameRecord: L'enregistrement complété.
+    """
+    board = game.player.board
+    hit_codes = (SHOT_RESULTS['HIT'], SHOT_RESULTS['SUNK'])
+    first_hit: Dict[Ship, int] = {}
+    turn = 0
+
+    while not game.player.has_lost():
+        if game.mode == "salvo":
+            coordinates, results, _ = game.handle_computer_salvo()
+        else:
+            x, y, already_shot, hit, ship = game.handle_computer_shot()
+            coordinates = [(x, y)]
+            if already_shot:
+                code = SHOT_RESULTS['ALREADY_SHOT']
+            elif ship is not None:
+                code = SHOT_RESULTS['SUNK']
+            else:
+                code = SHOT_RESULTS['HIT'] if hit else SHOT_RESULTS['MISS']
+            results = (code,)
+
+        for (x, y), code in zip(coordinates, results):
+            shot_index = len(record.result)
+            ship = board.get_ship_at(x, y) if code in hit_codes else None
+            sink_shots = 0
+            if ship is not None:
+                first_hit.setdefault(ship, shot_index)
+                if code == SHOT_RESULTS['SUNK']:
+                    sink_shots = shot_index - first_hit[ship] + 1
+
+            record.turn.append(turn)
+            record.x.append(x)
+            record.y.append(y)
+            record.result.append(code)
+            record.ship_size.append(ship.size if ship else 0)
+            record.sink_shots.append(sink_shots)
+        turn += 1
+
+    return record
+
+
+def simulate_games(count: int, difficulty: str = "normal", mode: str = "classic",
+                   no_touch: Optional[bool] = None, seed: int = 0,
+                   decision_cache: Optional[DecisionCache] = None,
+                   board_size: Optional[int] = None,
+                   targeting: Optional[TargetingParams] = None) -> Iterator[GameRecord]:
+    """Produit des parties simulées, une à la fois.
+
+    Chaque partie utilise la graine `seed + numéro` pour le générateur aléatoire
+    global du module `random` (celui qu'utilise GameController) : une partie se
+    rejoue à l'identique à partir de son enregistrement. Les deux flottes sont
+    placées ; seule celle du joueur est visée, si bien qu'en mode salve
+    l'ordinateur tire une fois par navire de sa flotte complète à chaque tour.
+
+    Args:
+        count (int): Nombre de parties.
+        difficulty (str): Difficulté de l'ordinateur.
+        mode (str): Mode de jeu ("classic" ou "salvo").
+        no_touch (Optional[bool]): Règle des navires non contigus.
+        seed (int): Graine de la première partie.
+        decision_cache (Optional[DecisionCache]): Cache de décisions de l'IA.
+        board_size (Optional[int]): Taille des plateaux (par défaut celle de la configuration).
+        targeting (Optional[TargetingParams]): Réglages de l'IA du mode normal.
+
+    Yields:
+        GameRecord: Déroulé de chaque partie.
+
+    Raises:
+        ValueError: Si les plateaux dépassent MAX_BOARD_SIZE.
+    """
+    if board_size is not None and board_size > MAX_BOARD_SIZE:
+        raise ValueError(f"Taille de plateau trop grande pour l'enregistrement : {board_size}")
+    for game_id in range(count):
+        game_seed = seed + game_id
+        random.seed(game_seed)
+        game = GameController(difficulty, decision_cache=decision_cache, mode=mode,
+                              no_touch=no_touch, board_size=board_size, targeting=targeting)
+        game.place_player_ships_randomly()
+        # La flotte de l'ordinateur fixe la taille de ses salves
+        for ship in game.computer.initialize_ships():
+            game.place_computer_ship_randomly(ship)
+        record = GameRecord(game_id, game_seed, difficulty, mode, game.player.board.size)
+        yield play_computer_game(game, record)
@@ -0,0 +1,264 @@
+"""Réglage des paramètres de l'IA par parties simulées, en parallèle et avec reprise."""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import argparse
+import json
+import logging
+import os
+import random
+
+from src.ai import TargetingParams, save_difficulty
+from .simulation import simulate_games
+
+CHECKPOINT_VERSION = 1
+
+# Tirages par candidat avant de se contenter d'une population plus petite
+# (l'espace des paramètres ne compte que quelques centaines de réglages distincts)
+MAX_ATTEMPTS_PER_CANDIDATE = 100
+
+
+class Candidate:
+    """Jeu de paramètres évalué et résultats cumulés de ses parties."""
+
+    __slots__ = ('params', 'games', 'shots')
+
+    def __init__(self, params: TargetingParams, games: int = 0, shots: int = 0):
+        self.params = params
+        self.games = games
+        self.shots = shots
+
+    @property
+    def mean(self) -> float:
+        """Nombre moyen de tirs pour couler la flotte (plus bas = meilleur)."""
+        return self.shots / self.games if self.games else float('inf')
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'params': self.params.to_dict(), 'games': self.games, 'shots': self.shots}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Candidate':
+        return cls(TargetingParams.from_dict(data['params']), data['games'], data['shots'])
+
+
+def evaluate_batch(task: Tuple) -> Tuple[int, int, int]:
+    """Travail d'un processus : joue un lot de parties avec un jeu de paramètres.
+
+    Args:
+        task (tuple): (rang du candidat, paramètres, première graine, nombre de
+            parties, mode, règle non contiguë, taille du plateau).
+
+    Returns:
+        tuple: (rang du candidat, parties jouées, tirs cumulés).
+    """
+    index, params, seed, count, mode, no_touch, board_size = task
+    targeting = TargetingParams.from_dict(params)
+    shots = sum(record.shots for record in simulate_games(
+        count, "normal", mode, no_touch, seed, board_size=board_size, targeting=targeting
+    ))
+    return index, count, shots
+
+
+def random_params(rng: random.Random) -> TargetingParams:
+    """Tire un jeu de paramètres au hasard."""
+    return TargetingParams(
+        parity=rng.random() < 0.5,
+        heat_hunt=round(rng.random(), 2),
+        follow_line=rng.random() < 0.5,
+        clear_on_sink=rng.random() < 0.5
+    )
+
+
+def mutate(params: TargetingParams, rng: random.Random) -> TargetingParams:
+    """Retourne une variante d'un jeu de paramètres (au moins un réglage change).
+
+    Args:
+        params (TargetingParams): Parent.
+        rng (random.Random): Générateur.
+
+    Returns:
+        TargetingParams: Enfant.
+    """
+    child = TargetingParams.from_dict(params.to_dict())
+    while child == params:
+        if rng.random() < 0.25:
+            child.parity = not child.parity
+        if rng.random() < 0.15:
+            child.follow_line = not child.follow_line
+        if rng.random() < 0.15:
+            child.clear_on_sink = not child.clear_on_sink
+        if rng.random() < 0.5:
+            child.heat_hunt = round(min(1.0, max(0.0, child.heat_hunt + rng.gauss(0, 0.2))), 2)
+    return child
+
+
+class Tuner:
+    """Recherche évolutionnaire élitiste des paramètres de ciblage.
+
+    À chaque génération, tous les candidats jouent le même bloc de parties
+    (mêmes graines, donc mêmes flottes adverses), ce qui rend les comparaisons
+    moins bruitées ; les élites conservées rejouent chaque nouveau bloc et leur
+    moyenne s'affine. Les lots de parties sont répartis entre les processus sans
+    autre échange que leurs totaux, si bien que le débit croît avec le nombre de
+    cœurs. L'état est écrit sur disque après chaque génération.
+    """
+
+    def __init__(self, checkpoint: str, population: int = 12, elite: int = 4, games: int = 200,
+                 chunk: int = 50, workers: int = 1, mode: str = "classic", no_touch: bool = False,
+                 board_size: Optional[int] = None, seed: int = 0):
+        """Initialise la recherche, ou la reprend si le fichier d'état existe.
+
+        Args:
+            checkpoint (str): Fichier JSON de l'état de la recherche.
+            population (int): Candidats par génération.
+            elite (int): Candidats conservés d'une génération à l'autre.
+            games (int): Parties jouées par candidat et par génération.
+            chunk (int): Parties par tâche envoyée à un processus.
+            workers (int): Nombre de processus.
+            mode (str): Mode de jeu des parties ("classic" ou "salvo").
+            no_touch (bool): Règle des navires non contigus.
+            board_size (Optional[int]): Taille des plateaux.
+            seed (int): Graine de la recherche.
+        """
+        self.checkpoint = checkpoint
+        self.workers = workers
+        self.chunk = chunk
+        self.settings = {
+            'population': population, 'elite': min(elite, population), 'games': games,
+            'mode': mode, 'no_touch': no_touch, 'board_size': board_size, 'seed': seed
+        }
+        self.generation = 0
+        self.candidates: List[Candidate] = []
+        self.history: List[Dict[str, Any]] = []
+        if os.path.exists(checkpoint):
+            self.load()
+
+    def load(self):
+        """Reprend une recherche depuis son fichier d'état (ses réglages l'emportent)."""
+        with open(self.checkpoint, encoding='utf-8') as stream:
+            data = json.load(stream)
+        if data.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Fichier d'état incompatible : {self.checkpoint}")
+        self.settings = data['settings']
+        self.generation = data['generation']
+        self.candidates = [Candidate.from_dict(item) for item in data['candidates']]
+        self.history = data['history']
+        logging.info(f"Reprise à la génération {self.generation} ({self.checkpoint})")
+
+    def save(self):
+        """Écrit l'état de la recherche (remplacement atomique du fichier)."""
+        data = {
+            'version': CHECKPOINT_VERSION,
+            'settings': self.settings,
+            'generation': self.generation,
+            'candidates': [candidate.to_dict() for candidate in self.candidates],
+            'history': self.history
+        }
+        directory = os.path.dirname(os.path.abspath(self.checkpoint))
+        os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.checkpoint}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as stream:
+            json.dump(data, stream, indent=2)
+        os.replace(temporary, self.checkpoint)
+
+    @property
+    def best(self) -> Optional[Candidate]:
+        """Meilleur candidat évalué."""
+        return min(self.candidates, key=lambda candidate: candidate.mean, default=None)
+
+    def _next_population(self) -> List[Candidate]:
+        """Élites de la génération précédente complétées par leurs variantes."""
+        rng = random.Random(f"{self.settings['seed']}:{self.generation}")
+        size = self.settings['population']
+        if not self.candidates:
+            population = [Candidate(TargetingParams())]
+        else:
+            ranked = sorted(self.candidates, key=lambda candidate: candidate.mean)
+            population = ranked[:self.settings['elite']]
+        parents = list(population)
+
+        seen = {candidate.params for candidate in population}
+        attempts = 0
+        while len(population) < size and attempts < MAX_ATTEMPTS_PER_CANDIDATE * size:
+            attempts += 1
+            params = mutate(rng.choice(parents).params, rng) if attempts < 20 * size else random_params(rng)
+            if params not in seen:
+                seen.add(params)
+                population.append(Candidate(params))
+        if len(population) < size:
+            logging.warning(f"Seulement {len(population)} jeux de paramètres distincts trouvés "
+                            f"sur {size} demandés")
+        return population
+
+    def _tasks(self, population: List[Candidate]) -> Iterator[Tuple]:
+        """Découpe les parties de la génération en lots indépendants."""
+        settings = self.settings
+        games = settings['games']
+        first_seed = settings['seed'] + self.generation * games
+        for index, candidate in enumerate(population):
+            params = candidate.params.to_dict()
+            for start in range(0, games, self.chunk):
+                yield (index, params, first_seed + start, min(self.chunk, games - start),
+                       settings['mode'], settings['no_touch'], settings['board_size'])
+
+    def run(self, generations: int) -> Candidate:
+        """Poursuit la recherche jusqu'à la génération demandée.
+
+        Args:
+            generations (int): Nombre total de générations.
+
+        Returns:
+            Candidate: Meilleur candidat.
+        """
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            while self.generation < generations:
+                population = self._next_population()
+                results = pool.map(evaluate_batch, self._tasks(population)) if pool else \
+                    map(evaluate_batch, self._tasks(population))
+                for index, games, shots in results:
+                    population[index].games += games
+                    population[index].shots += shots
+
+                self.candidates = population
+                self.generation += 1
+                best = self.best
+                self.history.append({'generation': self.generation, 'mean': best.mean,
+                                     'params': best.params.to_dict()})
+                self.save()
+                logging.info(f"Génération {self.generation} : {best.mean:.2f} tirs en moyenne "
+                             f"sur {best.games} parties avec {best.params}")
+        finally:
+            if pool:
+                pool.shutdown()
+        return self.best
+
+
+def main(argv: Optional[List[str]] = None):
+    """Point d'entrée en ligne de commande : python -m src.controllers.tuning."""
+    parser = argparse.ArgumentParser(description="Réglage des paramètres de l'IA par parties simulées.")
+    parser.add_argument('--checkpoint', default='tuning.json')
+    parser.add_argument('--generations', type=int, default=20)
+    parser.add_argument('--population', type=int, default=12)
+    parser.add_argument('--elite', type=int, default=4)
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--chunk', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--mode', default='classic', choices=['classic', 'salvo'])
+    parser.add_argument('--no-touch', action='store_true')
+    parser.add_argument('--size', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--export', metavar='NOM', help="Enregistre le meilleur réglage comme difficulté")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    tuner = Tuner(args.checkpoint, args.population, args.elite, args.games, args.chunk, args.workers,
+                  args.mode, args.no_touch, args.size, args.seed)
+    best = tuner.run(args.generations)
+    if args.export and best is not None:
+        save_difficulty(args.export, best.params)
+        logging.info(f"Difficulté '{args.export}' enregistrée : {best.params}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,9 @@
 from src.models.board import Board
+from src.models.board_state import BoardState, PersistentBytes, ShipPlacement
+from src.models.cell_sampler import CellSampler
 from src.models.player import Player
 from src.models.ship import Ship
+from src.models.shot_ledger import ShotLedger
 
-__all__ = ['Ship', 'Board', 'Player']
\ No newline at end of file
+__all__ = ['Ship', 'Board', 'BoardState', 'PersistentBytes', 'ShipPlacement', 'CellSampler', 'Player',
+           'ShotLedger']
\ No newline at end of file
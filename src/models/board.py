@@ -1,20 +1,96 @@
-from typing import List, Optional, Tuple, Set
+from array import array
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+from .board_state import BoardState
 from .ship import Ship
+from .shot_ledger import ShotLedger
+from ..utils.constants import CELL_STATES, SHOT_RESULTS
+
+
+@lru_cache(maxsize=None)
+def placement_masks(size: int, length: int) -> Tuple[Tuple[int, ...], ...]:
+    """Précalcule les masques de bits d'une ligne pour chaque placement d'un navire.
+
+    Les masques ne dépendent que de la colonne de départ : un placement en (x, y)
+    se vérifie en appliquant le masque de la colonne x aux lignes concernées.
+
+    Args:
+        size (int): Taille du plateau.
+        length (int): Taille du navire.
+
+    Returns:
+        tuple: (emprise horizontale, halo horizontal, emprise verticale, halo vertical),
+        chacun indexé par la colonne de départ. Le halo comprend l'emprise et
+        toutes les cases voisines, diagonales comprises.
+    """
+    def span(first: int, last: int) -> int:
+        first, last = max(first, 0), min(last, size - 1)
+        return ((1 << (last - first + 1)) - 1) << first
+
+    columns = range(size)
+    return (
+        tuple(span(x, x + length - 1) for x in columns),
+        tuple(span(x - 1, x + length) for x in columns),
+        tuple(1 << x for x in columns),
+        tuple(span(x - 1, x + 1) for x in columns)
+    )
+
 
 class Board:
-    """Représente un plateau de jeu de bataille navale."""
+    """Représente un plateau de jeu de bataille navale.
+
+    Les cases sont indexées à plat (y * size + x). La grille d'occupation stocke
+    pour chaque case le numéro du navire (rang dans `ships` + 1) ou 0 si elle est vide ;
+    `rows` garde en parallèle un masque de bits des cases occupées par ligne.
 
-    def __init__(self, size: int = 10):
+    `cells` contient l'état visible de chaque case (codes CELL_STATES), tenu à
+    jour à chaque placement et à chaque tir. Il est exposé sans copie, en lecture
+    seule, par `cell_buffer` ; `version` augmente à chaque modification, ce qui
+    permet à un lecteur de savoir si sa dernière lecture est encore valable.
+    """
+
+    __slots__ = ('size', 'no_touch', 'ships', 'sunken_ships', 'shots', 'grid', 'rows',
+                 'cells', 'version', '_cell_buffer')
+
+    def __init__(self, size: int = 10, no_touch: bool = False):
         """Initialise un nouveau plateau.
 
         Args:
             size (int): Taille du plateau (par défaut 10x10).
+            no_touch (bool): True si les navires ne peuvent pas se toucher,
+                même en diagonale.
         """
         self.size = size
+        self.no_touch = no_touch
         self.ships: List[Ship] = []
         self.sunken_ships: List[Ship] = []
-        self.shots: Set[Tuple[int, int]] = set()
-        self.grid = [[None for _ in range(size)] for _ in range(size)]
+        self.shots = ShotLedger(size)
+        self.grid = bytearray(size * size)
+        self.rows = [0] * size
+        self.cells = bytearray(size * size)  # CELL_STATES['EMPTY'] vaut 0
+        self.version = 0
+        self._cell_buffer = memoryview(self.cells).toreadonly()
+
+    @property
+    def cell_buffer(self) -> memoryview:
+        """Vue en lecture seule, sans copie, des états de toutes les cases.
+
+        Un octet par case, indexé par y * size + x, avec les codes de CELL_STATES.
+        La vue reflète toujours l'état courant du plateau : un lecteur qui veut
+        figer un instantané le copie (`bytes(board.cell_buffer)`) en notant `version`.
+        """
+        return self._cell_buffer
+
+    def _mark_sunk(self, ship: Ship):
+        """Passe les cases d'un navire coulé à l'état 'SUNK'."""
+        sunk = CELL_STATES['SUNK']
+        for cell in ship.cells:
+            self.cells[cell] = sunk
+
+    def _ship_at_index(self, cell: int) -> Optional[Ship]:
+        """Retourne le navire occupant une case, à partir de son indice."""
+        number = self.grid[cell]
+        return self.ships[number - 1] if number else None
 
     def can_place_ship(self, ship: Ship, x: int, y: int, horizontal: bool) -> bool:
         """Vérifie si un navire peut être placé à une position donnée.
@@ -28,14 +104,44 @@ class Board:
         Returns:
             bool: True si le placement est possible.
         """
+        size = self.size
+        footprint_h, halo_h, footprint_v, halo_v = placement_masks(size, ship.size)
         if horizontal:
-            if x < 0 or x + ship.size > self.size or y < 0 or y >= self.size:
+            if x < 0 or x + ship.size > size or y < 0 or y >= size:
                 return False
-            return all(self.grid[y][x + i] is None for i in range(ship.size))
+            if not self.no_touch:
+                return not self.rows[y] & footprint_h[x]
+            mask, first, last = halo_h[x], y - 1, y + 1
         else:
-            if y < 0 or y + ship.size > self.size or x < 0 or x >= self.size:
+            if y < 0 or y + ship.size > size or x < 0 or x >= size:
                 return False
-            return all(self.grid[y + i][x] is None for i in range(ship.size))
+            if self.no_touch:
+                mask, first, last = halo_v[x], y - 1, y + ship.size
+            else:
+                mask, first, last = footprint_v[x], y, y + ship.size - 1
+
+        rows = self.rows
+        for row in range(max(first, 0), min(last, size - 1) + 1):
+            if rows[row] & mask:
+                return False
+        return True
+
+    def valid_placements(self, ship: Ship) -> List[Tuple[int, int, bool]]:
+        """Énumère tous les placements encore possibles pour un navire.
+
+        Args:
+            ship (Ship): Le navire à placer.
+
+        Returns:
+            List[Tuple[int, int, bool]]: Placements (x, y, horizontal) valides.
+        """
+        return [
+            (x, y, horizontal)
+            for horizontal in (True, False)
+            for y in range(self.size)
+            for x in range(self.size)
+            if self.can_place_ship(ship, x, y, horizontal)
+        ]
 
     def place_ship(self, ship: Ship, x: int, y: int, horizontal: bool) -> bool:
         """Place un navire sur le plateau.
@@ -52,17 +158,23 @@ class Board:
         if not self.can_place_ship(ship, x, y, horizontal):
             return False
 
-        positions = []
-        for i in range(ship.size):
-            if horizontal:
-                self.grid[y][x + i] = ship
-                positions.append((x + i, y))
-            else:
-                self.grid[y + i][x] = ship
-                positions.append((x, y + i))
+        if len(self.ships) >= 255:
+            return False
+
+        step = 1 if horizontal else self.size
+        start = y * self.size + x
+        cells = tuple(range(start, start + ship.size * step, step))
 
-        ship.positions = positions
         self.ships.append(ship)
+        number = len(self.ships)
+        ship_state = CELL_STATES['SHIP']
+        for cell in cells:
+            self.grid[cell] = number
+            self.rows[cell // self.size] |= 1 << (cell % self.size)
+            self.cells[cell] = ship_state
+
+        ship.place(cells, self.size)
+        self.version += 1
         return True
 
     def receive_shot(self, x: int, y: int) -> Tuple[bool, bool, Optional[Ship]]:
@@ -78,22 +190,118 @@ class Board:
         if not self.is_valid_position(x, y):
             return True, False, None
 
-        if (x, y) in self.shots:
+        cell = y * self.size + x
+        if not self.shots.add_index(cell):
             return True, False, None
 
-        self.shots.add((x, y))
-        ship = self.grid[y][x]
+        ship = self._ship_at_index(cell)
+        self.version += 1
 
         if ship is None:
+            self.cells[cell] = CELL_STATES['MISS']
             return False, False, None
 
-        hit = ship.hit(x, y)
+        self.cells[cell] = CELL_STATES['HIT']
+        ship.hit_cell(cell)
         if ship.is_sunk() and ship not in self.sunken_ships:
             self.sunken_ships.append(ship)
+            self._mark_sunk(ship)
             return False, True, ship
 
         return False, True, None
 
+    def receive_shots(self, coordinates: Iterable[Tuple[int, int]]) -> array:
+        """Reçoit une salve de tirs et la résout en une seule passe.
+
+        Un tir répété dans la même salve est traité comme déjà tiré.
+
+        Args:
+            coordinates (Iterable[Tuple[int, int]]): Coordonnées (x, y) des tirs.
+
+        Returns:
+            array: Un code SHOT_RESULTS par tir, dans l'ordre de la salve.
+        """
+        already_shot = SHOT_RESULTS['ALREADY_SHOT']
+        miss = SHOT_RESULTS['MISS']
+        hit = SHOT_RESULTS['HIT']
+        sunk = SHOT_RESULTS['SUNK']
+
+        size = self.size
+        add_shot = self.shots.add_index
+        grid = self.grid
+        cells = self.cells
+        ships = self.ships
+        miss_state, hit_state = CELL_STATES['MISS'], CELL_STATES['HIT']
+        results = array('B')
+        append = results.append
+
+        for x, y in coordinates:
+            if not (0 <= x < size and 0 <= y < size):
+                append(already_shot)
+                continue
+
+            cell = y * size + x
+            if not add_shot(cell):
+                append(already_shot)
+                continue
+
+            number = grid[cell]
+            if not number:
+                cells[cell] = miss_state
+                append(miss)
+                continue
+
+            cells[cell] = hit_state
+            ship = ships[number - 1]
+            ship.hit_cell(cell)
+            if ship.is_sunk() and ship not in self.sunken_ships:
+                self.sunken_ships.append(ship)
+                self._mark_sunk(ship)
+                append(sunk)
+            else:
+                append(hit)
+
+        if results:
+            self.version += 1
+        return results
+
+    def restore(self, state: BoardState):
+        """Remet le plateau dans l'état d'une version persistante.
+
+        Le plateau est entièrement reconstruit (O(size²)) : les navires sont
+        recréés à partir de la version et les tirs rejoués. Seules les opérations
+        de BoardState profitent du partage de structure ; restaurer est une copie
+        unique, réservée aux actions ponctuelles comme l'annulation d'un placement.
+        Le registre de tirs reste le même objet, toujours partagé avec le tireur.
+
+        Args:
+            state (BoardState): Version à restaurer (de même taille).
+        """
+        if state.size != self.size:
+            raise ValueError("La version restaurée n'a pas la taille du plateau")
+
+        self.ships = []
+        self.sunken_ships = []
+        self.shots.clear()
+        self.grid[:] = bytes(len(self.grid))
+        self.rows = [0] * self.size
+        self.cells[:] = bytes(len(self.cells))
+
+        size = self.size
+        for placement in state.ships:
+            if not placement.cells:
+                continue  # Navire créé mais jamais placé
+            first = placement.cells[0]
+            horizontal = placement.size == 1 or placement.cells[1] - first == 1
+            self.place_ship(Ship(placement.name, placement.size), first % size, first // size, horizontal)
+
+        shot_states = (CELL_STATES['MISS'], CELL_STATES['HIT'], CELL_STATES['SUNK'])
+        cells = state.tobytes()
+        self.receive_shots([
+            (cell % size, cell // size) for cell in range(size * size) if cells[cell] in shot_states
+        ])
+        self.version += 1
+
     def is_valid_position(self, x: int, y: int) -> bool:
         """Vérifie si les coordonnées sont valides.
 
@@ -118,7 +326,7 @@ class Board:
         """
         if not self.is_valid_position(x, y):
             return None
-        return self.grid[y][x]
+        return self._ship_at_index(y * self.size + x)
 
     def all_ships_sunk(self) -> bool:
         """Vérifie si tous les navires sur le plateau sont coulés.
@@ -128,11 +336,33 @@ class Board:
         """
         return all(ship.is_sunk() for ship in self.ships)
     
+    def get_region(self, x: int, y: int, width: int, height: int) -> List[memoryview]:
+        """Retourne les états des cases d'une région rectangulaire, sans copie.
+
+        La région est rognée aux limites du plateau : seules les cases demandées
+        sont lues, quelle que soit la taille du plateau.
+
+        Args:
+            x (int): Colonne du coin supérieur gauche.
+            y (int): Ligne du coin supérieur gauche.
+            width (int): Largeur en cases.
+            height (int): Hauteur en cases.
+
+        Returns:
+            List[memoryview]: Une tranche de `cell_buffer` (codes CELL_STATES) par
+            ligne de la région.
+        """
+        size = self.size
+        first_x, last_x = max(x, 0), min(x + width, size)
+        first_y, last_y = max(y, 0), min(y + height, size)
+        buffer = self._cell_buffer
+        return [
+            buffer[row * size + first_x:row * size + last_x]
+            for row in range(first_y, last_y)
+        ]
+
     def get_cell_state(self, x: int, y: int) -> int:
-        """Retourne l'état d'une case (vide, navire, touché, manqué)."""
+        """Retourne l'état d'une case (vide, navire, touché, manqué, coulé)."""
         if not self.is_valid_position(x, y):
             return CELL_STATES['EMPTY']
-        if (x, y) in self.shots:
-            return CELL_STATES['HIT'] if self.grid[y][x] else CELL_STATES['MISS']
-        return CELL_STATES['SHIP'] if self.grid[y][x] else CELL_STATES['EMPTY']
-
+        return self.cells[y * self.size + x]
@@ -0,0 +1,309 @@
+from array import array
+from typing import Dict, Iterable, Optional, Tuple
+from ..utils.constants import CELL_STATES, SHOT_RESULTS
+
+# Cases par feuille et enfants par nœud du trie (puissance de deux)
+_LEAF_BITS = 4
+_LEAF_SIZE = 1 << _LEAF_BITS
+_BRANCH_BITS = 4
+_BRANCH_MASK = (1 << _BRANCH_BITS) - 1
+
+
+class PersistentBytes:
+    """Tableau d'octets immuable à partage de structure.
+
+    Les octets sont rangés dans des feuilles de 16 octets, elles-mêmes
+    regroupées par 16 dans des nœuds (tuples). Une modification ne recopie que
+    les feuilles et les nœuds sur le chemin des cases modifiées : les autres
+    sont partagés avec la version précédente, qui reste valable.
+    """
+
+    __slots__ = ('length', 'depth', 'root')
+
+    def __init__(self, length: int, depth: int, root):
+        self.length = length
+        self.depth = depth
+        self.root = root
+
+    @classmethod
+    def zeros(cls, length: int) -> 'PersistentBytes':
+        """Crée un tableau de `length` octets nuls."""
+        return cls.from_bytes(bytes(length))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'PersistentBytes':
+        """Crée un tableau à partir d'octets existants (copie en O(n))."""
+        nodes = [bytes(data[start:start + _LEAF_SIZE]).ljust(_LEAF_SIZE, b'\0')
+                 for start in range(0, max(len(data), 1), _LEAF_SIZE)]
+        depth = 0
+        while len(nodes) > 1 or depth == 0:
+            step = 1 << _BRANCH_BITS
+            nodes = [tuple(nodes[start:start + step]) for start in range(0, len(nodes), step)]
+            depth += 1
+        return cls(len(data), depth, nodes[0])
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> int:
+        node = self.root
+        for level in range(self.depth, 0, -1):
+            node = node[(index >> (_LEAF_BITS + _BRANCH_BITS * (level - 1))) & _BRANCH_MASK]
+        return node[index & (_LEAF_SIZE - 1)]
+
+    def update(self, changes: Dict[int, int]) -> 'PersistentBytes':
+        """Retourne une nouvelle version avec les valeurs modifiées.
+
+        Args:
+            changes (Dict[int, int]): Nouvelle valeur de chaque indice modifié.
+
+        Returns:
+            PersistentBytes: Nouvelle version, qui partage tout le reste avec celle-ci.
+        """
+        if not changes:
+            return self
+        return PersistentBytes(self.length, self.depth, self._update(self.root, self.depth, sorted(changes.items())))
+
+    def _update(self, node, level: int, changes):
+        """Recopie un nœud en appliquant les modifications qui le concernent."""
+        if level == 0:
+            leaf = bytearray(node)
+            for index, value in changes:
+                leaf[index & (_LEAF_SIZE - 1)] = value
+            return bytes(leaf)
+
+        shift = _LEAF_BITS + _BRANCH_BITS * (level - 1)
+        children = list(node)
+        start = 0
+        while start < len(changes):
+            child = (changes[start][0] >> shift) & _BRANCH_MASK
+            end = start + 1
+            while end < len(changes) and (changes[end][0] >> shift) & _BRANCH_MASK == child:
+                end += 1
+            children[child] = self._update(children[child], level - 1, changes[start:end])
+            start = end
+        return tuple(children)
+
+    def tobytes(self) -> bytes:
+        """Retourne tous les octets à la suite (O(n))."""
+        def leaves(node, level):
+            if level == 0:
+                yield node
+                return
+            for child in node:
+                yield from leaves(child, level - 1)
+
+        return b''.join(leaves(self.root, self.depth))[:self.length]
+
+
+class ShipPlacement:
+    """Navire placé dans une version de plateau (immuable)."""
+
+    __slots__ = ('name', 'size', 'cells')
+
+    def __init__(self, name: str, size: int, cells: Tuple[int, ...]):
+        self.name = name
+        self.size = size
+        self.cells = cells
+
+
+class BoardState:
+    """Version immuable d'un plateau, partageant sa structure avec les précédentes.
+
+    Placer un navire ou tirer retourne une nouvelle version en ne recopiant que
+    les cases modifiées (et leur chemin dans le trie) ; l'ancienne version reste
+    utilisable. Garder une liste de versions suffit donc pour annuler, et une IA
+    qui explore plusieurs coups part de la même version sans copier le plateau.
+
+    `cells` contient l'état visible de chaque case (codes CELL_STATES) et `grid`
+    le numéro du navire qui l'occupe (rang dans `ships` + 1, 0 si vide), comme
+    dans `Board`.
+    """
+
+    __slots__ = ('size', 'no_touch', 'cells', 'grid', 'ships', 'afloat_cells', 'version')
+
+    def __init__(self, size: int, no_touch: bool, cells: PersistentBytes, grid: PersistentBytes,
+                 ships: Tuple[ShipPlacement, ...], afloat_cells: int, version: int):
+        self.size = size
+        self.no_touch = no_touch
+        self.cells = cells
+        self.grid = grid
+        self.ships = ships
+        self.afloat_cells = afloat_cells  # Cases de navire pas encore touchées
+        self.version = version
+
+    @classmethod
+    def empty(cls, size: int = 10, no_touch: bool = False) -> 'BoardState':
+        """Crée la version initiale d'un plateau vide.
+
+        Args:
+            size (int): Taille du plateau.
+            no_touch (bool): True si les navires ne peuvent pas se toucher.
+
+        Returns:
+            BoardState: Plateau sans navire ni tir.
+        """
+        blank = PersistentBytes.zeros(size * size)
+        return cls(size, no_touch, blank, blank, (), 0, 0)
+
+    @classmethod
+    def from_board(cls, board) -> 'BoardState':
+        """Fige l'état courant d'un plateau modifiable (copie unique en O(n)).
+
+        Les navires de `board.ships` qui n'ont pas été placés (sans cases) sont
+        ignorés et les autres renumérotés en conséquence.
+
+        Args:
+            board (Board): Plateau à figer.
+
+        Returns:
+            BoardState: Version équivalente, à partir de laquelle on peut explorer.
+        """
+        numbers = bytearray(256)  # Ancien numéro de navire -> nouveau
+        ships = []
+        for rank, ship in enumerate(board.ships):
+            if ship.cells:
+                ships.append(ShipPlacement(ship.name, ship.size, ship.cells))
+                numbers[rank + 1] = len(ships)
+        grid = bytes(board.grid).translate(numbers)
+        hit_states = (CELL_STATES['HIT'], CELL_STATES['SUNK'])
+        afloat = sum(1 for cell, number in enumerate(board.grid) if number and board.cells[cell] not in hit_states)
+        return cls(board.size, board.no_touch, PersistentBytes.from_bytes(board.cells),
+                   PersistentBytes.from_bytes(grid), tuple(ships), afloat, 0)
+
+    def cell_state(self, x: int, y: int) -> int:
+        """Retourne l'état d'une case (codes CELL_STATES)."""
+        if not (0 <= x < self.size and 0 <= y < self.size):
+            return CELL_STATES['EMPTY']
+        return self.cells[y * self.size + x]
+
+    def ship_at(self, x: int, y: int) -> Optional[ShipPlacement]:
+        """Retourne le navire occupant une case, ou None."""
+        if not (0 <= x < self.size and 0 <= y < self.size):
+            return None
+        number = self.grid[y * self.size + x]
+        return self.ships[number - 1] if number else None
+
+    def can_place_ship(self, length: int, x: int, y: int, horizontal: bool) -> bool:
+        """Vérifie si un navire peut être placé à une position donnée.
+
+        Args:
+            length (int): Taille du navire.
+            x (int): Coordonnée x.
+            y (int): Coordonnée y.
+            horizontal (bool): True pour placement horizontal, False pour vertical.
+
+        Returns:
+            bool: True si le placement est possible.
+        """
+        size = self.size
+        width, height = (length, 1) if horizontal else (1, length)
+        if x < 0 or y < 0 or x + width > size or y + height > size:
+            return False
+        margin = 1 if self.no_touch else 0
+        grid = self.grid
+        for row in range(max(y - margin, 0), min(y + height + margin, size)):
+            for column in range(max(x - margin, 0), min(x + width + margin, size)):
+                if grid[row * size + column]:
+                    return False
+        return True
+
+    def place_ship(self, name: str, length: int, x: int, y: int, horizontal: bool) -> 'BoardState':
+        """Retourne la version où un navire est placé.
+
+        Args:
+            name (str): Nom du navire.
+            length (int): Taille du navire.
+            x (int): Coordonnée x.
+            y (int): Coordonnée y.
+            horizontal (bool): True pour placement horizontal, False pour vertical.
+
+        Returns:
+            BoardState: Nouvelle version.
+
+        Raises:
+            ValueError: Si le placement est impossible.
+        """
+        if not self.can_place_ship(length, x, y, horizontal) or len(self.ships) >= 255:
+            raise ValueError(f"Impossible de placer le {name} en ({x}, {y})")
+
+        step = 1 if horizontal else self.size
+        start = y * self.size + x
+        cells = tuple(range(start, start + length * step, step))
+        number = len(self.ships) + 1
+        ship_state = CELL_STATES['SHIP']
+        return BoardState(
+            self.size, self.no_touch,
+            self.cells.update({cell: ship_state for cell in cells}),
+            self.grid.update({cell: number for cell in cells}),
+            self.ships + (ShipPlacement(name, length, cells),),
+            self.afloat_cells + length,
+            self.version + 1
+        )
+
+    def receive_shot(self, x: int, y: int) -> Tuple['BoardState', int]:
+        """Retourne la version après un tir, avec son résultat.
+
+        Args:
+            x (int): Coordonnée x du tir.
+            y (int): Coordonnée y du tir.
+
+        Returns:
+            tuple: (nouvelle version, code SHOT_RESULTS). Un tir déjà joué ou hors
+            du plateau retourne cette même version.
+        """
+        state, results = self.receive_shots(((x, y),))
+        return state, results[0]
+
+    def receive_shots(self, coordinates: Iterable[Tuple[int, int]]) -> Tuple['BoardState', array]:
+        """Retourne la version après une salve, avec un résultat par tir.
+
+        Args:
+            coordinates (Iterable[Tuple[int, int]]): Coordonnées (x, y) des tirs.
+
+        Returns:
+            tuple: (nouvelle version, un code SHOT_RESULTS par tir).
+        """
+        size = self.size
+        cells, grid = self.cells, self.grid
+        empty, ship_state = CELL_STATES['EMPTY'], CELL_STATES['SHIP']
+        hit_state, sunk_state = CELL_STATES['HIT'], CELL_STATES['SUNK']
+        changes: Dict[int, int] = {}
+        afloat = self.afloat_cells
+        results = array('B')
+
+        for x, y in coordinates:
+            cell = y * size + x
+            state = changes.get(cell, cells[cell]) if 0 <= x < size and 0 <= y < size else None
+            if state not in (empty, ship_state):
+                results.append(SHOT_RESULTS['ALREADY_SHOT'])
+                continue
+
+            number = grid[cell]
+            if not number:
+                changes[cell] = CELL_STATES['MISS']
+                results.append(SHOT_RESULTS['MISS'])
+                continue
+
+            changes[cell] = hit_state
+            afloat -= 1
+            ship = self.ships[number - 1]
+            if all(changes.get(part, cells[part]) == hit_state for part in ship.cells):
+                for part in ship.cells:
+                    changes[part] = sunk_state
+                results.append(SHOT_RESULTS['SUNK'])
+            else:
+                results.append(SHOT_RESULTS['HIT'])
+
+        if not changes:
+            return self, results
+        return BoardState(size, self.no_touch, cells.update(changes), grid, self.ships, afloat,
+                          self.version + 1), results
+
+    def all_ships_sunk(self) -> bool:
+        """Vérifie si tous les navires placés sont coulés."""
+        return self.afloat_cells == 0
+
+    def tobytes(self) -> bytes:
+        """États de toutes les cases (codes CELL_STATES), indexés par y * size + x."""
+        return self.cells.tobytes()
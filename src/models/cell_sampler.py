@@ -0,0 +1,131 @@
+from array import array
+from typing import Iterable, List, Optional
+import random
+
+
+class CellSampler:
+    """Ensemble de cases avec tirage uniforme, ajout et retrait en O(1).
+
+    Les cases présentes sont rangées dans deux tableaux, un par couleur de damier
+    ((x + y) % 2) ; `_positions` donne la place de chaque case dans le sien.
+    Retirer une case la remplace par la dernière de son tableau : l'ordre n'est
+    pas conservé mais aucune recherche n'est nécessaire. Le tirage ne dépend donc
+    pas du nombre de cases déjà retirées, contrairement à un tirage par rejet.
+    """
+
+    __slots__ = ('size', '_cells', '_positions')
+
+    def __init__(self, size: int, cells: Optional[Iterable[int]] = None):
+        """Initialise l'ensemble.
+
+        Args:
+            size (int): Taille du plateau.
+            cells (Optional[Iterable[int]]): Indices (y * size + x) des cases
+                présentes au départ (par défaut toutes).
+        """
+        self.size = size
+        total = size * size
+        typecode = 'H' if total <= 0xFFFF else 'I'
+        self._cells = (array(typecode), array(typecode))
+        self._positions = array(typecode, [total]) * total  # `total` : case absente
+        for cell in (range(total) if cells is None else cells):
+            self.add(cell)
+
+    def _parity(self, cell: int) -> int:
+        """Couleur de damier d'une case."""
+        return (cell // self.size + cell % self.size) & 1
+
+    def __len__(self) -> int:
+        return len(self._cells[0]) + len(self._cells[1])
+
+    def __contains__(self, cell: int) -> bool:
+        return self._positions[cell] != len(self._positions)
+
+    def count(self, parity: Optional[int] = None) -> int:
+        """Nombre de cases présentes, éventuellement d'une seule couleur.
+
+        Args:
+            parity (Optional[int]): 0 ou 1 pour ne compter que les cases telles
+                que (x + y) % 2 == parity.
+
+        Returns:
+            int: Nombre de cases.
+        """
+        return len(self) if parity is None else len(self._cells[parity])
+
+    def add(self, cell: int) -> bool:
+        """Ajoute une case.
+
+        Returns:
+            bool: True si la case n'était pas déjà présente.
+        """
+        if cell in self:
+            return False
+        cells = self._cells[self._parity(cell)]
+        self._positions[cell] = len(cells)
+        cells.append(cell)
+        return True
+
+    def discard(self, cell: int) -> bool:
+        """Retire une case.
+
+        Returns:
+            bool: True si la case était présente.
+        """
+        position = self._positions[cell]
+        if position == len(self._positions):
+            return False
+        cells = self._cells[self._parity(cell)]
+        last = cells.pop()
+        if last != cell:
+            cells[position] = last
+            self._positions[last] = position
+        self._positions[cell] = len(self._positions)
+        return True
+
+    def sample(self, rng=random, parity: Optional[int] = None) -> int:
+        """Tire une case uniformément parmi celles présentes.
+
+        Args:
+            rng: Générateur (module `random` par défaut ou `random.Random`).
+            parity (Optional[int]): 0 ou 1 pour ne tirer que parmi les cases
+                telles que (x + y) % 2 == parity.
+
+        Returns:
+            int: Indice de la case tirée.
+
+        Raises:
+            IndexError: S'il n'y a aucune case à tirer.
+        """
+        if parity is not None:
+            cells = self._cells[parity]
+            if not cells:
+                raise IndexError("Aucune case de cette couleur")
+            return cells[rng.randrange(len(cells))]
+
+        even, odd = self._cells
+        if not even and not odd:
+            raise IndexError("Aucune case à tirer")
+        index = rng.randrange(len(even) + len(odd))
+        return even[index] if index < len(even) else odd[index - len(even)]
+
+    def sample_distinct(self, count: int, rng=random, exclude: Iterable[int] = ()) -> List[int]:
+        """Tire plusieurs cases distinctes, sans les retirer de l'ensemble.
+
+        Args:
+            count (int): Nombre de cases (borné par le nombre de cases disponibles).
+            rng: Générateur (module `random` par défaut ou `random.Random`).
+            exclude (Iterable[int]): Cases à ne pas tirer.
+
+        Returns:
+            List[int]: Indices des cases tirées.
+        """
+        removed = [cell for cell in exclude if self.discard(cell)]
+        chosen = []
+        while len(chosen) < count and len(self):
+            cell = self.sample(rng)
+            self.discard(cell)
+            chosen.append(cell)
+        for cell in removed + chosen:
+            self.add(cell)
+        return chosen
@@ -1,21 +1,27 @@
-from typing import List, Set, Tuple
+from typing import List, Tuple
 from .board import Board
 from .ship import Ship
+from .shot_ledger import ShotLedger
 
 class Player:
     """Représente un joueur dans le jeu de bataille navale."""
 
-    def __init__(self, name: str, is_computer: bool = False):
+    __slots__ = ('name', 'is_computer', 'board', 'shots')
+
+    def __init__(self, name: str, is_computer: bool = False, no_touch: bool = False, board_size: int = 10):
         """Initialise un nouveau joueur.
 
         Args:
             name (str): Nom du joueur.
             is_computer (bool): True si c'est l'ordinateur.
+            no_touch (bool): True si les navires ne peuvent pas se toucher.
+            board_size (int): Taille du plateau du joueur.
         """
         self.name = name
         self.is_computer = is_computer
-        self.board = Board()  # Plateau du joueur
-        self.shots: Set[Tuple[int, int]] = set()  # Tirs effectués
+        self.board = Board(board_size, no_touch=no_touch)  # Plateau du joueur
+        # Tirs effectués ; remplacé par le registre du plateau adverse une fois la partie liée
+        self.shots = ShotLedger(self.board.size)
 
     def initialize_ships(self) -> List[Ship]:
         """Crée la liste initiale des navires.
@@ -67,16 +73,15 @@ class Player:
     def record_shot(self, x: int, y: int, hit: bool):
         """Enregistre un tir effectué.
 
+        Le résultat du tir est conservé par le plateau adverse ; seul le registre
+        des tirs est mis à jour ici.
+
         Args:
             x (int): Coordonnée x du tir.
             y (int): Coordonnée y du tir.
             hit (bool): True si le tir a touché.
         """
         self.shots.add((x, y))
-        if hit:
-            self.board.grid[y][x] = True  # Marque comme touché
-        else:
-            self.board.grid[y][x] = False  # Marque comme raté
 
     def get_remaining_ships(self) -> List[Ship]:
         """Retourne la liste des navires non coulés.
@@ -1,7 +1,13 @@
 from typing import List, Tuple, Set
 
 class Ship:
-    """Représente un navire dans le jeu de bataille navale."""
+    """Représente un navire dans le jeu de bataille navale.
+
+    Les cases occupées sont stockées sous forme d'indices entiers (y * largeur + x)
+    et les touches sous forme de masque de bits, un bit par segment du navire.
+    """
+
+    __slots__ = ('name', 'size', 'cells', 'width', 'hit_mask')
 
     def __init__(self, name: str, size: int):
         """Initialise un nouveau navire.
@@ -12,8 +18,36 @@ class Ship:
         """
         self.name = name
         self.size = size
-        self.positions: List[Tuple[int, int]] = []  # Coordonnées des cases occupées
-        self.hits: Set[Tuple[int, int]] = set()  # Coordonnées des cases touchées
+        self.cells: Tuple[int, ...] = ()  # Indices des cases occupées
+        self.width = 0  # Largeur du plateau sur lequel le navire est placé
+        self.hit_mask = 0  # Bit i à 1 si le segment i est touché
+
+    def place(self, cells: Tuple[int, ...], width: int):
+        """Positionne le navire sur un plateau.
+
+        Args:
+            cells (Tuple[int, ...]): Indices des cases occupées.
+            width (int): Largeur du plateau.
+        """
+        self.cells = cells
+        self.width = width
+        self.hit_mask = 0
+
+    @property
+    def positions(self) -> List[Tuple[int, int]]:
+        """Coordonnées (x, y) des cases occupées."""
+        width = self.width
+        return [(cell % width, cell // width) for cell in self.cells]
+
+    @property
+    def hits(self) -> Set[Tuple[int, int]]:
+        """Coordonnées (x, y) des cases touchées."""
+        width = self.width
+        return {
+            (cell % width, cell // width)
+            for segment, cell in enumerate(self.cells)
+            if self.hit_mask >> segment & 1
+        }
 
     def hit(self, x: int, y: int) -> bool:
         """Enregistre un tir sur le navire.
@@ -25,11 +59,24 @@ class Ship:
         Returns:
             bool: True si le tir a touché une nouvelle position.
         """
-        position = (x, y)
-        if position in self.positions and position not in self.hits:
-            self.hits.add(position)
-            return True
-        return False
+        return self.hit_cell(y * self.width + x) if self.cells else False
+
+    def hit_cell(self, cell: int) -> bool:
+        """Enregistre un tir sur le navire à partir d'un indice de case.
+
+        Args:
+            cell (int): Indice de la case visée.
+
+        Returns:
+            bool: True si le tir a touché une nouvelle position.
+        """
+        if cell not in self.cells:
+            return False
+        bit = 1 << self.cells.index(cell)
+        if self.hit_mask & bit:
+            return False
+        self.hit_mask |= bit
+        return True
 
     def is_sunk(self) -> bool:
         """Vérifie si le navire est coulé.
@@ -37,7 +84,7 @@ class Ship:
         Returns:
             bool: True si toutes les positions sont touchées.
         """
-        return set(self.positions) == self.hits
+        return self.hit_mask == (1 << len(self.cells)) - 1
 
     def get_positions(self) -> List[Tuple[int, int]]:
         """Retourne les positions occupées par le navire.
@@ -53,5 +100,5 @@ class Ship:
         Returns:
             str: Description du navire.
         """
-        status = "coulé" if self.is_sunk() else f"{len(self.hits)}/{self.size} touches"
+        status = "coulé" if self.is_sunk() else f"{bin(self.hit_mask).count('1')}/{self.size} touches"
         return f"{self.name} ({status})"
@@ -0,0 +1,87 @@
+from typing import Iterator, Tuple
+from .cell_sampler import CellSampler
+
+class ShotLedger:
+    """Registre compact des tirs reçus par un plateau.
+
+    Un bit par case, indexé par y * taille + x. Le même registre est partagé par
+    le plateau visé et par le joueur (ou l'IA) qui tire dessus.
+
+    L'ensemble des cases encore libres (`unshot`), qui permet de tirer une case
+    au hasard en O(1), n'est construit qu'à la première demande puis tenu à jour.
+    """
+
+    __slots__ = ('size', 'count', '_bits', '_unshot')
+
+    def __init__(self, size: int):
+        """Initialise un registre vide.
+
+        Args:
+            size (int): Taille du plateau.
+        """
+        self.size = size
+        self.count = 0
+        self._bits = bytearray((size * size + 7) // 8)
+        self._unshot = None
+
+    @property
+    def unshot(self) -> CellSampler:
+        """Cases pas encore visées, avec tirage uniforme en O(1)."""
+        if self._unshot is None:
+            self._unshot = CellSampler(self.size, (
+                cell for cell in range(self.size * self.size) if not self.contains_index(cell)
+            ))
+        return self._unshot
+
+    def contains_index(self, cell: int) -> bool:
+        """Vérifie si une case a déjà été visée.
+
+        Args:
+            cell (int): Indice de la case.
+
+        Returns:
+            bool: True si la case a déjà été visée.
+        """
+        return self._bits[cell >> 3] >> (cell & 7) & 1 == 1
+
+    def add_index(self, cell: int) -> bool:
+        """Enregistre un tir sur une case.
+
+        Args:
+            cell (int): Indice de la case.
+
+        Returns:
+            bool: True si la case n'avait pas encore été visée.
+        """
+        byte, bit = cell >> 3, 1 << (cell & 7)
+        if self._bits[byte] & bit:
+            return False
+        self._bits[byte] |= bit
+        self.count += 1
+        if self._unshot is not None:
+            self._unshot.discard(cell)
+        return True
+
+    def clear(self):
+        """Efface tous les tirs enregistrés."""
+        self._bits[:] = bytes(len(self._bits))
+        self.count = 0
+        self._unshot = None
+
+    def add(self, position: Tuple[int, int]):
+        """Enregistre un tir aux coordonnées (x, y)."""
+        x, y = position
+        self.add_index(y * self.size + x)
+
+    def __contains__(self, position: Tuple[int, int]) -> bool:
+        x, y = position
+        return 0 <= x < self.size and 0 <= y < self.size and self.contains_index(y * self.size + x)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        size = self.size
+        for cell in range(size * size):
+            if self.contains_index(cell):
+                yield cell % size, cell // size
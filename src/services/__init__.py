@@ -0,0 +1,4 @@
+from .broadcast import SpectatorBroadcaster, watch
+from .decisions import Decision, DecisionService, DecisionServer, DecisionClient
+
+__all__ = ['SpectatorBroadcaster', 'watch', 'Decision', 'DecisionService', 'DecisionServer', 'DecisionClient']
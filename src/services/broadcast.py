@@ -0,0 +1,367 @@
+"""Diffusion en direct des événements de parties vers des spectateurs."""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+import json
+import logging
+import selectors
+import socket
+import threading
+
+from ..utils.constants import CELL_STATES
+
+# Identifiant d'abonnement à toutes les parties
+ALL_GAMES = '*'
+
+
+class _GameMirror:
+    """Copie de l'état public d'une partie, tenue à jour à partir des événements.
+
+    Elle n'est manipulée que par le thread de diffusion : les instantanés envoyés
+    aux spectateurs ne lisent donc jamais les plateaux de la partie en cours.
+    """
+
+    __slots__ = ('size', 'boards', 'winner')
+
+    def __init__(self, snapshot: Dict[str, Any]):
+        self.size = snapshot['size']
+        self.boards = {
+            name: bytearray(int(code) for code in cells)
+            for name, cells in snapshot['boards'].items()
+        }
+        self.winner = snapshot.get('winner')
+
+    def apply(self, event: Dict[str, Any]):
+        """Applique un événement de partie à la copie."""
+        kind = event['type']
+        if kind == 'game_over':
+            self.winner = event['winner']
+            return
+
+        cells = self.boards[event['board']]
+        if kind == 'shot':
+            index = event['y'] * self.size + event['x']
+            cells[index] = CELL_STATES['HIT'] if event['hit'] else CELL_STATES['MISS']
+        elif kind in ('sunk', 'ship_placed', 'ship_removed'):
+            state = {'sunk': CELL_STATES['SUNK'], 'ship_placed': CELL_STATES['SHIP'],
+                     'ship_removed': CELL_STATES['EMPTY']}[kind]
+            for x, y in event['positions']:
+                cells[y * self.size + x] = state
+
+    def snapshot(self, game_id: str) -> Dict[str, Any]:
+        """Retourne le message d'instantané envoyé aux nouveaux spectateurs."""
+        return {
+            'type': 'snapshot',
+            'game': game_id,
+            'size': self.size,
+            'boards': {name: ''.join(map(str, cells)) for name, cells in self.boards.items()},
+            'winner': self.winner
+        }
+
+
+class _Subscriber:
+    """Spectateur connecté et sa file d'envoi bornée."""
+
+    __slots__ = ('sock', 'game_id', 'request', 'queue', 'pending', 'dropped', 'coalesced')
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.game_id: Optional[str] = None
+        self.request = b''
+        self.queue: Deque[bytes] = deque()
+        self.pending = b''
+        self.dropped = 0
+        self.coalesced = 0
+
+    def wants(self, game_id: str) -> bool:
+        """Vérifie si le spectateur suit une partie."""
+        return self.game_id == ALL_GAMES or self.game_id == game_id
+
+
+class SpectatorBroadcaster:
+    """Service local diffusant les événements des parties aux spectateurs.
+
+    Les spectateurs se connectent en TCP, envoient une ligne contenant
+    l'identifiant de la partie à suivre (ou '*' pour toutes), reçoivent un
+    instantané de chaque partie suivie puis un flux d'événements JSON, un par ligne.
+
+    `publish` se contente d'ajouter l'événement à une file : l'encodage et les
+    envois sont faits par un thread dédié, si bien qu'un spectateur lent ne
+    ralentit jamais la partie observée. La file d'un spectateur ne se remplit
+    que si son socket n'accepte plus de données : une rafale d'événements est
+    envoyée au fil de l'eau à un spectateur qui lit. Quand la file est pleine,
+    ses messages en attente sont soit abandonnés (`overflow='drop'`), soit
+    remplacés par un instantané à jour (`overflow='coalesce'`).
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, buffer_size: int = 256,
+                 overflow: str = 'coalesce', poll_interval: float = 0.01):
+        """Initialise le service (sans l'ouvrir).
+
+        Args:
+            host (str): Adresse d'écoute.
+            port (int): Port d'écoute (0 pour un port libre choisi par le système).
+            buffer_size (int): Nombre maximal de messages en attente par spectateur
+                dont le socket n'accepte plus de données.
+            overflow (str): Politique en cas de file pleine ('drop' ou 'coalesce').
+            poll_interval (float): Intervalle de relève des événements, en secondes.
+        """
+        if overflow not in ('drop', 'coalesce'):
+            raise ValueError(f"Politique de débordement inconnue : {overflow}")
+        self.host = host
+        self.port = port
+        self.buffer_size = buffer_size
+        self.overflow = overflow
+        self.poll_interval = poll_interval
+
+        self._inbox: Deque[Tuple[str, Dict[str, Any]]] = deque()
+        self._listeners: Dict[str, Tuple[Any, Callable]] = {}
+        self._mirrors: Dict[str, _GameMirror] = {}
+        self._subscribers: List[_Subscriber] = []
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._server: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.events_published = 0
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Adresse effective d'écoute (hôte, port)."""
+        return self._server.getsockname() if self._server else (self.host, self.port)
+
+    def start(self):
+        """Ouvre le socket d'écoute et démarre le thread de diffusion."""
+        self._server = socket.create_server((self.host, self.port))
+        self._server.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._server, selectors.EVENT_READ)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="spectator-broadcast", daemon=True)
+        self._thread.start()
+        logging.info(f"Diffusion aux spectateurs sur {self.address[0]}:{self.address[1]}")
+
+    def stop(self):
+        """Arrête la diffusion et ferme toutes les connexions."""
+        self._running = False
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        for subscriber in self._subscribers:
+            subscriber.sock.close()
+        self._subscribers.clear()
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        if self._server:
+            self._server.close()
+            self._server = None
+
+    def attach(self, game_id: str, game):
+        """Diffuse les événements d'une partie.
+
+        Args:
+            game_id (str): Identifiant de la partie pour les spectateurs.
+            game (GameController): La partie à diffuser.
+        """
+        self.detach(game_id)
+        listener = lambda event: self.publish(game_id, event)
+        self._listeners[game_id] = (game, listener)
+        self._inbox.append((game_id, {'type': 'attach', 'snapshot': game.snapshot()}))
+        game.add_listener(listener)
+
+    def detach(self, game_id: str):
+        """Arrête la diffusion d'une partie.
+
+        Args:
+            game_id (str): Identifiant de la partie.
+        """
+        if game_id in self._listeners:
+            game, listener = self._listeners.pop(game_id)
+            game.remove_listener(listener)
+            self._inbox.append((game_id, {'type': 'detach'}))
+
+    def publish(self, game_id: str, event: Dict[str, Any]):
+        """Met un événement en file pour diffusion (appelé depuis la partie).
+
+        Args:
+            game_id (str): Identifiant de la partie.
+            event (dict): Événement émis par le GameController.
+        """
+        self._inbox.append((game_id, event))
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne les compteurs de diffusion.
+
+        Returns:
+            dict: Parties, spectateurs, événements, messages abandonnés et fusionnés.
+        """
+        subscribers = list(self._subscribers)
+        return {
+            'games': len(self._mirrors),
+            'subscribers': len(subscribers),
+            'events_published': self.events_published,
+            'dropped': sum(subscriber.dropped for subscriber in subscribers),
+            'coalesced': sum(subscriber.coalesced for subscriber in subscribers)
+        }
+
+    def _run(self):
+        """Boucle du thread de diffusion."""
+        while self._running:
+            for key, mask in self._selector.select(timeout=self.poll_interval):
+                if key.data is None:
+                    self._accept()
+                    continue
+                subscriber = key.data
+                try:
+                    if mask & selectors.EVENT_READ:
+                        self._read(subscriber)
+                    if mask & selectors.EVENT_WRITE and subscriber in self._subscribers:
+                        self._flush(subscriber)
+                except Exception:
+                    # L'erreur d'un spectateur ne doit pas interrompre la diffusion aux autres
+                    logging.exception("Spectateur déconnecté après une erreur")
+                    self._disconnect(subscriber)
+            self._drain_inbox()
+
+    def _accept(self):
+        """Accepte un nouveau spectateur."""
+        try:
+            sock, _ = self._server.accept()
+        except BlockingIOError:
+            return
+        sock.setblocking(False)
+        subscriber = _Subscriber(sock)
+        self._subscribers.append(subscriber)
+        self._selector.register(sock, selectors.EVENT_READ, subscriber)
+
+    def _read(self, subscriber: _Subscriber):
+        """Lit la demande d'abonnement d'un spectateur ou détecte sa déconnexion."""
+        try:
+            data = subscriber.sock.recv(1024)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self._disconnect(subscriber)
+            return
+        if subscriber.game_id is not None:
+            return
+
+        subscriber.request += data
+        if b'\n' not in subscriber.request:
+            return
+        subscriber.game_id = subscriber.request.split(b'\n', 1)[0].decode('utf-8').strip() or ALL_GAMES
+        for game_id, mirror in self._mirrors.items():
+            if subscriber.wants(game_id):
+                self._enqueue(subscriber, self._encode(mirror.snapshot(game_id)))
+        if subscriber in self._subscribers:
+            self._flush(subscriber)
+
+    def _drain_inbox(self):
+        """Applique et diffuse les événements publiés depuis le dernier passage."""
+        touched = []
+        while self._inbox:
+            game_id, event = self._inbox.popleft()
+            kind = event['type']
+            if kind == 'attach':
+                mirror = self._mirrors[game_id] = _GameMirror(event['snapshot'])
+                message = self._encode(mirror.snapshot(game_id))
+            elif kind == 'detach':
+                self._mirrors.pop(game_id, None)
+                message = self._encode({'type': 'detached', 'game': game_id})
+            else:
+                mirror = self._mirrors.get(game_id)
+                if mirror is None:
+                    continue
+                mirror.apply(event)
+                self.events_published += 1
+                message = self._encode(dict(event, game=game_id))
+
+            # Copie : un envoi qui échoue retire le spectateur de la liste
+            for subscriber in list(self._subscribers):
+                if subscriber in self._subscribers and subscriber.game_id is not None \
+                        and subscriber.wants(game_id):
+                    self._enqueue(subscriber, message)
+                    touched.append(subscriber)
+
+        for subscriber in set(touched):
+            if subscriber in self._subscribers:
+                self._flush(subscriber)
+
+    def _enqueue(self, subscriber: _Subscriber, message: bytes):
+        """Ajoute un message à la file bornée d'un spectateur."""
+        if len(subscriber.queue) >= self.buffer_size and not subscriber.pending:
+            # File pleine mais socket disponible : envoi avant de conclure au retard
+            self._flush(subscriber)
+            if subscriber not in self._subscribers:
+                return
+        if len(subscriber.queue) < self.buffer_size:
+            subscriber.queue.append(message)
+            return
+
+        if self.overflow == 'drop':
+            subscriber.queue.popleft()
+            subscriber.queue.append(message)
+            subscriber.dropped += 1
+            return
+
+        # Les messages en retard sont remplacés par l'état courant des parties suivies
+        subscriber.coalesced += len(subscriber.queue) + 1
+        subscriber.queue.clear()
+        for game_id, mirror in self._mirrors.items():
+            if subscriber.wants(game_id):
+                subscriber.queue.append(self._encode(mirror.snapshot(game_id)))
+
+    def _flush(self, subscriber: _Subscriber):
+        """Envoie sans bloquer autant de messages en attente que possible."""
+        while subscriber.pending or subscriber.queue:
+            if not subscriber.pending:
+                subscriber.pending = b''.join(subscriber.queue)
+                subscriber.queue.clear()
+            try:
+                sent = subscriber.sock.send(subscriber.pending)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                self._disconnect(subscriber)
+                return
+            subscriber.pending = subscriber.pending[sent:]
+
+        events = selectors.EVENT_READ
+        if subscriber.pending:
+            events |= selectors.EVENT_WRITE
+        self._selector.modify(subscriber.sock, events, subscriber)
+
+    def _disconnect(self, subscriber: _Subscriber):
+        """Ferme la connexion d'un spectateur."""
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+            try:
+                self._selector.unregister(subscriber.sock)
+            except (KeyError, ValueError):
+                pass
+            subscriber.sock.close()
+
+    @staticmethod
+    def _encode(message: Dict[str, Any]) -> bytes:
+        """Encode un message en une ligne JSON."""
+        return json.dumps(message, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def watch(host: str, port: int, game_id: str = ALL_GAMES) -> Iterator[Dict[str, Any]]:
+    """Se connecte en spectateur et produit les messages reçus.
+
+    Args:
+        host (str): Adresse du service de diffusion.
+        port (int): Port du service de diffusion.
+        game_id (str): Partie à suivre ('*' pour toutes).
+
+    Yields:
+        dict: Instantanés et événements, dans l'ordre de réception.
+    """
+    with socket.create_connection((host, port)) as sock:
+        sock.sendall(game_id.encode('utf-8') + b'\n')
+        with sock.makefile('r', encoding='utf-8') as stream:
+            for line in stream:
+                yield json.loads(line)
@@ -0,0 +1,465 @@
+"""Service de décision de l'IA partagé entre parties, en local ou par socket Unix."""
+
+from collections import Counter, deque
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import argparse
+import itertools
+import json
+import logging
+import os
+import queue
+import random
+import socket
+import socketserver
+import threading
+import time
+
+from ..ai import DecisionCache, OpponentKnowledge, SHARED_DECISION_CACHE, compute_heat_map, choose_best_cells
+from ..utils.config import GAME_CONFIG
+from ..utils.constants import CELL_DIGITS, DIGIT_CELLS
+
+# Nombre de latences récentes conservées pour les percentiles
+LATENCY_SAMPLES = 10000
+
+
+class Decision:
+    """Réponse à une demande de tir."""
+
+    __slots__ = ('cells', 'batch_size', 'latency_ms')
+
+    def __init__(self, cells: List[Tuple[int, int]], batch_size: int, latency_ms: float):
+        self.cells = cells
+        self.batch_size = batch_size
+        self.latency_ms = latency_ms
+
+
+class _Request:
+    """Demande en attente : copie figée de la connaissance et réponse à remplir."""
+
+    __slots__ = ('key', 'size', 'cells', 'remaining', 'count', 'submitted', 'future')
+
+    def __init__(self, knowledge: OpponentKnowledge, count: int):
+        self.key = knowledge.key
+        self.size = knowledge.size
+        self.cells = bytes(knowledge.cells)
+        self.remaining = tuple(knowledge.remaining)
+        self.count = count
+        self.submitted = time.perf_counter()
+        self.future: Future = Future()
+
+
+class DecisionService:
+    """Choisit les tirs de l'IA pour de nombreuses parties à la fois.
+
+    Les demandes arrivées pendant une courte fenêtre (`window_ms`) sont traitées
+    ensemble par un seul thread : les positions identiques d'un même lot ne sont
+    évaluées qu'une fois, et toutes profitent du même cache de décisions, chaud
+    pour toutes les parties. Chaque réponse indique la taille de son lot et la
+    latence de la demande ; `stats` en donne la synthèse.
+    """
+
+    def __init__(self, window_ms: float = 2.0, max_batch: int = 64,
+                 decision_cache: Optional[DecisionCache] = None, seed: Optional[int] = None):
+        """Initialise le service (sans le démarrer).
+
+        Args:
+            window_ms (float): Durée maximale d'attente d'autres demandes pour un lot.
+            max_batch (int): Nombre maximal de demandes par lot.
+            decision_cache (Optional[DecisionCache]): Cache des cartes de chaleur
+                (par défaut le cache partagé du processus).
+            seed (Optional[int]): Graine du tirage entre cases ex aequo.
+        """
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.decision_cache = decision_cache if decision_cache is not None else SHARED_DECISION_CACHE
+        self._rng = random.Random(seed)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self.requests = 0
+        self.batches = 0
+        self.evaluations = 0
+        self.batch_sizes: Counter = Counter()
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def start(self):
+        """Démarre le thread de décision."""
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ai-decisions", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête le thread ; les demandes encore en attente échouent."""
+        self._running = False
+        if self._thread:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        while not self._queue.empty():
+            request = self._queue.get()
+            if request is not None:
+                request.future.set_exception(RuntimeError("Service de décision arrêté"))
+
+    def submit(self, knowledge: OpponentKnowledge, count: int = 1) -> Future:
+        """Demande les prochains tirs pour une connaissance du plateau adverse.
+
+        La connaissance est copiée : la partie peut continuer à la modifier.
+
+        Args:
+            knowledge (OpponentKnowledge): Ce que l'IA sait du plateau adverse.
+            count (int): Nombre de cases distinctes à choisir (salve).
+
+        Returns:
+            Future: Résolu avec une `Decision`.
+        """
+        if not self._running:
+            raise RuntimeError("Le service de décision n'est pas démarré")
+        request = _Request(knowledge, count)
+        self._queue.put(request)
+        return request.future
+
+    def decide(self, knowledge: OpponentKnowledge, count: int = 1) -> List[Tuple[int, int]]:
+        """Choisit les prochains tirs et attend la réponse.
+
+        Args:
+            knowledge (OpponentKnowledge): Ce que l'IA sait du plateau adverse.
+            count (int): Nombre de cases distinctes à choisir.
+
+        Returns:
+            List[Tuple[int, int]]: Coordonnées (x, y) des tirs.
+        """
+        return self.submit(knowledge, count).result().cells
+
+    def stats(self) -> Dict[str, Any]:
+        """Retourne les métriques du service.
+
+        Returns:
+            dict: Demandes, lots, taille des lots, positions évaluées et latences
+            (en millisecondes, sur les demandes récentes).
+        """
+        latencies = sorted(self._latencies)
+
+        def percentile(rank: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(rank * len(latencies)))]
+
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'mean_batch_size': self.requests / self.batches if self.batches else 0.0,
+            'max_batch_size': max(self.batch_sizes) if self.batch_sizes else 0,
+            'evaluations': self.evaluations,
+            'latency_ms': {
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'p99': percentile(0.99),
+                'max': latencies[-1] if latencies else 0.0
+            },
+            'cache': self.decision_cache.stats()
+        }
+
+    def _run(self):
+        """Boucle du thread : constitue les lots et les évalue."""
+        while self._running:
+            batch = self._collect()
+            if batch:
+                self._evaluate(batch)
+
+    def _collect(self) -> List[_Request]:
+        """Attend une demande puis rassemble celles qui arrivent pendant la fenêtre."""
+        first = self._queue.get()
+        if first is None:
+            return []
+
+        batch = [first]
+        deadline = time.perf_counter() + self.window
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                self._running = False
+                break
+            batch.append(request)
+        return batch
+
+    def _evaluate(self, batch: List[_Request]):
+        """Évalue un lot : une carte de chaleur par position distincte."""
+        heat_maps: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+        errors: Dict[Tuple[int, int], Exception] = {}
+        for request in batch:
+            if request.key not in heat_maps and request.key not in errors:
+                try:
+                    heat_maps[request.key] = self.decision_cache.get_or_compute(
+                        request.key,
+                        lambda request=request: compute_heat_map(request.cells, request.size, request.remaining)
+                    )
+                except Exception as error:
+                    # Seules les demandes de cette position échouent ; le thread continue
+                    errors[request.key] = error
+        self.evaluations += len(heat_maps)
+
+        size = len(batch)
+        self.requests += size
+        self.batches += 1
+        self.batch_sizes[size] += 1
+        for request in batch:
+            if request.key in errors:
+                request.future.set_exception(errors[request.key])
+                continue
+            try:
+                cells = choose_best_cells(
+                    heat_maps[request.key], request.cells, request.size, request.count, self._rng
+                )
+            except Exception as error:
+                request.future.set_exception(error)
+                continue
+            latency = (time.perf_counter() - request.submitted) * 1000
+            self._latencies.append(latency)
+            request.future.set_result(Decision(cells, size, latency))
+
+
+class _DecisionHandler(socketserver.StreamRequestHandler):
+    """Connexion d'un client : une demande JSON par ligne, réponses dans l'ordre d'arrivée."""
+
+    def handle(self):
+        service: DecisionService = self.server.service
+        write_lock = threading.Lock()
+        # Demandes sans réponse : un compteur, pour ne rien retenir des demandes servies
+        self.in_flight = threading.Condition()
+        self.pending = 0
+
+        for line in self.rfile:
+            message = None
+            try:
+                message = json.loads(line)
+                request_id = message.get('id')
+                size = int(message['size'])
+                cells = message['cells'].encode('ascii').translate(DIGIT_CELLS)
+                if len(cells) != size * size:
+                    raise ValueError("Nombre de cases incorrect")
+                remaining = message['remaining']
+                if not isinstance(remaining, list) or not all(
+                        type(length) is int and 0 < length <= size for length in remaining):
+                    raise ValueError("Tailles de navires incorrectes")
+                knowledge = OpponentKnowledge.from_state(
+                    size, cells, remaining, bool(message.get('no_touch', False))
+                )
+                future = service.submit(knowledge, int(message.get('count', 1)))
+            except (ValueError, KeyError, TypeError, AttributeError, RuntimeError) as error:
+                self._send({'id': message.get('id') if isinstance(message, dict) else None,
+                            'error': str(error)}, write_lock)
+                continue
+
+            with self.in_flight:
+                self.pending += 1
+            future.add_done_callback(
+                lambda done, request_id=request_id: self._reply(request_id, done, write_lock)
+            )
+
+        # Le client a fini d'écrire : les réponses en cours lui sont encore dues
+        with self.in_flight:
+            self.in_flight.wait_for(lambda: self.pending == 0)
+
+    def _reply(self, request_id: Any, future: Future, write_lock: threading.Lock):
+        """Envoie la réponse d'une demande terminée et la retire des demandes en cours."""
+        try:
+            self._answer(request_id, future, write_lock)
+        finally:
+            with self.in_flight:
+                self.pending -= 1
+                self.in_flight.notify_all()
+
+    def _answer(self, request_id: Any, future: Future, write_lock: threading.Lock):
+        """Envoie la réponse (ou l'erreur) d'une demande terminée."""
+        error = future.exception()
+        if error is not None:
+            self._send({'id': request_id, 'error': str(error)}, write_lock)
+            return
+        decision = future.result()
+        self._send({
+            'id': request_id,
+            'cells': decision.cells,
+            'batch_size': decision.batch_size,
+            'latency_ms': decision.latency_ms
+        }, write_lock)
+
+    def _send(self, message: Dict[str, Any], write_lock: threading.Lock):
+        """Écrit une ligne JSON, en ignorant un client déjà parti."""
+        data = json.dumps(message, separators=(',', ':')).encode('utf-8') + b'\n'
+        with write_lock:
+            try:
+                self.request.sendall(data)
+            except OSError:
+                pass
+
+
+class DecisionServer:
+    """Expose un DecisionService sur un socket Unix.
+
+    Protocole : une ligne JSON par demande, par exemple
+    `{"id": 1, "size": 10, "cells": "0030...", "remaining": [5, 4], "count": 1}`
+    où `cells` contient les codes CELL_STATES de la connaissance, un chiffre par
+    case. La réponse reprend l'identifiant :
+    `{"id": 1, "cells": [[x, y]], "batch_size": 12, "latency_ms": 1.8}`, ou
+    `{"id": 1, "error": "..."}`. Un client peut envoyer plusieurs demandes sans
+    attendre les réponses ; celles de tous les clients sont regroupées en lots.
+    """
+
+    def __init__(self, service: DecisionService, path: str):
+        """Initialise le serveur (sans l'ouvrir).
+
+        Args:
+            service (DecisionService): Service qui traite les demandes.
+            path (str): Chemin du socket Unix.
+        """
+        self.service = service
+        self.path = path
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Ouvre le socket et accepte les clients dans un thread dédié."""
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = socketserver.ThreadingUnixStreamServer(self.path, _DecisionHandler)
+        self._server.daemon_threads = True
+        self._server.service = self.service
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ai-decision-server", daemon=True)
+        self._thread.start()
+        logging.info(f"Service de décision de l'IA sur {self.path}")
+
+    def stop(self):
+        """Ferme le socket."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread.join()
+            self._thread = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class DecisionClient:
+    """Client d'un DecisionServer, utilisable par plusieurs parties et threads à la fois.
+
+    Il s'utilise comme un DecisionService (`submit`, `decide`) : un
+    GameController peut recevoir l'un ou l'autre.
+    """
+
+    def __init__(self, path: str):
+        """Se connecte au serveur.
+
+        Args:
+            path (str): Chemin du socket Unix du serveur.
+        """
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(path)
+        self._ids = itertools.count()
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read, name="ai-decision-client", daemon=True)
+        self._reader.start()
+
+    def submit(self, knowledge: OpponentKnowledge, count: int = 1) -> Future:
+        """Envoie une demande de tir.
+
+        Args:
+            knowledge (OpponentKnowledge): Ce que l'IA sait du plateau adverse.
+            count (int): Nombre de cases distinctes à choisir.
+
+        Returns:
+            Future: Résolu avec une `Decision`.
+        """
+        future: Future = Future()
+        message = {
+            'size': knowledge.size,
+            'cells': bytes(knowledge.cells).translate(CELL_DIGITS).decode('ascii'),
+            'remaining': knowledge.remaining,
+            'no_touch': knowledge.no_touch,
+            'count': count
+        }
+        with self._lock:
+            request_id = message['id'] = next(self._ids)
+            self._pending[request_id] = future
+            self._sock.sendall(json.dumps(message, separators=(',', ':')).encode('utf-8') + b'\n')
+        return future
+
+    def decide(self, knowledge: OpponentKnowledge, count: int = 1) -> List[Tuple[int, int]]:
+        """Choisit les prochains tirs et attend la réponse.
+
+        Args:
+            knowledge (OpponentKnowledge): Ce que l'IA sait du plateau adverse.
+            count (int): Nombre de cases distinctes à choisir.
+
+        Returns:
+            List[Tuple[int, int]]: Coordonnées (x, y) des tirs.
+        """
+        return self.submit(knowledge, count).result().cells
+
+    def close(self):
+        """Ferme la connexion."""
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._reader.join()
+
+    def _read(self):
+        """Transmet chaque réponse reçue à la demande correspondante."""
+        with self._sock.makefile('r', encoding='utf-8') as stream:
+            try:
+                for line in stream:
+                    message = json.loads(line)
+                    with self._lock:
+                        future = self._pending.pop(message.get('id'), None)
+                    if future is None:
+                        continue
+                    if 'error' in message:
+                        future.set_exception(RuntimeError(message['error']))
+                    else:
+                        cells = [tuple(cell) for cell in message['cells']]
+                        future.set_result(Decision(cells, message['batch_size'], message['latency_ms']))
+            except OSError:
+                pass
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(ConnectionError("Connexion au service de décision perdue"))
+
+
+def main(argv: Optional[List[str]] = None):
+    """Point d'entrée en ligne de commande : python -m src.services.decisions."""
+    settings = GAME_CONFIG["DECISION_SERVICE"]
+    parser = argparse.ArgumentParser(description="Service de décision de l'IA sur socket Unix.")
+    parser.add_argument('--socket', default=settings["socket"])
+    parser.add_argument('--window-ms', type=float, default=settings["window_ms"])
+    parser.add_argument('--max-batch', type=int, default=settings["max_batch"])
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    service = DecisionService(args.window_ms, args.max_batch)
+    server = DecisionServer(service, args.socket)
+    service.start()
+    server.start()
+    try:
+        while True:
+            time.sleep(60)
+            logging.info(f"Service de décision : {service.stats()}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        service.stop()
+
+
+if __name__ == '__main__':
+    main()
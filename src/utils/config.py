@@ -4,13 +4,18 @@ GAME_CONFIG = {
     # Configuration du plateau
     "BOARD_SIZE": 10,
     
-    # Configuration des boutons
-    "BUTTON_STYLE": {
-        'width': 3,
-        'height': 1,
-        'font': ('Arial', 12, 'bold'),  # Texte plus visible
-        'relief': 'raised',
-        'borderwidth': 2
+    # Configuration de l'affichage des plateaux
+    "VIEWPORT": {
+        "cell_size": 36,          # Taille initiale d'une case, en pixels
+        "min_cell_size": 8,       # Zoom arrière maximal
+        "max_cell_size": 64,      # Zoom avant maximal
+        "max_visible_cells": 15,  # Cases visibles par côté à l'ouverture
+        "font": "Arial"
+    },
+
+    # Variantes de règles
+    "RULES": {
+        "no_touch": False  # Interdit aux navires de se toucher, même en diagonale
     },
 
     # Configuration des navires
@@ -33,5 +38,28 @@ GAME_CONFIG = {
      "DELAYS": {
         "computer_turn": 1000,  # Délai avant le tour de l'ordinateur
         "shot_animation": 500  # Animation de tir
+    },
+
+    # Configuration de l'IA
+    "AI": {
+        "decision_cache_size": 50000,  # Entrées du cache de décisions partagé
+        "layout_cache_dir": "~/.cache/bataille-navale",  # Dénombrements exacts des dispositions
+        "difficulties_file": "~/.config/bataille-navale/difficulties.json"  # Difficultés réglées
+    },
+
+    # Service de décision de l'IA partagé entre parties
+    "DECISION_SERVICE": {
+        "socket": "/tmp/bataille-navale-ia.sock",
+        "window_ms": 2,   # Attente maximale d'autres demandes pour former un lot
+        "max_batch": 64   # Demandes maximales par lot
+    },
+
+    # Diffusion des parties aux spectateurs
+    "BROADCAST": {
+        "enabled": False,
+        "host": "127.0.0.1",
+        "port": 8765,
+        "buffer_size": 256,     # Messages en attente par spectateur
+        "overflow": "coalesce"  # "drop" ou "coalesce" pour les spectateurs lents
     }
 }
\ No newline at end of file
@@ -9,6 +9,8 @@ COLORS = {
     'ship': '#666666',        # Navire (gris)
     'preview_ok': '#90EE90',  # Prévisualisation valide (vert clair)
     'preview_bad': '#FFB6C1', # Prévisualisation invalide (rose)
+    'target': '#FFD700',      # Cible sélectionnée pour une salve (or)
+    'flash': '#FFFF99',       # Éclair d'un tir, le temps de l'animation (jaune pâle)
     'hover': '#E0E0E0'        # Survol (gris clair)
 }
 
@@ -30,6 +32,7 @@ MESSAGES = {
     'victory': "Félicitations! Vous avez gagné!",
     'defeat': "Game Over! L'ordinateur a gagné!",
     'play_again': "Voulez-vous faire une nouvelle partie?",
+    'salvo_turn': "Salve! Choisissez encore {} cible(s) sur le plateau ennemi.",
     'error': {
         'invalid_position': "Position invalide!",
         'already_shot': "Vous avez déjà tiré ici!"
@@ -45,6 +48,18 @@ CELL_STATES = {
     'SUNK': 4      # Navire coulé
 }
 
+# Conversion des codes CELL_STATES en chiffres ASCII (instantanés, échanges réseau) et inversement
+CELL_DIGITS = bytes.maketrans(bytes(range(10)), b'0123456789')
+DIGIT_CELLS = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+# Résultats compacts d'un tir, utilisés par les salves
+SHOT_RESULTS = {
+    'ALREADY_SHOT': 0,  # Case déjà visée ou hors du plateau
+    'MISS': 1,          # Tir manqué
+    'HIT': 2,           # Tir réussi
+    'SUNK': 3           # Tir réussi qui coule le navire
+}
+
 # Couleurs utilisées pour chaque type de navire
 SHIP_COLORS = {
     'Porte-avions': '#666666',  
@@ -0,0 +1,346 @@
+"""Plateau virtualisé : seules les cases visibles existent à l'écran."""
+
+import math
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.config import GAME_CONFIG
+from ..utils.constants import COLORS
+
+# Style d'une case : (couleur de fond, symbole)
+Style = Tuple[str, str]
+
+# Taille de case (en pixels) en dessous de laquelle les symboles ne sont plus dessinés
+MIN_TEXT_CELL_SIZE = 14
+
+
+class BoardViewport:
+    """Vue défilante et zoomable d'un plateau de n'importe quelle taille.
+
+    Le canevas ne contient qu'un rectangle et un symbole par case visible. Au
+    défilement ou au zoom, ces éléments sont réutilisés pour d'autres cases et
+    seuls les états de la région visible sont relus auprès du modèle
+    (`Board.get_region`) : ouvrir ou parcourir un plateau de 1000x1000 coûte
+    autant qu'un plateau de 10x10.
+
+    Les effets temporaires (cibles d'une salve, prévisualisation d'un placement,
+    flash d'un tir) sont des calques clairsemés appliqués, dans l'ordre de
+    `LAYERS`, par-dessus le style déduit du modèle. Le dessin est confié au
+    planificateur d'images : plusieurs changements entre deux images ne
+    provoquent qu'un seul passage.
+    """
+
+    LAYERS = ('target', 'preview', 'flash')
+
+    def __init__(self, parent, scheduler, board, cell_style: Callable[[int, int, int], Style]):
+        """Crée la vue.
+
+        Args:
+            parent: Widget Tk parent.
+            scheduler (FrameScheduler): Planificateur d'images de la fenêtre.
+            board (Board): Plateau affiché.
+            cell_style (Callable[[int, int, int], Style]): Style d'une case à
+                partir de ses coordonnées et de son code CELL_STATES.
+        """
+        settings = GAME_CONFIG["VIEWPORT"]
+        self.scheduler = scheduler
+        self.board = board
+        self.cell_style = cell_style
+        self.cell_size = settings["cell_size"]
+        self.min_cell_size = settings["min_cell_size"]
+        self.max_cell_size = settings["max_cell_size"]
+        self.origin_x = 0
+        self.origin_y = 0
+        self.enabled = True
+        self.overlays: Dict[str, Dict[Tuple[int, int], Tuple[str, Optional[str]]]] = {
+            layer: {} for layer in self.LAYERS
+        }
+
+        # Actions déclenchées par la souris, en coordonnées de plateau
+        self.on_click: Optional[Callable[[int, int], None]] = None
+        self.on_right_click: Optional[Callable[[], None]] = None
+        self.on_hover: Optional[Callable[[int, int], None]] = None
+        self.on_leave: Optional[Callable[[], None]] = None
+
+        visible = min(board.size, settings["max_visible_cells"]) * self.cell_size
+        self.frame = ttk.Frame(parent)
+        self.canvas = tk.Canvas(
+            self.frame, width=visible, height=visible,
+            bg=COLORS['bg'], highlightthickness=0
+        )
+        self.x_scroll = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self._scroll_x)
+        self.y_scroll = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._scroll_y)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.y_scroll.grid(row=0, column=1, sticky="ns")
+        self.x_scroll.grid(row=1, column=0, sticky="ew")
+        self.frame.rowconfigure(0, weight=1)
+        self.frame.columnconfigure(0, weight=1)
+
+        # Réserve d'éléments du canevas : (rectangle, symbole) par case visible
+        self._slots: List[Tuple[int, int]] = []
+        self._slot_styles: List[Optional[Style]] = []
+        self._columns = 0
+        self._rows = 0
+        self._layout: Tuple[int, int, int] = (0, 0, 0)
+        self._hovered: Optional[Tuple[int, int]] = None
+
+        self.canvas.bind("<Configure>", lambda e: self._rebuild())
+        self.canvas.bind("<Button-1>", self._handle_click)
+        self.canvas.bind("<Button-3>", self._handle_right_click)
+        self.canvas.bind("<Motion>", self._handle_motion)
+        self.canvas.bind("<Leave>", self._handle_leave)
+        self.canvas.bind("<MouseWheel>", self._handle_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self._handle_wheel(e, -1))
+        self.canvas.bind("<Button-5>", lambda e: self._handle_wheel(e, 1))
+        self._rebuild()
+
+    def grid(self, **options):
+        """Place la vue dans son parent (mêmes options que `grid` de Tk)."""
+        self.frame.grid(**options)
+
+    def set_board(self, board):
+        """Affiche un autre plateau, depuis son coin supérieur gauche.
+
+        Args:
+            board (Board): Nouveau plateau.
+        """
+        self.board = board
+        self.origin_x = self.origin_y = 0
+        self._hovered = None
+        for cells in self.overlays.values():
+            cells.clear()
+        self._rebuild()
+        self.refresh()
+
+    def refresh(self):
+        """Demande que la région visible soit redessinée à la prochaine image."""
+        self.scheduler.request_render(self)
+
+    def style_at(self, x: int, y: int) -> Style:
+        """Retourne le style d'une case selon le modèle, sans les calques.
+
+        Args:
+            x (int): Coordonnée x.
+            y (int): Coordonnée y.
+
+        Returns:
+            Style: (couleur de fond, symbole).
+        """
+        return self.cell_style(x, y, self.board.get_cell_state(x, y))
+
+    def set_overlay(self, layer: str, x: int, y: int, fill: str, text: Optional[str] = None):
+        """Superpose un style à une case.
+
+        Args:
+            layer (str): Calque (un nom de `LAYERS`).
+            x (int): Coordonnée x.
+            y (int): Coordonnée y.
+            fill (str): Couleur de fond.
+            text (Optional[str]): Symbole, ou None pour garder celui du modèle.
+        """
+        self.overlays[layer][(x, y)] = (fill, text)
+        if self._is_visible(x, y):
+            self.refresh()
+
+    def clear_overlay(self, layer: str, x: int, y: int):
+        """Retire le style superposé à une case.
+
+        Args:
+            layer (str): Calque.
+            x (int): Coordonnée x.
+            y (int): Coordonnée y.
+        """
+        if self.overlays[layer].pop((x, y), None) is not None and self._is_visible(x, y):
+            self.refresh()
+
+    def set_layer(self, layer: str, cells: Dict[Tuple[int, int], Tuple[str, Optional[str]]]):
+        """Remplace tout le contenu d'un calque.
+
+        Args:
+            layer (str): Calque.
+            cells (dict): Style superposé (couleur, symbole ou None) par case (x, y).
+        """
+        if cells or self.overlays[layer]:
+            self.overlays[layer] = dict(cells)
+            self.refresh()
+
+    def scroll_to(self, x: int, y: int):
+        """Fait défiler la vue pour que la case (x, y) soit en haut à gauche.
+
+        Args:
+            x (int): Première colonne visible souhaitée.
+            y (int): Première ligne visible souhaitée.
+        """
+        x = max(0, min(x, self.board.size - self._columns))
+        y = max(0, min(y, self.board.size - self._rows))
+        if (x, y) != (self.origin_x, self.origin_y):
+            self.origin_x, self.origin_y = x, y
+            self.refresh()
+
+    def zoom(self, steps: int, anchor: Optional[Tuple[int, int]] = None):
+        """Agrandit (steps > 0) ou réduit (steps < 0) les cases.
+
+        Args:
+            steps (int): Nombre de crans de zoom.
+            anchor (Optional[Tuple[int, int]]): Position (en pixels) qui reste
+                sur la même case ; le coin supérieur gauche par défaut.
+        """
+        size = max(self.min_cell_size, min(self.max_cell_size, round(self.cell_size * 1.25 ** steps)))
+        if size == self.cell_size:
+            return
+        px, py = anchor or (0, 0)
+        cell_x = self.origin_x + px // self.cell_size
+        cell_y = self.origin_y + py // self.cell_size
+        self.cell_size = size
+        self._rebuild()
+        self.scroll_to(cell_x - px // size, cell_y - py // size)
+
+    def cell_at(self, px: int, py: int) -> Optional[Tuple[int, int]]:
+        """Convertit une position dans le canevas en coordonnées de case.
+
+        Args:
+            px (int): Abscisse en pixels.
+            py (int): Ordonnée en pixels.
+
+        Returns:
+            Optional[Tuple[int, int]]: La case (x, y), ou None hors du plateau.
+        """
+        x = self.origin_x + px // self.cell_size
+        y = self.origin_y + py // self.cell_size
+        if px < 0 or py < 0 or not self.board.is_valid_position(x, y):
+            return None
+        return x, y
+
+    def render(self):
+        """Redessine la région visible (appelée par le planificateur)."""
+        columns, rows = self._columns, self._rows
+        origin_x, origin_y = self.origin_x, self.origin_y
+        region = self.board.get_region(origin_x, origin_y, columns, rows)
+        layers = [cells for cells in (self.overlays[name] for name in self.LAYERS) if cells]
+        show_text = self.cell_size >= MIN_TEXT_CELL_SIZE
+        itemconfigure = self.canvas.itemconfigure
+
+        for i in range(rows):
+            states = region[i] if i < len(region) else b''
+            for j in range(columns):
+                slot = i * columns + j
+                style: Optional[Style] = None
+                if j < len(states):
+                    x, y = origin_x + j, origin_y + i
+                    fill, text = self.cell_style(x, y, states[j])
+                    for cells in layers:
+                        overlay = cells.get((x, y))
+                        if overlay is not None:
+                            fill = overlay[0]
+                            if overlay[1] is not None:
+                                text = overlay[1]
+                    style = (fill, text if show_text else '')
+
+                if style == self._slot_styles[slot]:
+                    continue
+                self._slot_styles[slot] = style
+                rectangle, symbol = self._slots[slot]
+                if style is None:
+                    itemconfigure(rectangle, state='hidden')
+                    itemconfigure(symbol, state='hidden')
+                else:
+                    itemconfigure(rectangle, fill=style[0], state='normal')
+                    itemconfigure(symbol, text=style[1], state='normal')
+
+        size = self.board.size
+        self.x_scroll.set(origin_x / size, min(1.0, (origin_x + columns) / size))
+        self.y_scroll.set(origin_y / size, min(1.0, (origin_y + rows) / size))
+
+    def _is_visible(self, x: int, y: int) -> bool:
+        """Indique si une case est dans la région affichée."""
+        return (self.origin_x <= x < self.origin_x + self._columns
+                and self.origin_y <= y < self.origin_y + self._rows)
+
+    def _rebuild(self):
+        """Recrée la réserve d'éléments pour la taille du canevas et des cases."""
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:  # Canevas pas encore affiché
+            width = int(self.canvas['width'])
+            height = int(self.canvas['height'])
+
+        cell = self.cell_size
+        columns = min(self.board.size, math.ceil(width / cell))
+        rows = min(self.board.size, math.ceil(height / cell))
+        if (columns, rows, cell) == self._layout:
+            return
+
+        self.canvas.delete('cell')
+        font = (GAME_CONFIG["VIEWPORT"]["font"], max(6, cell // 3), 'bold')
+        self._slots = []
+        for i in range(rows):
+            for j in range(columns):
+                left, top = j * cell, i * cell
+                rectangle = self.canvas.create_rectangle(
+                    left, top, left + cell, top + cell,
+                    outline=COLORS['bg'], tags='cell'
+                )
+                symbol = self.canvas.create_text(
+                    left + cell // 2, top + cell // 2, font=font, tags='cell'
+                )
+                self._slots.append((rectangle, symbol))
+        self._slot_styles = [None] * len(self._slots)
+        self._columns, self._rows = columns, rows
+        self._layout = (columns, rows, cell)
+        self.scroll_to(self.origin_x, self.origin_y)
+        self.refresh()
+
+    def _scroll(self, axis: str, action: str, amount: str, unit: Optional[str] = None):
+        """Applique une commande de barre de défilement Tk ('moveto' ou 'scroll')."""
+        visible = self._columns if axis == 'x' else self._rows
+        current = self.origin_x if axis == 'x' else self.origin_y
+        if action == 'moveto':
+            target = round(float(amount) * self.board.size)
+        else:
+            target = current + int(amount) * (visible if unit == 'pages' else 1)
+        if axis == 'x':
+            self.scroll_to(target, self.origin_y)
+        else:
+            self.scroll_to(self.origin_x, target)
+
+    def _scroll_x(self, *args):
+        self._scroll('x', *args)
+
+    def _scroll_y(self, *args):
+        self._scroll('y', *args)
+
+    def _handle_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell and self.enabled and self.on_click:
+            self.on_click(*cell)
+
+    def _handle_right_click(self, event):
+        if self.enabled and self.on_right_click:
+            self.on_right_click()
+
+    def _handle_motion(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell == self._hovered:
+            return
+        self._hovered = cell
+        if self.on_leave:
+            self.on_leave()
+        if cell and self.enabled and self.on_hover:
+            self.on_hover(*cell)
+
+    def _handle_leave(self, event):
+        self._hovered = None
+        if self.on_leave:
+            self.on_leave()
+
+    def _handle_wheel(self, event, direction: Optional[int] = None):
+        """Molette : défilement vertical, Maj pour horizontal, Ctrl pour le zoom."""
+        if direction is None:
+            direction = -1 if event.delta > 0 else 1
+        if event.state & 0x0004:  # Ctrl
+            self.zoom(-direction, (event.x, event.y))
+        elif event.state & 0x0001:  # Maj
+            self.scroll_to(self.origin_x + direction * 3, self.origin_y)
+        else:
+            self.scroll_to(self.origin_x, self.origin_y + direction * 3)
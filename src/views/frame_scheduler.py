@@ -0,0 +1,167 @@
+"""Planificateur d'affichage : un seul rafraîchissement Tk par image."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import heapq
+import itertools
+import time
+
+
+def blend_colors(start: str, end: str, progress: float) -> str:
+    """Interpole deux couleurs '#RRGGBB'.
+
+    Args:
+        start (str): Couleur de départ.
+        end (str): Couleur d'arrivée.
+        progress (float): Avancement entre 0 et 1.
+
+    Returns:
+        str: Couleur intermédiaire.
+    """
+    channels = []
+    for offset in (1, 3, 5):
+        a = int(start[offset:offset + 2], 16)
+        b = int(end[offset:offset + 2], 16)
+        channels.append(round(a + (b - a) * progress))
+    return '#{:02X}{:02X}{:02X}'.format(*channels)
+
+
+class _Animation:
+    """Animation pilotée par le temps écoulé."""
+
+    __slots__ = ('started', 'duration', 'step', 'on_done')
+
+    def __init__(self, started: float, duration: float, step: Callable[[float], None],
+                 on_done: Optional[Callable[[], None]]):
+        self.started = started
+        self.duration = duration
+        self.step = step
+        self.on_done = on_done
+
+
+class FrameScheduler:
+    """Regroupe les mises à jour de l'interface en un passage par image.
+
+    Les modifications de widgets sont fusionnées par widget et appliquées
+    ensemble au prochain tick ; les animations avancent selon le temps écoulé
+    et non selon un minuteur par animation ; les actions différées sont
+    déclenchées par le même tick, tout comme le dessin des vues qui l'ont
+    demandé (`request_render`). Une seule entrée `after` est donc présente dans
+    la file d'événements de Tk, et aucune lorsqu'il n'y a rien à faire.
+    """
+
+    def __init__(self, window, fps: int = 60):
+        """Initialise le planificateur.
+
+        Args:
+            window: Fenêtre Tk principale.
+            fps (int): Nombre maximal d'images par seconde.
+        """
+        self.window = window
+        self.frame_ms = max(1, 1000 // fps)
+        self._pending: Dict[Any, Dict[str, Any]] = {}
+        self._animations: Dict[Any, _Animation] = {}
+        self._timers: List[Tuple[float, int, Callable[[], None]]] = []
+        self._renderers: Dict[Any, None] = {}
+        self._sequence = itertools.count()
+        self._frame_id: Optional[str] = None
+        self._frame_due = 0.0
+
+    def configure(self, widget, **options):
+        """Programme la modification d'un widget pour la prochaine image.
+
+        Args:
+            widget: Widget Tk à modifier.
+            **options: Options Tk à appliquer (text, state...).
+        """
+        self._pending.setdefault(widget, {}).update(options)
+        self._request_frame()
+
+    def request_render(self, renderer):
+        """Demande qu'une vue soit redessinée à la prochaine image.
+
+        Plusieurs demandes pour la même vue avant le tick n'entraînent qu'un dessin.
+
+        Args:
+            renderer: Objet exposant une méthode `render()`.
+        """
+        self._renderers[renderer] = None
+        self._request_frame()
+
+    def animate(self, key: Any, duration_ms: int, step: Callable[[float], None],
+                on_done: Optional[Callable[[], None]] = None):
+        """Démarre une animation, qui remplace toute animation de même clé.
+
+        Args:
+            key (Any): Identifiant de l'animation.
+            duration_ms (int): Durée en millisecondes.
+            step (Callable[[float], None]): Appelée à chaque image avec l'avancement (0 à 1).
+            on_done (Optional[Callable]): Appelée une fois l'animation terminée.
+        """
+        self._animations[key] = _Animation(time.monotonic(), duration_ms / 1000, step, on_done)
+        step(0.0)
+        self._request_frame()
+
+    def call_later(self, delay_ms: int, callback: Callable[[], None]):
+        """Exécute une action lors de la première image suivant un délai.
+
+        Args:
+            delay_ms (int): Délai en millisecondes.
+            callback (Callable[[], None]): Action à exécuter.
+        """
+        due = time.monotonic() + delay_ms / 1000
+        heapq.heappush(self._timers, (due, next(self._sequence), callback))
+        self._request_frame(delay_ms)
+
+    def cancel_all(self):
+        """Abandonne les actions différées et les animations en cours."""
+        self._timers.clear()
+        self._animations.clear()
+
+    def _request_frame(self, delay_ms: Optional[int] = None):
+        """Programme le prochain tick, sauf si un tick plus proche l'est déjà.
+
+        Args:
+            delay_ms (Optional[int]): Délai avant le tick (une image par défaut).
+        """
+        delay_ms = max(self.frame_ms, self.frame_ms if delay_ms is None else delay_ms)
+        due = time.monotonic() + delay_ms / 1000
+        if self._frame_id is not None:
+            if self._frame_due <= due:
+                return
+            self.window.after_cancel(self._frame_id)
+        self._frame_due = due
+        self._frame_id = self.window.after(delay_ms, self._tick)
+
+    def _tick(self):
+        """Traite actions dues, animations et modifications en un seul passage."""
+        self._frame_id = None
+        now = time.monotonic()
+
+        while self._timers and self._timers[0][0] <= now:
+            _, _, callback = heapq.heappop(self._timers)
+            callback()
+
+        finished = []
+        for key, animation in list(self._animations.items()):
+            progress = min(1.0, (now - animation.started) / animation.duration) if animation.duration else 1.0
+            animation.step(progress)
+            if progress >= 1.0:
+                finished.append((key, animation))
+        for key, animation in finished:
+            if self._animations.get(key) is animation:
+                del self._animations[key]
+            if animation.on_done:
+                animation.on_done()
+
+        pending, self._pending = self._pending, {}
+        for widget, options in pending.items():
+            widget.config(**options)
+
+        renderers, self._renderers = self._renderers, {}
+        for renderer in renderers:
+            renderer.render()
+
+        if self._animations or self._pending or self._renderers:
+            self._request_frame()
+        elif self._timers:
+            self._request_frame(int((self._timers[0][0] - time.monotonic()) * 1000))
@@ -1,11 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from ..controllers.game_controller import GameController
+from src.ai import load_difficulties
 from src.models.ship import Ship
+from src.services.broadcast import SpectatorBroadcaster
 from ..utils.config import GAME_CONFIG
+from .board_viewport import BoardViewport, Style
+from .frame_scheduler import FrameScheduler, blend_colors
 import logging
-from ..utils.constants import COLORS, MESSAGES, SHIP_COLORS, SHIP_SYMBOL, WATER_SYMBOL, HIT_SYMBOL, MISS_SYMBOL
+from ..utils.constants import (CELL_STATES, COLORS, MESSAGES, SHIP_COLORS, SHIP_SYMBOL, WATER_SYMBOL, HIT_SYMBOL,
+                               MISS_SYMBOL, SHOT_RESULTS)
 import pygame
 import os
 
@@ -37,18 +42,41 @@ class GameView:
             GAME_CONFIG["WINDOW"]["min_height"]
         )
         self.window.configure(bg=COLORS['bg'])
+        self.scheduler = FrameScheduler(self.window)
 
         self.difficulty = tk.StringVar(value="normal")
-        self.game = GameController(difficulty=self.difficulty.get())
-        self.buttons_player = []
-        self.buttons_computer = []
+        self.game_mode = tk.StringVar(value="classic")
+        self.no_touch = tk.BooleanVar(value=GAME_CONFIG["RULES"]["no_touch"])
+        self.game = self.create_controller()
+        self.player_view: Optional[BoardViewport] = None
+        self.computer_view: Optional[BoardViewport] = None
         self.current_ship = None
         self.is_horizontal = tk.BooleanVar(value=True)
         self.ships_to_place = []
+        self.placed_ships: List[Ship] = []  # Navires placés, dans l'ordre, pour l'annulation
+        self.salvo_targets: List[Tuple[int, int]] = []
+        self.games_played = 0
+
+        # Diffusion optionnelle de la partie aux spectateurs
+        self.broadcaster: Optional[SpectatorBroadcaster] = None
+        if GAME_CONFIG["BROADCAST"]["enabled"]:
+            settings = GAME_CONFIG["BROADCAST"]
+            self.broadcaster = SpectatorBroadcaster(
+                settings["host"], settings["port"], settings["buffer_size"], settings["overflow"]
+            )
+            self.broadcaster.start()
 
         self.setup_gui()
         self.new_game()
 
+    def create_controller(self) -> GameController:
+        """Crée un contrôleur de jeu avec les options choisies dans l'interface."""
+        return GameController(
+            difficulty=self.difficulty.get(),
+            mode=self.game_mode.get(),
+            no_touch=self.no_touch.get()
+        )
+
     def setup_gui(self):
         """Configure l'interface graphique."""
         logging.info("Configuration de l'interface graphique...")
@@ -112,6 +140,46 @@ class GameView:
             value="normal"
         ).pack(side=tk.LEFT, padx=5)
 
+        ttk.Radiobutton(
+            difficulty_frame,
+            text="Difficile",
+            variable=self.difficulty,
+            value="hard"
+        ).pack(side=tk.LEFT, padx=5)
+
+        # Difficultés réglées par parties simulées (python -m src.controllers.tuning)
+        for name in load_difficulties():
+            ttk.Radiobutton(
+                difficulty_frame,
+                text=name,
+                variable=self.difficulty,
+                value=name
+            ).pack(side=tk.LEFT, padx=5)
+
+        # Contrôle du mode de jeu
+        mode_frame = ttk.LabelFrame(left_panel, text="Mode", padding=5)
+        mode_frame.pack(side=tk.LEFT, padx=10)
+
+        ttk.Radiobutton(
+            mode_frame,
+            text="Classique",
+            variable=self.game_mode,
+            value="classic"
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Radiobutton(
+            mode_frame,
+            text="Salve",
+            variable=self.game_mode,
+            value="salvo"
+        ).pack(side=tk.LEFT, padx=5)
+
+        ttk.Checkbutton(
+            mode_frame,
+            text="Navires non contigus",
+            variable=self.no_touch
+        ).pack(side=tk.LEFT, padx=5)
+
         # Panneau de contrôle droite (orientation)
         right_panel = ttk.Frame(control_frame)
         right_panel.pack(side=tk.RIGHT, padx=20)
@@ -123,43 +191,37 @@ class GameView:
             variable=self.is_horizontal
         ).pack(side=tk.LEFT)
 
+        # Annulation des placements (aussi Ctrl+Z / Ctrl+Y)
+        ttk.Button(right_panel, text="Annuler", command=self.undo_placement).pack(side=tk.LEFT, padx=5)
+        ttk.Button(right_panel, text="Rétablir", command=self.redo_placement).pack(side=tk.LEFT)
+        self.window.bind('<Control-z>', lambda event: self.undo_placement())
+        self.window.bind('<Control-y>', lambda event: self.redo_placement())
+
     def show_preview(self, x: int, y: int):
         """Affiche la prévisualisation du placement d'un navire."""
         if not self.current_ship:
             return
 
-        self.clear_preview()
         ship = self.current_ship
         horizontal = self.is_horizontal.get()
+        board = self.game.player.board
 
-        try:
-            # Vérifie si le placement est possible
-            can_place = self.game.can_place_ship(ship, x, y, horizontal)
-            color = COLORS['preview_ok'] if can_place else COLORS['preview_bad']
-            
-            # Affiche la prévisualisation
-            for i in range(ship.size):
-                if horizontal:
-                    if x + i < GAME_CONFIG["BOARD_SIZE"]:
-                        button = self.buttons_player[y][x + i]
-                        if button['bg'] != COLORS['ship']:
-                            button.config(bg=color)
-                else:
-                    if y + i < GAME_CONFIG["BOARD_SIZE"]:
-                        button = self.buttons_player[y + i][x]
-                        if button['bg'] != COLORS['ship']:
-                            button.config(bg=color)
-        except IndexError:
-            pass
+        # Vérifie si le placement est possible
+        can_place = self.game.can_place_ship(ship, x, y, horizontal)
+        color = COLORS['preview_ok'] if can_place else COLORS['preview_bad']
+
+        # Affiche la prévisualisation sur les cases libres
+        preview = {}
+        for i in range(ship.size):
+            cell = (x + i, y) if horizontal else (x, y + i)
+            if board.is_valid_position(*cell) and board.get_ship_at(*cell) is None:
+                preview[cell] = (color, None)
+        self.player_view.set_layer('preview', preview)
 
     def clear_preview(self):
         """Efface la prévisualisation."""
-        for i in range(GAME_CONFIG["BOARD_SIZE"]):
-            for j in range(GAME_CONFIG["BOARD_SIZE"]):
-                button = self.buttons_player[i][j]
-                if button['bg'] in [COLORS['preview_ok'], COLORS['preview_bad']]:
-                    button.config(bg=COLORS['button'])
-                    
+        self.player_view.set_layer('preview', {})
+
     def toggle_orientation(self):
         """Change l'orientation du navire à placer."""
         self.is_horizontal.set(not self.is_horizontal.get())
@@ -174,50 +236,93 @@ class GameView:
             x, y,
             self.is_horizontal.get()
         ):
+            self.placed_ships.append(self.current_ship)
             self.update_ship_display(x, y)
             self.prepare_next_ship()
 
-    def update_ship_display(self, x: int, y: int):
-        """Met à jour l'affichage après le placement d'un navire."""
-        ship = self.current_ship
-        horizontal = self.is_horizontal.get()
-        ship_color = SHIP_COLORS.get(ship.name, COLORS['ship'])  # Couleur spécifique du navire
-
-        for i in range(ship.size):
-            if horizontal:
-                if x + i < GAME_CONFIG["BOARD_SIZE"]:
-                    self.buttons_player[y][x + i].config(
-                        bg=ship_color, 
-                        text=SHIP_SYMBOL  # Symbole du navire
-                    )
-            else:
-                if y + i < GAME_CONFIG["BOARD_SIZE"]:
-                    self.buttons_player[y + i][x].config(
-                        bg=ship_color, 
-                        text=SHIP_SYMBOL  # Symbole du navire
-                    )
+    def undo_placement(self):
+        """Annule le dernier navire placé, qui redevient le navire à placer."""
+        if not self.current_ship or self.game.undo_placement() is None:
+            return
+        self.ships_to_place.insert(0, self.current_ship)
+        self.current_ship = self.placed_ships.pop()
+        self.announce_current_ship()
+        self.clear_preview()
+        self.player_view.refresh()
 
+    def redo_placement(self):
+        """Rétablit le dernier placement annulé."""
+        if not self.current_ship or self.game.redo_placement() is None:
+            return
+        self.placed_ships.append(self.current_ship)
+        self.clear_preview()
+        self.player_view.refresh()
+        self.prepare_next_ship()
 
+    def update_ship_display(self, x: int, y: int):
+        """Met à jour l'affichage après le placement d'un navire."""
+        self.clear_preview()
+        self.player_view.refresh()
+
+    def player_cell_style(self, x: int, y: int, state: int) -> Style:
+        """Style d'une case du plateau du joueur : ses navires sont visibles."""
+        if state == CELL_STATES['EMPTY']:
+            return COLORS['button'], WATER_SYMBOL
+        if state == CELL_STATES['MISS']:
+            return COLORS['miss'], WATER_SYMBOL
+        if state == CELL_STATES['SHIP']:
+            ship = self.game.player.board.get_ship_at(x, y)
+            return SHIP_COLORS.get(ship.name, COLORS['ship']), SHIP_SYMBOL  # Couleur spécifique du navire
+        return COLORS['hit'], SHIP_SYMBOL
+
+    @staticmethod
+    def computer_cell_style(x: int, y: int, state: int) -> Style:
+        """Style d'une case du plateau ennemi : seuls les tirs sont révélés."""
+        if state == CELL_STATES['MISS']:
+            return COLORS['miss'], MISS_SYMBOL
+        if state in (CELL_STATES['HIT'], CELL_STATES['SUNK']):
+            return COLORS['hit'], HIT_SYMBOL
+        return COLORS['button'], WATER_SYMBOL
+
+    def show_shot(self, view: BoardViewport, x: int, y: int):
+        """Affiche le résultat d'un tir avec un flash qui s'estompe vers sa couleur."""
+        final = view.style_at(x, y)[0]
+
+        def step(progress: float):
+            view.set_overlay('flash', x, y, blend_colors(COLORS['flash'], final, progress))
+
+        self.scheduler.animate(
+            (view, x, y), GAME_CONFIG["DELAYS"]["shot_animation"], step,
+            on_done=lambda: view.clear_overlay('flash', x, y)
+        )
 
     def prepare_next_ship(self):
         """Prépare le placement du prochain navire."""
         if self.ships_to_place:
             self.current_ship = self.ships_to_place.pop(0)
-            self.status_label.config(
-                text=MESSAGES['place_ship'].format(
-                    self.current_ship.name,
-                    self.current_ship.size
-                )
-            )
+            self.announce_current_ship()
         else:
             self.current_ship = None
             self.start_game()
 
+    def announce_current_ship(self):
+        """Indique dans la barre d'état le navire à placer."""
+        self.scheduler.configure(
+            self.status_label,
+            text=MESSAGES['place_ship'].format(
+                self.current_ship.name,
+                self.current_ship.size
+            )
+        )
+
     def player_shoot(self, x: int, y: int):
         """Gère un tir du joueur."""
+        if self.game.mode == "salvo":
+            self.select_salvo_target(x, y)
+            return
+
         try:
             already_shot, hit, ship = self.game.handle_player_shot(x, y)
-            button = self.buttons_computer[y][x]
 
             # Joue le son de tir
             SOUNDS['shoot'].play()
@@ -227,45 +332,115 @@ class GameView:
                 return
 
             if hit:
-                button.config(bg=COLORS['hit'], text=HIT_SYMBOL)  # Tir réussi
+                self.show_shot(self.computer_view, x, y)  # Tir réussi
                 SOUNDS['hit'].play()  # Joue le son de tir réussi
                 if ship and ship.is_sunk():
                     SOUNDS['sunk'].play()  # Joue le son de navire coulé
                     messagebox.showinfo("Touché-Coulé!", f"Vous avez coulé le {ship.name}!")
             else:
-                button.config(bg=COLORS['miss'], text=MISS_SYMBOL)  # Tir manqué
+                self.show_shot(self.computer_view, x, y)  # Tir manqué
 
             if self.check_game_over():
                 return
 
-            self.status_label.config(text="Tour de l'ordinateur...")
-            self.window.after(1000, self.computer_turn)
+            self.scheduler.configure(self.status_label, text="Tour de l'ordinateur...")
+            self.scheduler.call_later(GAME_CONFIG["DELAYS"]["computer_turn"], self.computer_turn)
 
         except Exception as e:
             logging.error(f"Erreur lors du tir du joueur : {e}", exc_info=True)
 
 
 
+    def select_salvo_target(self, x: int, y: int):
+        """Ajoute ou retire une cible de la salve en préparation."""
+        if (x, y) in self.game.player.shots:
+            messagebox.showinfo("Erreur", MESSAGES['error']['already_shot'])
+            return
+
+        if (x, y) in self.salvo_targets:
+            self.salvo_targets.remove((x, y))
+            self.computer_view.clear_overlay('target', x, y)
+        else:
+            self.salvo_targets.append((x, y))
+            self.computer_view.set_overlay('target', x, y, COLORS['target'])
+
+        remaining = self.game.shots_per_turn(self.game.player) - len(self.salvo_targets)
+        if remaining > 0:
+            self.scheduler.configure(self.status_label, text=MESSAGES['salvo_turn'].format(remaining))
+        else:
+            self.player_salvo()
+
+    def player_salvo(self):
+        """Tire la salve du joueur une fois toutes les cibles choisies."""
+        try:
+            targets, self.salvo_targets = self.salvo_targets, []
+            results, sunk_ships = self.game.handle_player_salvo(targets)
+
+            SOUNDS['shoot'].play()
+            self.computer_view.set_layer('target', {})
+            for (x, y), result in zip(targets, results):
+                if result != SHOT_RESULTS['ALREADY_SHOT']:
+                    self.show_shot(self.computer_view, x, y)
+
+            if SHOT_RESULTS['HIT'] in results or sunk_ships:
+                SOUNDS['hit'].play()
+            for ship in sunk_ships:
+                SOUNDS['sunk'].play()
+                messagebox.showinfo("Touché-Coulé!", f"Vous avez coulé le {ship.name}!")
+
+            if self.check_game_over():
+                return
+
+            self.scheduler.configure(self.status_label, text="Tour de l'ordinateur...")
+            self.scheduler.call_later(GAME_CONFIG["DELAYS"]["computer_turn"], self.computer_turn)
+
+        except Exception as e:
+            logging.error(f"Erreur lors de la salve du joueur : {e}", exc_info=True)
+
+    def computer_salvo(self):
+        """Gère la salve de l'ordinateur."""
+        coordinates, results, sunk_ships = self.game.handle_computer_salvo()
+
+        SOUNDS['shoot'].play()
+        for (x, y), result in zip(coordinates, results):
+            if result != SHOT_RESULTS['ALREADY_SHOT']:
+                self.show_shot(self.player_view, x, y)
+
+        if SHOT_RESULTS['HIT'] in results or sunk_ships:
+            SOUNDS['hit'].play()
+        for ship in sunk_ships:
+            SOUNDS['sunk'].play()
+            messagebox.showinfo("Navire coulé", MESSAGES['sunk'].format(ship.name))
+
+        if not self.check_game_over():
+            self.scheduler.configure(
+                self.status_label,
+                text=MESSAGES['salvo_turn'].format(self.game.shots_per_turn(self.game.player))
+            )
+
     def computer_turn(self):
         """Gère le tour de l'ordinateur."""
         try:
+            if self.game.mode == "salvo":
+                self.computer_salvo()
+                return
+
             x, y, _, hit, ship = self.game.handle_computer_shot()
-            button = self.buttons_player[y][x]
 
             # Joue le son de tir
             SOUNDS['shoot'].play()
 
             if hit:
-                button.config(bg=COLORS['hit'])
+                self.show_shot(self.player_view, x, y)
                 SOUNDS['hit'].play()  # Joue le son de tir réussi
                 if ship and ship.is_sunk():
                     SOUNDS['sunk'].play()  # Joue le son de navire coulé
                     messagebox.showinfo("Navire coulé", MESSAGES['sunk'].format(ship.name))
             else:
-                button.config(bg=COLORS['miss'])
+                self.show_shot(self.player_view, x, y)
 
             if not self.check_game_over():
-                self.status_label.config(text=MESSAGES['your_turn'])
+                self.scheduler.configure(self.status_label, text=MESSAGES['your_turn'])
 
         except Exception as e:
             logging.error(f"Erreur lors du tour de l'ordinateur : {e}", exc_info=True)
@@ -291,30 +466,37 @@ class GameView:
 
     def new_game(self):
         """Commence une nouvelle partie."""
-        self.game = GameController(difficulty=self.difficulty.get())
+        self.scheduler.cancel_all()
+        self.game = self.create_controller()
+        self.games_played += 1
+        if self.broadcaster:
+            self.broadcaster.attach(f"partie-{self.games_played}", self.game)
+            self.broadcaster.detach(f"partie-{self.games_played - 1}")
         self.game.initialize_game()
+        self.salvo_targets = []
 
-        for i in range(GAME_CONFIG["BOARD_SIZE"]):
-            for j in range(GAME_CONFIG["BOARD_SIZE"]):
-                self.buttons_player[i][j].config(bg=COLORS['button'], text=WATER_SYMBOL, state='normal')
-                self.buttons_computer[i][j].config(bg=COLORS['button'], text=WATER_SYMBOL, state='disabled')
+        self.player_view.set_board(self.game.player.board)
+        self.computer_view.set_board(self.game.computer.board)
+        self.player_view.enabled = True
+        self.computer_view.enabled = False
 
         self.ships_to_place = self.game.player.initialize_ships()
+        self.placed_ships = []
         self.current_ship = self.ships_to_place.pop(0)
-        self.status_label.config(
-            text=MESSAGES['place_ship'].format(
-                self.current_ship.name,
-                self.current_ship.size
-            )
-        )
+        self.announce_current_ship()
 
 
     def start_game(self):
         """Commence la phase de jeu."""
-        self.status_label.config(text=MESSAGES['your_turn'])
-        for row in self.buttons_computer:
-            for button in row:
-                button.config(state='normal')
+        if self.game.mode == "salvo":
+            self.scheduler.configure(
+                self.status_label,
+                text=MESSAGES['salvo_turn'].format(self.game.shots_per_turn(self.game.player))
+            )
+        else:
+            self.scheduler.configure(self.status_label, text=MESSAGES['your_turn'])
+        self.player_view.enabled = False
+        self.computer_view.enabled = True
 
     def run(self):
         """Lance le jeu."""
@@ -324,9 +506,12 @@ class GameView:
             logging.info("Boucle principale terminée, fermeture de la fenêtre Tkinter.")
         except Exception as e:
             logging.error(f"Erreur dans la boucle principale Tkinter : {e}", exc_info=True)
+        finally:
+            if self.broadcaster:
+                self.broadcaster.stop()
 
     def create_boards(self, parent):
-        """Crée les grilles de jeu avec les vagues initiales."""
+        """Crée les plateaux de jeu, affichés par des vues défilantes."""
         boards_frame = ttk.Frame(parent)
         boards_frame.grid(row=2, column=0, columnspan=2, pady=10)
 
@@ -334,55 +519,20 @@ class GameView:
         player_frame = ttk.LabelFrame(boards_frame, text="Votre flotte", padding=10)
         player_frame.grid(row=0, column=0, padx=20)
 
-        self.buttons_player = []
-        for i in range(GAME_CONFIG["BOARD_SIZE"]):
-            row = []
-            for j in range(GAME_CONFIG["BOARD_SIZE"]):
-                btn = tk.Button(
-                    player_frame,
-                    **GAME_CONFIG["BUTTON_STYLE"],
-                    text=WATER_SYMBOL,  # Ajoute les vagues comme texte initial
-                    bg=COLORS['button']
-                )
-                btn.grid(row=i, column=j, padx=1, pady=1)
-                btn.bind("<Enter>", lambda e, y=i, x=j: self.show_preview(x, y))
-                btn.bind("<Leave>", lambda e: self.clear_preview())
-                btn.bind("<Button-1>", lambda e, y=i, x=j: self.place_ship(x, y))
-                btn.bind("<Button-3>", lambda e: self.toggle_orientation())
-                row.append(btn)
-            self.buttons_player.append(row)
+        self.player_view = BoardViewport(player_frame, self.scheduler, self.game.player.board, self.player_cell_style)
+        self.player_view.grid(row=0, column=0)
+        self.player_view.on_hover = self.show_preview
+        self.player_view.on_leave = self.clear_preview
+        self.player_view.on_click = self.place_ship
+        self.player_view.on_right_click = self.toggle_orientation
 
         # Plateau ordinateur
         computer_frame = ttk.LabelFrame(boards_frame, text="Flotte ennemie", padding=10)
         computer_frame.grid(row=0, column=1, padx=20)
 
-        self.buttons_computer = []
-        for i in range(GAME_CONFIG["BOARD_SIZE"]):
-            row = []
-            for j in range(GAME_CONFIG["BOARD_SIZE"]):
-                btn = tk.Button(
-                    computer_frame,
-                    **GAME_CONFIG["BUTTON_STYLE"],
-                    text=WATER_SYMBOL,  # Ajoute les vagues comme texte initial
-                    bg=COLORS['button'],
-                    state='disabled'
-                )
-                btn.grid(row=i, column=j, padx=1, pady=1)
-                btn.configure(command=lambda y=i, x=j: self.player_shoot(x, y))
-                row.append(btn)
-            self.buttons_computer.append(row)
-
-
-    def show_hover(self, x: int, y: int):
-        """Change la couleur de la case sous la souris."""
-        button = self.buttons_player[y][x]
-        if button['bg'] == COLORS['button']:  # Seulement si la case est vide
-            button.config(bg=COLORS['hover'], text=WATER_SYMBOL)
-    
-    def clear_hover(self):
-        """Réinitialise les couleurs après le hover."""
-        for row in self.buttons_player:
-            for button in row:
-                if button['bg'] == COLORS['hover']:
-                    button.config(bg=COLORS['button'], text="")
-
+        self.computer_view = BoardViewport(
+            computer_frame, self.scheduler, self.game.computer.board, self.computer_cell_style
+        )
+        self.computer_view.grid(row=0, column=0)
+        self.computer_view.on_click = self.player_shoot
+        self.computer_view.enabled = False
@@ -0,0 +1,126 @@
+import itertools
+import random
+import unittest
+
+from src.models import Board, BoardState, Ship
+from src.utils.constants import CELL_STATES, SHOT_RESULTS
+
+
+def brute_force_can_place(board: Board, length: int, x: int, y: int, horizontal: bool) -> bool:
+    """Règle de placement vérifiée case par case sur la grille d'occupation."""
+    size = board.size
+    cells = [(x + i, y) if horizontal else (x, y + i) for i in range(length)]
+    if any(not (0 <= cx < size and 0 <= cy < size) for cx, cy in cells):
+        return False
+    reach = 1 if board.no_touch else 0
+    for cx, cy in cells:
+        for nx in range(cx - reach, cx + reach + 1):
+            for ny in range(cy - reach, cy + reach + 1):
+                if 0 <= nx < size and 0 <= ny < size and board.grid[ny * size + nx]:
+                    return False
+    return True
+
+
+class CanPlaceShipTest(unittest.TestCase):
+
+    def assert_matches_brute_force(self, board: Board):
+        size = board.size
+        for length in range(1, size + 1):
+            ship = Ship("Test", length)
+            for x, y, horizontal in itertools.product(range(-1, size + 1), range(-1, size + 1), (True, False)):
+                self.assertEqual(
+                    board.can_place_ship(ship, x, y, horizontal),
+                    brute_force_can_place(board, length, x, y, horizontal),
+                    (board.no_touch, length, x, y, horizontal, bytes(board.grid))
+                )
+
+    def test_every_single_ship_position(self):
+        size = 5
+        for no_touch in (False, True):
+            for length in (1, 2, 3):
+                for x, y, horizontal in itertools.product(range(size), range(size), (True, False)):
+                    board = Board(size, no_touch=no_touch)
+                    if board.place_ship(Ship("Placé", length), x, y, horizontal):
+                        with self.subTest(no_touch=no_touch, length=length, x=x, y=y, horizontal=horizontal):
+                            self.assert_matches_brute_force(board)
+
+    def test_random_fleets(self):
+        rng = random.Random(0)
+        for no_touch in (False, True):
+            for _ in range(30):
+                board = Board(6, no_touch=no_touch)
+                for length in (3, 2, 2, 1):
+                    placements = board.valid_placements(Ship("Placé", length))
+                    if placements:
+                        board.place_ship(Ship("Placé", length), *rng.choice(placements))
+                self.assert_matches_brute_force(board)
+
+
+class ReceiveShotsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.board = Board(5)
+        self.destroyer = Ship("Destroyer", 2)
+        self.cruiser = Ship("Croiseur", 3)
+        self.board.place_ship(self.destroyer, 0, 0, True)   # (0, 0), (1, 0)
+        self.board.place_ship(self.cruiser, 4, 1, False)    # (4, 1), (4, 2), (4, 3)
+
+    def test_salvo_results(self):
+        coordinates = [(0, 0), (5, 0), (1, 0), (2, 2), (2, 2), (4, 1), (0, 0), (-1, 3)]
+        results = self.board.receive_shots(coordinates)
+        self.assertEqual(list(results), [
+            SHOT_RESULTS['HIT'], SHOT_RESULTS['ALREADY_SHOT'], SHOT_RESULTS['SUNK'],
+            SHOT_RESULTS['MISS'], SHOT_RESULTS['ALREADY_SHOT'], SHOT_RESULTS['HIT'],
+            SHOT_RESULTS['ALREADY_SHOT'], SHOT_RESULTS['ALREADY_SHOT']
+        ])
+        cells = self.board.cells
+        self.assertEqual(cells[0], CELL_STATES['SUNK'])
+        self.assertEqual(cells[1], CELL_STATES['SUNK'])
+        self.assertEqual(cells[2 * 5 + 2], CELL_STATES['MISS'])
+        self.assertEqual(cells[1 * 5 + 4], CELL_STATES['HIT'])
+        self.assertEqual(cells[2 * 5 + 4], CELL_STATES['SHIP'])
+        self.assertEqual(self.board.sunken_ships, [self.destroyer])
+        self.assertEqual(len(self.board.shots), 4)
+
+    def test_repeat_salvo_is_already_shot(self):
+        self.board.receive_shots([(0, 0), (3, 3)])
+        results = self.board.receive_shots([(0, 0), (3, 3)])
+        self.assertEqual(list(results), [SHOT_RESULTS['ALREADY_SHOT']] * 2)
+        self.assertEqual(len(self.board.shots), 2)
+
+    def test_sinking_last_ship_mid_salvo(self):
+        results = self.board.receive_shots([(4, 1), (4, 2), (4, 3), (0, 0), (1, 0), (2, 0)])
+        self.assertEqual(list(results), [
+            SHOT_RESULTS['HIT'], SHOT_RESULTS['HIT'], SHOT_RESULTS['SUNK'],
+            SHOT_RESULTS['HIT'], SHOT_RESULTS['SUNK'], SHOT_RESULTS['MISS']
+        ])
+        self.assertTrue(self.board.all_ships_sunk())
+
+    def test_matches_single_shots_and_board_state(self):
+        rng = random.Random(1)
+        coordinates = [(rng.randrange(-1, 6), rng.randrange(-1, 6)) for _ in range(40)]
+        state = BoardState.from_board(self.board)
+        reference = Board(5)
+        reference.place_ship(Ship("Destroyer", 2), 0, 0, True)
+        reference.place_ship(Ship("Croiseur", 3), 4, 1, False)
+
+        results = self.board.receive_shots(coordinates)
+        state, state_results = state.receive_shots(coordinates)
+        expected = []
+        for x, y in coordinates:
+            already_shot, hit, sunk = reference.receive_shot(x, y)
+            if already_shot:
+                expected.append(SHOT_RESULTS['ALREADY_SHOT'])
+            elif sunk is not None:
+                expected.append(SHOT_RESULTS['SUNK'])
+            else:
+                expected.append(SHOT_RESULTS['HIT'] if hit else SHOT_RESULTS['MISS'])
+
+        self.assertEqual(list(results), expected)
+        self.assertEqual(list(state_results), expected)
+        self.assertEqual(bytes(self.board.cells), bytes(reference.cells))
+        self.assertEqual(state.tobytes(), bytes(reference.cells))
+
+
+if __name__ == '__main__':
+    unittest.main()
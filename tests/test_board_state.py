@@ -0,0 +1,42 @@
+import random
+import unittest
+
+from src.controllers.game_controller import GameController
+from src.models import BoardState
+
+
+class BoardStateRoundTripTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.game = GameController()
+        self.game.initialize_game()
+        board = self.game.player.board
+        for ship in self.game.player.initialize_ships():
+            self.game.place_ship_randomly(board, ship)
+        for _ in range(30):
+            self.game.handle_computer_shot()
+
+    def test_from_board_ignores_unplaced_ships(self):
+        state = BoardState.from_board(self.game.player.board)
+        self.assertEqual(len(state.ships), 6)
+        for number, placement in enumerate(state.ships, start=1):
+            for cell in placement.cells:
+                self.assertEqual(state.grid[cell], number)
+
+    def test_restore_round_trip(self):
+        board = self.game.player.board
+        cells = bytes(board.cells)
+        afloat = sorted(ship.name for ship in board.ships if ship.cells and not ship.is_sunk())
+        state = BoardState.from_board(board)
+
+        board.restore(state)
+
+        self.assertEqual(bytes(board.cells), cells)
+        self.assertEqual(BoardState.from_board(board).tobytes(), state.tobytes())
+        self.assertEqual(sorted(ship.name for ship in board.ships if not ship.is_sunk()), afloat)
+        self.assertEqual(len(board.shots), sum(1 for value in cells if value > 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
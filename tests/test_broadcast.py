@@ -0,0 +1,123 @@
+import json
+import random
+import selectors
+import socket
+import time
+import unittest
+
+from src.controllers.game_controller import GameController
+from src.services.broadcast import SpectatorBroadcaster, _GameMirror, _Subscriber
+
+
+class SpectatorBroadcasterTest(unittest.TestCase):
+
+    def run_burst(self, broadcaster: SpectatorBroadcaster, events: int):
+        random.seed(0)
+        broadcaster.attach('partie', GameController())
+        with socket.create_connection(broadcaster.address, timeout=5) as sock:
+            sock.sendall(b'partie\n')
+            with sock.makefile('r', encoding='utf-8') as stream:
+                self.assertEqual(json.loads(stream.readline())['type'], 'snapshot')
+                # Toute la rafale arrive dans la même relève du thread de diffusion
+                for index in range(events):
+                    broadcaster.publish('partie', {'type': 'shot', 'board': 'player',
+                                                   'x': index % 10, 'y': index // 10 % 10, 'hit': False})
+                messages = []
+                try:
+                    while len(messages) < events:
+                        messages.append(json.loads(stream.readline()))
+                except socket.timeout:
+                    pass
+                return messages
+
+    def test_prompt_reader_receives_whole_burst(self):
+        broadcaster = SpectatorBroadcaster(buffer_size=4, poll_interval=0.05)
+        broadcaster.start()
+        try:
+            messages = self.run_burst(broadcaster, 200)
+            self.assertEqual(len(messages), 200)
+            self.assertTrue(all(message['type'] == 'shot' for message in messages))
+            self.assertEqual(broadcaster.stats()['coalesced'], 0)
+            self.assertEqual(broadcaster.stats()['dropped'], 0)
+        finally:
+            broadcaster.stop()
+
+    def test_stalled_reader_is_coalesced(self):
+        broadcaster = SpectatorBroadcaster(buffer_size=4, poll_interval=0.01)
+        broadcaster.start()
+        try:
+            random.seed(0)
+            broadcaster.attach('partie', GameController())
+            with socket.create_connection(broadcaster.address) as sock:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+                sock.sendall(b'partie\n')
+                time.sleep(0.1)
+                event = {'type': 'shot', 'board': 'player', 'x': 0, 'y': 0, 'hit': False, 'pad': 'x' * 1000}
+                for _ in range(5000):
+                    broadcaster.publish('partie', event)
+                deadline = time.monotonic() + 5
+                while broadcaster.stats()['coalesced'] == 0 and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                self.assertGreater(broadcaster.stats()['coalesced'], 0)
+        finally:
+            broadcaster.stop()
+
+    def test_subscription_to_closed_socket_is_dropped_cleanly(self):
+        class BrokenSocket(socket.socket):
+            def send(self, data, flags=0):
+                raise BrokenPipeError()
+
+        server_side, client_side = socket.socketpair()
+        broken = BrokenSocket(server_side.family, server_side.type, fileno=server_side.detach())
+        broken.setblocking(False)
+        broadcaster = SpectatorBroadcaster(buffer_size=1)
+        broadcaster._selector = selectors.DefaultSelector()
+        snapshot = GameController().snapshot()
+        broadcaster._mirrors = {'a': _GameMirror(snapshot), 'b': _GameMirror(snapshot)}
+        subscriber = _Subscriber(broken)
+        broadcaster._subscribers.append(subscriber)
+        broadcaster._selector.register(broken, selectors.EVENT_READ, subscriber)
+        flush = broadcaster._flush
+        late_flushes = []
+
+        def checked_flush(target):
+            if target not in broadcaster._subscribers:
+                late_flushes.append(target)
+            flush(target)
+
+        broadcaster._flush = checked_flush
+        try:
+            client_side.sendall(b'*\n')
+            broadcaster._read(subscriber)
+            self.assertNotIn(subscriber, broadcaster._subscribers)
+            self.assertEqual(late_flushes, [])
+        finally:
+            client_side.close()
+            broadcaster._selector.close()
+
+    def test_subscriber_error_does_not_stop_broadcast(self):
+        broadcaster = SpectatorBroadcaster(poll_interval=0.01)
+        read = broadcaster._read
+        failures = []
+
+        def failing_read(subscriber):
+            if not failures:
+                failures.append(subscriber)
+                raise RuntimeError("erreur d'un spectateur")
+            read(subscriber)
+
+        broadcaster._read = failing_read
+        broadcaster.start()
+        try:
+            with socket.create_connection(broadcaster.address, timeout=5) as first:
+                first.sendall(b'*\n')
+                time.sleep(0.1)
+                self.assertEqual(len(failures), 1)
+                messages = self.run_burst(broadcaster, 3)
+                self.assertEqual(len(messages), 3)
+        finally:
+            broadcaster.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
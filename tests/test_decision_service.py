@@ -0,0 +1,93 @@
+import gc
+import json
+import os
+import socket
+import tempfile
+import unittest
+import weakref
+
+from src.ai import OpponentKnowledge
+from src.services.decisions import DecisionClient, DecisionServer, DecisionService
+from src.utils.constants import CELL_DIGITS
+
+
+class RecordingService(DecisionService):
+    """Service qui garde une référence faible vers chaque réponse en attente."""
+
+    def __init__(self):
+        super().__init__(window_ms=0.5, seed=0)
+        self.futures = []
+
+    def submit(self, knowledge, count=1):
+        future = super().submit(knowledge, count)
+        self.futures.append(weakref.ref(future))
+        return future
+
+
+class DecisionServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'ia.sock')
+        self.service = RecordingService()
+        self.service.start()
+        self.server = DecisionServer(self.service, self.path)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.service.stop()
+        self.directory.cleanup()
+
+    def test_long_lived_connection_releases_answered_requests(self):
+        client = DecisionClient(self.path)
+        try:
+            knowledge = OpponentKnowledge(10, [5, 4, 3, 3, 2, 2])
+            for _ in range(50):
+                self.assertEqual(len(client.decide(knowledge)), 1)
+            gc.collect()
+            self.assertEqual(len(self.service.futures), 50)
+            # Seule la dernière demande peut encore être référencée par les variables locales
+            alive = sum(reference() is not None for reference in self.service.futures)
+            self.assertLessEqual(alive, 1)
+        finally:
+            client.close()
+
+    def test_pending_answers_are_sent_after_client_stops_writing(self):
+        message = {'size': 10, 'cells': bytes(100).translate(CELL_DIGITS).decode('ascii'),
+                   'remaining': [5, 4, 3, 3, 2, 2]}
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.path)
+            for request_id in range(20):
+                sock.sendall(json.dumps(dict(message, id=request_id)).encode('utf-8') + b'\n')
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile('r', encoding='utf-8') as stream:
+                answers = [json.loads(line) for line in stream]
+        self.assertEqual(sorted(answer['id'] for answer in answers), list(range(20)))
+
+    def test_malformed_request_then_valid_one(self):
+        cells = bytes(100).translate(CELL_DIGITS).decode('ascii')
+        messages = [{'id': index, 'size': 10, 'cells': cells, 'remaining': remaining}
+                    for index, remaining in enumerate((["a"], [0], [-3], [99], [5, 4]))]
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(5)
+            sock.connect(self.path)
+            for message in messages:
+                sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile('r', encoding='utf-8') as stream:
+                answers = {answer['id']: answer for answer in map(json.loads, stream)}
+        for index in range(4):
+            self.assertIn('error', answers[index])
+        self.assertEqual(len(answers[4]['cells']), 1)
+
+    def test_failed_evaluation_keeps_service_running(self):
+        bad = OpponentKnowledge.from_state(10, bytes(100), ["a"])
+        with self.assertRaises(TypeError):
+            self.service.submit(bad).result(timeout=5)
+        good = OpponentKnowledge(10, [5, 4, 3, 3, 2, 2])
+        self.assertEqual(len(self.service.submit(good).result(timeout=5).cells), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from src.ai.layouts import count_layouts
+
+
+def brute_force(size, fleet, no_touch):
+    """Énumère les dispositions (navires de même taille indiscernables) case par case."""
+    def placements(length):
+        shapes = {(1, 0)} if length == 1 else {(1, 0), (0, 1)}
+        for dx, dy in shapes:
+            for y in range(size - dy * (length - 1)):
+                for x in range(size - dx * (length - 1)):
+                    yield frozenset((x + dx * i, y + dy * i) for i in range(length))
+
+    def blocked(cells):
+        if not no_touch:
+            return set(cells)
+        return {(x + dx, y + dy) for x, y in cells for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+
+    layouts = set()
+
+    def place(rank, occupied, forbidden, ships):
+        if rank == len(fleet):
+            layouts.add(frozenset(ships))
+            return
+        for ship in placements(fleet[rank]):
+            if not ship & forbidden:
+                place(rank + 1, occupied | ship, forbidden | blocked(ship), ships + [ship])
+
+    place(0, frozenset(), frozenset(), [])
+    marginals = [0] * (size * size)
+    for layout in layouts:
+        for ship in layout:
+            for x, y in ship:
+                marginals[y * size + x] += 1
+    return len(layouts), marginals
+
+
+class CountLayoutsTest(unittest.TestCase):
+
+    def check(self, size, fleet, no_touch):
+        count = count_layouts(size, fleet, no_touch, cache_dir="")
+        layouts, marginals = brute_force(size, sorted(fleet, reverse=True), no_touch)
+        self.assertEqual(count.layouts, layouts)
+        self.assertEqual(list(count.marginals), marginals)
+
+    def test_matches_brute_force(self):
+        for size, fleet in ((4, (3, 2, 2)), (4, (2, 2, 1)), (5, (3, 2, 2)), (5, (4, 3, 2))):
+            for no_touch in (False, True):
+                with self.subTest(size=size, fleet=fleet, no_touch=no_touch):
+                    self.check(size, fleet, no_touch)
+
+    def test_labelled_layouts(self):
+        count = count_layouts(4, (2, 2), False, cache_dir="")
+        self.assertEqual(count.labelled_layouts, 2 * count.layouts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from src.controllers.simulation import MAX_BOARD_SIZE, simulate_games
+
+
+class SimulateGamesTest(unittest.TestCase):
+
+    def test_salvo_fires_several_shots_per_turn(self):
+        for record in simulate_games(3, "normal", "salvo", seed=1):
+            self.assertLess(record.turns, record.shots)
+
+    def test_classic_fires_one_shot_per_turn(self):
+        for record in simulate_games(3, "normal", "classic", seed=1):
+            self.assertEqual(record.turns, record.shots)
+
+    def test_large_board_records_long_sinks(self):
+        record = next(simulate_games(1, "easy", seed=0, board_size=300))
+        self.assertGreater(max(record.sink_shots), 0xFFFF)
+
+    def test_rejects_board_too_large_to_record(self):
+        with self.assertRaises(ValueError):
+            next(simulate_games(1, board_size=MAX_BOARD_SIZE + 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
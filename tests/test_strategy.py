@@ -0,0 +1,32 @@
+import unittest
+
+from src.ai import TargetingParams
+from src.controllers.simulation import simulate_games
+
+# Partie de référence (graine 2024, mode normal, plateau 10x10) : premiers tirs, en y * 10 + x
+RECORDED_SHOTS = [35, 51, 95, 32, 58, 68, 59, 48, 57, 38, 74, 37, 47, 27, 36,
+                  7, 66, 16, 5, 76, 81, 3, 87, 42, 33, 85, 53, 17, 24, 44]
+RECORDED_TOTAL = 99
+
+
+class DefaultTargetingTest(unittest.TestCase):
+
+    def play(self, targeting):
+        record = next(simulate_games(1, "normal", seed=2024, board_size=10, targeting=targeting))
+        return [y * 10 + x for x, y in zip(record.x, record.y)]
+
+    def test_default_params_replay_recorded_game(self):
+        shots = self.play(TargetingParams())
+        self.assertEqual(shots[:len(RECORDED_SHOTS)], RECORDED_SHOTS)
+        self.assertEqual(len(shots), RECORDED_TOTAL)
+
+    def test_default_params_match_untuned_normal_mode(self):
+        self.assertEqual(self.play(TargetingParams()), self.play(None))
+
+    def test_round_trip(self):
+        params = TargetingParams(parity=True, heat_hunt=0.4, follow_line=False)
+        self.assertEqual(TargetingParams.from_dict(params.to_dict()), params)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import os
+import tempfile
+import unittest
+
+from src.controllers.tuning import Tuner
+
+
+class TunerPopulationTest(unittest.TestCase):
+
+    def test_population_larger_than_parameter_space_terminates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            tuner = Tuner(os.path.join(directory, 'tuning.json'), population=2000)
+            with self.assertLogs(level='WARNING'):
+                population = tuner._next_population()
+        self.assertLess(len(population), 2000)
+        self.assertEqual(len({candidate.params for candidate in population}), len(population))
+
+    def test_small_population_is_filled(self):
+        with tempfile.TemporaryDirectory() as directory:
+            tuner = Tuner(os.path.join(directory, 'tuning.json'), population=12)
+            self.assertEqual(len(tuner._next_population()), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()